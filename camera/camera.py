@@ -1,22 +1,28 @@
 import cv2
 import time
 import numpy as np
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Tuple, Union
 from .config_manager import CameraConfig
 from .camera_manager import CameraManager
 from .pose_processor import PoseProcessor
+from .landmarks import result_to_array, tracked_positions, uncrop_player_data
+from .pose_history import PoseHistory
+from .pose_recording import PoseRecorder
+from .pose_slots import PoseSlotTracker
+from .video_recorder import VideoRecorder
 import threading
 from queue import Queue
+from util.latency import LatencyTracker
 
 class Camera:
     """Integrates camera capture and pose detection with multithreading."""
-    def __init__(self, config: CameraConfig = CameraConfig(), camera_index: Optional[int] = None,
+    def __init__(self, config: CameraConfig = CameraConfig(), camera_index: Optional[Union[int, str]] = None,
                  progress_callback: Optional[Callable] = None):
         """Initialize camera and pose landmarker.
 
         Args:
             config: Configuration for camera and pose detection.
-            camera_index: Camera index, auto-select if None.
+            camera_index: Camera index or video file path, auto-select if None.
             progress_callback: Optional callback for progress updates.
         """
         self.config = config
@@ -24,8 +30,18 @@ class Camera:
         self.pose_processor = PoseProcessor(config, progress_callback)
         self.progress_callback = progress_callback
         self.running = False
-        self.processed_data = None
+        self.processed_data = (None, None)
         self.processed_data_lock = threading.Lock()
+        self.latest_timing = None
+        self.frame_seq = 0
+        self.latest_frame = (0, None)  # (seq, uncropped BGR frame) of the newest capture
+        self.recorder = None  # PoseRecorder while start_recording() is active
+        self.video_recorder = None  # VideoRecorder while start_video_recording() is active
+        self.latency = LatencyTracker()
+        # Recent landmark arrays by capture time (coordinates relative to the search-margin crop),
+        # each person kept in the same pose slot
+        self.pose_history = PoseHistory(max(2, int(config.pose_history_seconds * config.fps)))
+        self.pose_slots = PoseSlotTracker()
         self.frame_queue = Queue(maxsize=1)  # Limit queue size to avoid memory issues
         self.result_queue = Queue(maxsize=1)
         self.thread = None
@@ -38,6 +54,41 @@ class Camera:
         self.thread = threading.Thread(target=self._process_frames, daemon=True)
         self.thread.start()
 
+    def start_recording(self, path: str) -> None:
+        """Record pose results to a binary file without blocking frame processing.
+
+        Args:
+            path: Output file path; an existing recording is appended to.
+        """
+        self.stop_recording()
+        recorder = PoseRecorder(path, self.camera_manager.camera_width, self.camera_manager.camera_height,
+                                self.config.search_margin_x, self.config.search_margin_y)
+        recorder.start()
+        self.recorder = recorder
+
+    def stop_recording(self) -> None:
+        """Stop pose recording and flush buffered results."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.stop()
+
+    def start_video_recording(self, directory: str, **kwargs) -> None:
+        """Save raw camera frames to rotating video segments without blocking capture.
+
+        Args:
+            directory: Output directory for the video segments.
+            **kwargs: Extra VideoRecorder options (codec, max_segment_bytes, ...).
+        """
+        self.stop_video_recording()
+        recorder = VideoRecorder(directory, fps=self.config.fps, **kwargs)
+        recorder.start()
+        self.video_recorder = recorder
+
+    def stop_video_recording(self) -> Optional[Dict[str, float]]:
+        """Stop video recording and return its statistics."""
+        recorder, self.video_recorder = self.video_recorder, None
+        return recorder.stop() if recorder is not None else None
+
     def _process_frames(self):
         """Process frames in a separate thread."""
         while self.running:
@@ -50,16 +101,21 @@ class Camera:
                 continue
 
             frame = self.camera_manager.get_frame()
+            capture_time = time.time()
             if frame is None:
                 print("Error: Failed to capture frame")
                 time.sleep(0.01)
                 continue
 
+            if self.video_recorder is not None:
+                self.video_recorder.submit(frame)
+
             if frame.shape[0] == 0 or frame.shape[1] == 0:
                 print("Error: Invalid frame dimensions")
                 time.sleep(0.01)
                 continue
 
+            raw_frame = frame
             # Apply search margin if specified
             if self.config.search_margin_x > 0 or self.config.search_margin_y > 0:
                 height, width = frame.shape[:2]
@@ -71,14 +127,25 @@ class Camera:
                     time.sleep(0.01)
                     continue
 
-            timestamp_ms = int(time.time() * 1000)
+            self.frame_seq += 1
+            with self.processed_data_lock:
+                self.latest_frame = (self.frame_seq, raw_frame)
+            timing = {'seq': self.frame_seq, 'capture': capture_time}
+            timing['inference_start'] = time.time()
+            timestamp_ms = int(timing['inference_start'] * 1000)
             result = self.pose_processor.process_frame(frame, timestamp_ms)
+            timing['inference_end'] = time.time()
+            self.latency.record_span('capture_wait', timing, 'capture', 'inference_start')
+            self.latency.record_span('inference', timing, 'inference_start', 'inference_end')
+            self.pose_history.append(capture_time, self.pose_slots.assign(result_to_array(result)))
+            if self.recorder is not None:
+                self.recorder.submit(capture_time, result)
 
             # Store result in queue
             try:
                 if not self.result_queue.empty():
                     self.result_queue.get_nowait()  # Clear old result
-                self.result_queue.put((frame, result))
+                self.result_queue.put((frame, result, timing))
             except Exception as e:
                 print(f"Error queuing result: {e}")
                 continue
@@ -87,9 +154,10 @@ class Camera:
         """Retrieve the latest processed frame and result."""
         try:
             if not self.result_queue.empty():
-                frame, result = self.result_queue.get_nowait()
+                frame, result, timing = self.result_queue.get_nowait()
                 with self.processed_data_lock:
                     self.processed_data = (frame, result)
+                    self.latest_timing = timing
             return self.processed_data
         except Exception as e:
             print(f"Error retrieving processed data: {e}")
@@ -102,15 +170,7 @@ class Camera:
             List of [x, y] coordinates for tracked landmarks.
         """
         frame, result = self._capture_and_process_frame()
-        if not result or not result.pose_landmarks:
-            return []
-
-        positions = []
-        for pose_landmarks in result.pose_landmarks:
-            for idx, landmark in enumerate(pose_landmarks):
-                if idx in self.config.landmarks_to_track:
-                    positions.append([landmark.x, landmark.y])
-        return positions
+        return tracked_positions(result, self.config.landmarks_to_track)
 
     def get_full_pose_data(self) -> List[Dict[str, Any]]:
         """Get full pose data for all detected persons.
@@ -132,28 +192,42 @@ class Camera:
         players_data = []
         for pose_landmarks in result.pose_landmarks:
             player_data = self.pose_processor.process_pose_landmarks(pose_landmarks)
-            if margin_x > 0 or margin_y > 0:
-                for section in ['head', 'hands', 'feet', 'body']:
-                    if section == 'hands' or section == 'feet':
-                        for item in player_data[section]:
-                            item['x'] = (item['x'] * width + margin_x) / original_width
-                            item['y'] = (item['y'] * height + margin_y) / original_height
-                    else:
-                        for idx, data in player_data[section].items():
-                            data['x'] = (data['x'] * width + margin_x) / original_width
-                            data['y'] = (data['y'] * height + margin_y) / original_height
-            players_data.append(player_data)
+            players_data.append(uncrop_player_data(player_data, margin_x, margin_y, width, height,
+                                                   original_width, original_height))
         return players_data
 
+    def get_latest_timing(self) -> Optional[Dict[str, float]]:
+        """Get pipeline timestamps of the most recently retrieved pose result.
+
+        Returns:
+            Dictionary with 'seq', 'capture', 'inference_start' and 'inference_end'
+            (seconds since epoch), or None if no result has been retrieved yet.
+        """
+        with self.processed_data_lock:
+            return dict(self.latest_timing) if self.latest_timing else None
+
     def get_frame(self) -> Optional[np.ndarray]:
         """Get the raw camera frame."""
         return self.camera_manager.get_frame()
 
+    def get_latest_frame(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Get the newest frame captured by the processing thread without reading the camera again.
+
+        Returns:
+            (seq, frame) where seq matches the 'seq' of get_latest_timing() for the same capture,
+            so callers can skip work when it has not changed. The frame is uncropped BGR and
+            must not be modified; it is None (seq 0) before the first capture.
+        """
+        with self.processed_data_lock:
+            return self.latest_frame
+
     def release(self) -> None:
         """Release all resources."""
         self.running = False
         if self.thread is not None:
             self.thread.join(timeout=1.0)
+        self.stop_recording()
+        self.stop_video_recording()
         self.camera_manager.release()
         self.pose_processor.close()
         cv2.destroyAllWindows()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import cv2
 import time
 import numpy as np
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 from .config_manager import CameraConfig
 from .camera_utils import select_camera
 
@@ -9,11 +9,13 @@ from .camera_utils import select_camera
 class CameraManager:
     """Manages camera connection and configuration."""
 
-    def __init__(self, config: CameraConfig, camera_index: Optional[int] = None,
+    def __init__(self, config: CameraConfig, camera_index: Optional[Union[int, str]] = None,
                  progress_callback: Optional[Callable] = None):
         self.config = config
         self.camera_index = camera_index if camera_index is not None else select_camera()
+        self.is_video_file = isinstance(self.camera_index, str)  # Recorded video used as the frame source
         self.progress_callback = progress_callback
+        self.next_frame_time = 0.0
         self.camera = self._connect_camera()
         self.reconnect_attempts = 0
 
@@ -22,6 +24,9 @@ class CameraManager:
         if self.progress_callback:
             self.progress_callback("Connecting to camera...")
 
+        if self.is_video_file:
+            return self._open_video_file()
+
         backends = [cv2.CAP_ANY, cv2.CAP_DSHOW, cv2.CAP_MSMF]
         for backend in backends:
             try:
@@ -36,6 +41,30 @@ class CameraManager:
                     cap.release()
         raise RuntimeError(f"Cannot open camera {self.camera_index} with any backend")
 
+    def _open_video_file(self) -> cv2.VideoCapture:
+        """Open a recorded video file as the frame source."""
+        cap = cv2.VideoCapture(self.camera_index)
+        if not cap.isOpened():
+            raise RuntimeError(f"Cannot open video file {self.camera_index}")
+        self.camera_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.camera_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.video_fps = cap.get(cv2.CAP_PROP_FPS) or self.config.fps
+        print(f"Video file {self.camera_index}: {self.camera_width}x{self.camera_height} @ {self.video_fps:.1f} FPS")
+        return cap
+
+    def _read_video_file_frame(self) -> Optional[np.ndarray]:
+        """Read the next video file frame at the file's frame rate, looping at the end."""
+        delay = self.next_frame_time - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_frame_time = max(self.next_frame_time, time.time() - 1.0) + 1.0 / self.video_fps
+
+        ret, frame = self.camera.read()
+        if not ret:
+            self.camera.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.camera.read()
+        return frame if ret and frame is not None and frame.size > 0 else None
+
     def _configure_camera(self, cap: cv2.VideoCapture) -> None:
         """Configure camera settings."""
         if self.progress_callback:
@@ -75,6 +104,8 @@ class CameraManager:
         if not self.camera.isOpened():
             if not self.reconnect_camera():
                 return None
+        if self.is_video_file:
+            return self._read_video_file_frame()
         ret, frame = self.camera.read()
         return frame if ret and frame is not None and frame.size > 0 else None
 
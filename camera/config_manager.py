@@ -14,6 +14,7 @@ class CameraConfig:
     search_margin_x: float = 0.1
     search_margin_y: float = 0.1
     landmarks_to_track: Optional[List[int]] = None
+    pose_history_seconds: float = 10.0
 
     def __post_init__(self):
         self.landmarks_to_track = self.landmarks_to_track or [
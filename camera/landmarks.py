@@ -0,0 +1,124 @@
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+NUM_LANDMARKS = 33  # MediaPipe pose landmark count
+NUM_POSES = 2  # Maximum poses per frame (matches the landmarker's num_poses)
+LANDMARK_FIELDS = ('x', 'y', 'z', 'visibility', 'presence')
+HEAD_LANDMARKS = range(0, 11)
+ARM_LANDMARKS = range(11, 23)
+LEG_LANDMARKS = range(23, 33)
+HAND_SIDES = {15: 'left', 16: 'right'}
+FOOT_SIDES = {27: 'left', 28: 'right'}
+HAND_VISIBILITY_THRESHOLD = 0.1
+FOOT_VISIBILITY_THRESHOLD = 0.05
+
+
+@dataclass
+class Landmark:
+    """Lightweight stand-in for a MediaPipe NormalizedLandmark."""
+    x: float
+    y: float
+    z: float = 0.0
+    visibility: float = 1.0
+    presence: float = 1.0
+
+
+@dataclass
+class PoseResult:
+    """Lightweight stand-in for a MediaPipe PoseLandmarkerResult."""
+    pose_landmarks: List[List[Landmark]] = field(default_factory=list)
+
+
+def structure_pose_landmarks(pose_landmarks: Any) -> Dict[str, Any]:
+    """Process pose landmarks into structured data (head, hands, feet, body)."""
+    player_data = {
+        'landmarks': {},
+        'hands': [],
+        'feet': [],
+        'head': {},
+        'body': {}
+    }
+    for idx, landmark in enumerate(pose_landmarks):
+        try:
+            x = max(0.0, min(1.0, landmark.x))
+            y = max(0.0, min(1.0, landmark.y))
+            z = getattr(landmark, 'z', 0.0)
+            visibility = getattr(landmark, 'visibility', 0.0)
+            presence = getattr(landmark, 'presence', 0.0)
+
+            landmark_data = {
+                'x': x, 'y': y, 'z': z,
+                'visibility': visibility,
+                'presence': presence,
+                'landmark_index': idx
+            }
+
+            if idx in HEAD_LANDMARKS:
+                player_data['head'][idx] = landmark_data
+            elif idx in ARM_LANDMARKS:
+                if idx in HAND_SIDES and visibility > HAND_VISIBILITY_THRESHOLD:
+                    landmark_data['side'] = HAND_SIDES[idx]
+                    player_data['hands'].append(landmark_data)
+            elif idx in LEG_LANDMARKS:
+                if idx in FOOT_SIDES and visibility > FOOT_VISIBILITY_THRESHOLD:
+                    landmark_data['side'] = FOOT_SIDES[idx]
+                    player_data['feet'].append(landmark_data)
+                else:
+                    player_data['body'][idx] = landmark_data
+            else:
+                player_data['body'][idx] = landmark_data
+        except AttributeError:
+            continue
+    return player_data
+
+
+def tracked_positions(result: Any, landmarks_to_track: List[int]) -> List[List[float]]:
+    """Collect normalized [x, y] coordinates of tracked landmarks for every pose."""
+    if not result or not result.pose_landmarks:
+        return []
+
+    positions = []
+    for pose_landmarks in result.pose_landmarks:
+        for idx, landmark in enumerate(pose_landmarks):
+            if idx in landmarks_to_track:
+                positions.append([landmark.x, landmark.y])
+    return positions
+
+
+def uncrop_player_data(player_data: Dict[str, Any], margin_x: float, margin_y: float,
+                       width: float, height: float, original_width: float,
+                       original_height: float) -> Dict[str, Any]:
+    """Map structured pose coordinates from the search-margin crop back to the full frame."""
+    if margin_x <= 0 and margin_y <= 0:
+        return player_data
+    for section in ['head', 'hands', 'feet', 'body']:
+        items = player_data[section] if section in ('hands', 'feet') else player_data[section].values()
+        for item in items:
+            item['x'] = (item['x'] * width + margin_x) / original_width
+            item['y'] = (item['y'] * height + margin_y) / original_height
+    return player_data
+
+
+def result_to_array(result: Any, num_poses: int = NUM_POSES) -> np.ndarray:
+    """Pack a pose result into a (num_poses, NUM_LANDMARKS, fields) float32 array.
+
+    Poses that were not detected are filled with NaN.
+    """
+    data = np.full((num_poses, NUM_LANDMARKS, len(LANDMARK_FIELDS)), np.nan, dtype=np.float32)
+    if not result or not result.pose_landmarks:
+        return data
+    for p, pose_landmarks in enumerate(result.pose_landmarks[:num_poses]):
+        for idx, landmark in enumerate(pose_landmarks[:NUM_LANDMARKS]):
+            data[p, idx] = [getattr(landmark, name, 0.0) for name in LANDMARK_FIELDS]
+    return data
+
+
+def array_to_result(data: np.ndarray) -> PoseResult:
+    """Unpack an array from result_to_array back into a PoseResult, skipping empty poses."""
+    poses = []
+    for pose in data:
+        if np.isnan(pose[:, 0]).all():
+            continue
+        poses.append([Landmark(*(float(v) for v in values)) for values in pose])
+    return PoseResult(poses)
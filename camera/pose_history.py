@@ -0,0 +1,157 @@
+import threading
+import warnings
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .landmarks import LANDMARK_FIELDS, NUM_LANDMARKS, NUM_POSES
+from util.ring_buffer import RingBuffer
+
+POSE_FRAME_SHAPE = (NUM_POSES, NUM_LANDMARKS, len(LANDMARK_FIELDS))
+
+
+@dataclass
+class PoseFrame:
+    """One timestamped pose sample (see landmarks.result_to_array for the array layout)."""
+    time: float
+    data: np.ndarray
+
+
+class PoseHistory:
+    """Fixed-capacity, time-indexed ring of pose samples shared by every consumer.
+
+    Samples must arrive with increasing timestamps. Lookups start from an index
+    guessed from the mean sample period and walk to the bracketing pair, which is
+    constant time for a steady capture rate. Missing values are NaN and propagate
+    through every query. All methods are thread-safe and return copies.
+    """
+    def __init__(self, capacity: int, shape: Tuple[int, ...] = POSE_FRAME_SHAPE, dtype=np.float32):
+        """Allocate the ring.
+
+        Args:
+            capacity: Number of samples kept, e.g. seconds * fps.
+            shape: Shape of one sample.
+            dtype: Storage type of the samples.
+        """
+        self.shape = tuple(shape)
+        self.times = RingBuffer(capacity, (), np.float64)
+        self.values = RingBuffer(capacity, self.shape, dtype)
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def append(self, t: float, value: np.ndarray) -> bool:
+        """Add a sample; returns False (and drops it) if t is not newer than the last one."""
+        with self.lock:
+            if len(self.times) and t <= self.times.latest():
+                return False
+            self.times.append(t)
+            self.values.append(value)
+            return True
+
+    def clear(self) -> None:
+        with self.lock:
+            self.times.clear()
+            self.values.clear()
+
+    def latest(self) -> Optional[PoseFrame]:
+        """Newest sample, or None if the history is empty."""
+        with self.lock:
+            if not len(self.times):
+                return None
+            return PoseFrame(float(self.times.latest()), self.values.latest().copy())
+
+    def latest_time(self) -> Optional[float]:
+        """Timestamp of the newest sample without copying it, or None if the history is empty."""
+        with self.lock:
+            return float(self.times.latest()) if len(self.times) else None
+
+    def _bracket(self, times: np.ndarray, t: float) -> int:
+        """Index i with times[i] <= t < times[i + 1], clamped to [0, len - 2]."""
+        count = len(times)
+        span = times[-1] - times[0]
+        i = int((t - times[0]) / span * (count - 1)) if span > 0 else 0
+        i = min(max(i, 0), count - 2)
+        while i > 0 and times[i] > t:
+            i -= 1
+        while i < count - 2 and times[i + 1] <= t:
+            i += 1
+        return i
+
+    def value_at(self, t: float, max_extrapolation: float = 0.0) -> np.ndarray:
+        """Sample value at time t.
+
+        Linearly interpolates between the bracketing samples. Past the newest
+        sample the last two samples are extrapolated for at most
+        max_extrapolation seconds (values without a finite rate are held); before
+        the oldest sample it is returned as is.
+        """
+        with self.lock:
+            count = len(self.times)
+            if count == 0:
+                return np.full(self.shape, np.nan)
+            times, values = self.times.view(), self.values.view()
+            if count == 1 or t <= times[0]:
+                return values[0 if t <= times[0] else -1].astype(np.float64)
+            if t >= times[-1]:
+                ahead = min(t - times[-1], max_extrapolation)
+                latest = values[-1].astype(np.float64)
+                if ahead <= 0:
+                    return latest
+                rate = (latest - values[-2]) / (times[-1] - times[-2])
+                # Values missing in the previous sample have no rate and stay at the newest sample
+                return np.where(np.isfinite(rate), latest + rate * ahead, latest)
+            i = self._bracket(times, t)
+            w = (t - times[i]) / (times[i + 1] - times[i])
+            return values[i] + (values[i + 1].astype(np.float64) - values[i]) * w
+
+    def velocity(self, t: Optional[float] = None) -> np.ndarray:
+        """Finite-difference rate of change (units per second) around t, default the newest sample."""
+        with self.lock:
+            count = len(self.times)
+            if count < 2:
+                return np.full(self.shape, np.nan)
+            times, values = self.times.view(), self.values.view()
+            i = count - 2 if t is None else self._bracket(times, t)
+            return (values[i + 1].astype(np.float64) - values[i]) / (times[i + 1] - times[i])
+
+    def acceleration(self, t: Optional[float] = None) -> np.ndarray:
+        """Second finite difference over the three samples ending at the bracket of t."""
+        with self.lock:
+            count = len(self.times)
+            if count < 3:
+                return np.full(self.shape, np.nan)
+            times, values = self.times.view(), self.values.view()
+            i = count - 2 if t is None else max(1, self._bracket(times, t))
+            v0 = (values[i].astype(np.float64) - values[i - 1]) / (times[i] - times[i - 1])
+            v1 = (values[i + 1].astype(np.float64) - values[i]) / (times[i + 1] - times[i])
+            return (v1 - v0) / ((times[i + 1] - times[i - 1]) / 2)
+
+    def window(self, seconds: float, end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(times, values) copies of the samples in (end - seconds, end], default end = newest."""
+        with self.lock:
+            times, values = self.times.view(), self.values.view()
+            if not len(times):
+                return times.copy(), values.copy()
+            end = times[-1] if end is None else end
+            lo = np.searchsorted(times, end - seconds, side='right')
+            hi = np.searchsorted(times, end, side='right')
+            return times[lo:hi].copy(), values[lo:hi].copy()
+
+    def window_stats(self, seconds: float, end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Per-element mean, std, min and max over a time window (NaN samples ignored)."""
+        times, values = self.window(seconds, end)
+        if not len(times):
+            empty = np.full(self.shape, np.nan)
+            return {'count': 0, 'mean': empty, 'std': empty, 'min': empty, 'max': empty}
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN slices (landmark never seen)
+            return {
+                'count': len(times),
+                'mean': np.nanmean(values, axis=0),
+                'std': np.nanstd(values, axis=0),
+                'min': np.nanmin(values, axis=0),
+                'max': np.nanmax(values, axis=0),
+            }
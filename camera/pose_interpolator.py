@@ -0,0 +1,87 @@
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+DEFAULT_MAX_EXTRAPOLATION = 0.05  # Seconds a position may be predicted past the newest sample
+DEFAULT_MAX_DELAY = 0.25  # Upper bound of the automatic interpolation delay in seconds
+DELAY_WINDOW = 120  # Sample ages (one per update) the automatic delay is taken from
+DELAY_PERCENTILE = 90  # Percentile of the recent sample ages the automatic delay follows
+DELAY_MARGIN = 0.005  # Seconds added on top of the percentile
+
+
+class PoseInterpolator:
+    """Resamples tracked landmark positions of a pose source at arbitrary times.
+
+    Pose results arrive at 15-30 Hz while physics runs faster. The interpolator
+    reads the source's pose_history, where every person keeps the same pose slot,
+    and returns one slot per tracked landmark and pose (NaN when missing).
+
+    Queries are shifted back by an interpolation delay so that they fall between
+    two real samples and positions are linearly interpolated. With delay=None the
+    delay follows a high percentile of the recent sample ages seen by update(),
+    i.e. pipeline latency plus one sample period, so a single late sample does
+    not raise it. Only when a sample is late are positions extrapolated from the
+    last two samples, for at most max_extrapolation seconds.
+    """
+    def __init__(self, camera: Any, max_extrapolation: float = DEFAULT_MAX_EXTRAPOLATION,
+                 delay: Optional[float] = None, max_delay: float = DEFAULT_MAX_DELAY,
+                 clock: Optional[Callable[[], float]] = None):
+        """Wrap a Camera-API pose source.
+
+        Args:
+            camera: Source with a pose_history (Camera, SyntheticCamera or PoseReplayCamera).
+            max_extrapolation: Longest prediction past the newest sample in seconds.
+            delay: Fixed interpolation delay in seconds, None to measure it.
+            max_delay: Upper bound of the measured delay in seconds.
+            clock: Time source of the history timestamps, defaults to time.time.
+        """
+        self.camera = camera
+        self.history = camera.pose_history
+        self.max_extrapolation = max_extrapolation
+        self.fixed_delay = delay
+        self.max_delay = max_delay
+        self.clock = clock or time.time
+        self.tracked = sorted(camera.config.landmarks_to_track)
+        self.num_slots = len(self.tracked) * self.history.shape[0]
+        self.sample_ages = deque(maxlen=DELAY_WINDOW)
+        self.measured_delay = 0.0
+        self.last_time = None
+
+    @property
+    def delay(self) -> float:
+        """Seconds the queries are shifted back."""
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        return self.measured_delay
+
+    def update(self) -> bool:
+        """Poll the source, measure the age of its newest sample and update the delay.
+
+        Returns:
+            True if a new sample arrived since the last update.
+        """
+        self.camera.get_player_positions()  # Synthetic and replay sources generate samples when polled
+        latest_time = self.history.latest_time()
+        if latest_time is None:
+            return False
+        self.sample_ages.append(self.clock() - latest_time)
+        measured = np.percentile(self.sample_ages, DELAY_PERCENTILE) + DELAY_MARGIN
+        self.measured_delay = min(max(measured, 0.0), self.max_delay)
+        is_new = latest_time != self.last_time
+        self.last_time = latest_time
+        return is_new
+
+    def _slots(self, data: np.ndarray) -> np.ndarray:
+        """(num_slots, 2) x/y of the tracked landmarks of a pose_history sample."""
+        return data[:, self.tracked, :2].reshape(-1, 2).astype(np.float64)
+
+    def positions_at(self, t: float) -> np.ndarray:
+        """(num_slots, 2) positions at time t - delay, NaN for landmarks not tracked around it."""
+        return self._slots(self.history.value_at(t - self.delay, self.max_extrapolation))
+
+    def latest_positions(self) -> np.ndarray:
+        """Positions of the newest sample without resampling."""
+        latest = self.history.latest()
+        return self._slots(latest.data) if latest else np.full((self.num_slots, 2), np.nan)
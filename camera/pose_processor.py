@@ -4,6 +4,7 @@ import cv2
 import os
 from typing import Dict, Any, Optional, Callable
 from .config_manager import CameraConfig
+from .landmarks import structure_pose_landmarks
 
 mp_drawing = mp.solutions.drawing_utils
 mp_drawing_styles = mp.solutions.drawing_styles
@@ -53,51 +54,7 @@ class PoseProcessor:
 
     def process_pose_landmarks(self, pose_landmarks: Any) -> Dict[str, Any]:
         """Process pose landmarks into structured data."""
-        player_data = {
-            'landmarks': {},
-            'hands': [],
-            'feet': [],
-            'head': {},
-            'body': {}
-        }
-        for idx, landmark in enumerate(pose_landmarks):
-            try:
-                x = max(0.0, min(1.0, landmark.x))
-                y = max(0.0, min(1.0, landmark.y))
-                z = getattr(landmark, 'z', 0.0)
-                visibility = getattr(landmark, 'visibility', 0.0)
-                presence = getattr(landmark, 'presence', 0.0)
-
-                landmark_data = {
-                    'x': x, 'y': y, 'z': z,
-                    'visibility': visibility,
-                    'presence': presence,
-                    'landmark_index': idx
-                }
-
-                if idx in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
-                    player_data['head'][idx] = landmark_data
-                elif idx in [11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22]:
-                    if idx == 15 and visibility > 0.1:
-                        landmark_data['side'] = 'left'
-                        player_data['hands'].append(landmark_data)
-                    elif idx == 16 and visibility > 0.1:
-                        landmark_data['side'] = 'right'
-                        player_data['hands'].append(landmark_data)
-                elif idx in [23, 24, 25, 26, 27, 28, 29, 30, 31, 32]:
-                    if idx == 27 and visibility > 0.05:
-                        landmark_data['side'] = 'left'
-                        player_data['feet'].append(landmark_data)
-                    elif idx == 28 and visibility > 0.05:
-                        landmark_data['side'] = 'right'
-                        player_data['feet'].append(landmark_data)
-                    else:
-                        player_data['body'][idx] = landmark_data
-                else:
-                    player_data['body'][idx] = landmark_data
-            except AttributeError:
-                continue
-        return player_data
+        return structure_pose_landmarks(pose_landmarks)
 
     def close(self) -> None:
         """Close the landmarker."""
@@ -0,0 +1,388 @@
+import os
+import struct
+import threading
+import time
+import numpy as np
+from queue import Queue, Empty, Full
+from typing import List, Dict, Optional, Callable, Any, Tuple
+from .config_manager import CameraConfig
+from .landmarks import (NUM_LANDMARKS, NUM_POSES, LANDMARK_FIELDS, array_to_result, result_to_array,
+                        structure_pose_landmarks, tracked_positions, uncrop_player_data)
+from .pose_history import PoseHistory
+from .pose_slots import PoseSlotTracker
+from util.latency import LatencyTracker
+
+# File layout: fixed header followed by fixed-size float32 records
+#   record = [capture time relative to the current time base, pose count, poses * landmarks * fields]
+#   time base marker = [0, TIME_BASE_MARKER, float64 absolute time in the next two values, zeros]
+# The time base starts at the header start time; markers move it to the start of each appended
+# session and every TIME_BASE_INTERVAL seconds, so float32 offsets stay precise.
+RECORDING_MAGIC = b'BPPR'
+RECORDING_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)  # version 1 files have no time base markers
+HEADER_FORMAT = '<4sHHHHdIIff'
+HEADER_SIZE = 64
+RECORD_PREFIX = 2  # relative time, pose count
+TIME_BASE_MARKER = -1.0  # Pose count of a time base marker record
+TIME_BASE_INTERVAL = 600.0  # Seconds after which the writer starts a new time base
+
+WRITER_QUEUE_SIZE = 1024  # Buffered results before the recorder starts dropping
+WRITER_BATCH_SIZE = 64  # Records written per file write
+WRITER_FLUSH_INTERVAL = 1.0  # Seconds between file flushes
+SESSION_GAP = 2.0  # Seconds without records treated as a boundary between appended sessions
+
+
+def record_length(num_poses: int = NUM_POSES) -> int:
+    """Number of float32 values in one record."""
+    return RECORD_PREFIX + num_poses * NUM_LANDMARKS * len(LANDMARK_FIELDS)
+
+
+class RecordingHeader:
+    """Metadata stored at the start of a pose recording."""
+    def __init__(self, start_time: float, camera_width: int, camera_height: int,
+                 margin_x: float = 0.0, margin_y: float = 0.0, num_poses: int = NUM_POSES):
+        self.start_time = start_time
+        self.camera_width = camera_width
+        self.camera_height = camera_height
+        self.margin_x = margin_x
+        self.margin_y = margin_y
+        self.num_poses = num_poses
+
+    def pack(self) -> bytes:
+        data = struct.pack(HEADER_FORMAT, RECORDING_MAGIC, RECORDING_VERSION, self.num_poses,
+                           NUM_LANDMARKS, len(LANDMARK_FIELDS), self.start_time,
+                           self.camera_width, self.camera_height, self.margin_x, self.margin_y)
+        return data.ljust(HEADER_SIZE, b'\0')
+
+    @classmethod
+    def unpack(cls, data: bytes) -> 'RecordingHeader':
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Pose recording header is truncated")
+        (magic, version, num_poses, num_landmarks, num_fields, start_time,
+         camera_width, camera_height, margin_x, margin_y) = struct.unpack_from(HEADER_FORMAT, data)
+        if magic != RECORDING_MAGIC or version not in SUPPORTED_VERSIONS:
+            raise ValueError("Not a pose recording or unsupported version")
+        if num_landmarks != NUM_LANDMARKS or num_fields != len(LANDMARK_FIELDS):
+            raise ValueError("Pose recording has an incompatible landmark layout")
+        return cls(start_time, camera_width, camera_height, margin_x, margin_y, num_poses)
+
+
+class PoseRecorder:
+    """Appends pose results to a binary recording from a dedicated writer thread.
+
+    submit() never blocks the caller: results are buffered in a bounded queue and
+    dropped (and counted) if the writer cannot keep up.
+    """
+    def __init__(self, path: str, camera_width: int, camera_height: int,
+                 margin_x: float = 0.0, margin_y: float = 0.0, num_poses: int = NUM_POSES,
+                 queue_size: int = WRITER_QUEUE_SIZE):
+        """Open the recording file, appending if it already exists.
+
+        An appended session must use the same camera size, margins and pose count as the
+        existing recording, otherwise ValueError is raised.
+
+        Args:
+            path: Output file path.
+            camera_width: Width of the full camera frame in pixels.
+            camera_height: Height of the full camera frame in pixels.
+            margin_x: Horizontal search margin applied before inference.
+            margin_y: Vertical search margin applied before inference.
+            num_poses: Maximum poses stored per record.
+            queue_size: Results buffered before new ones are dropped.
+        """
+        self.path = path
+        self.num_poses = num_poses
+        self.queue = Queue(maxsize=queue_size)
+        self.records_written = 0
+        self.records_dropped = 0
+        self.running = False
+        self.thread = None
+
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER_SIZE:
+            with open(path, 'rb') as f:
+                self.header = RecordingHeader.unpack(f.read(HEADER_SIZE))
+            if self.header.num_poses != num_poses:
+                raise ValueError(f"Existing recording {path} stores {self.header.num_poses} poses per record")
+            header = self.header
+            if ((header.camera_width, header.camera_height) != (camera_width, camera_height)
+                    or not np.allclose([header.margin_x, header.margin_y], [margin_x, margin_y], atol=1e-6)):
+                raise ValueError(f"Existing recording {path} was made with camera {header.camera_width}x"
+                                 f"{header.camera_height} and margins ({header.margin_x:.3f}, {header.margin_y:.3f})")
+            self.file = open(path, 'ab')
+            self.time_base = None  # The first write starts a new time base for this session
+        else:
+            self.header = RecordingHeader(time.time(), camera_width, camera_height, margin_x, margin_y, num_poses)
+            self.file = open(path, 'wb')
+            self.file.write(self.header.pack())
+            self.time_base = self.header.start_time
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self.running = True
+        self.thread = threading.Thread(target=self._write_loop, daemon=True)
+        self.thread.start()
+
+    def submit(self, capture_time: float, result: Any) -> bool:
+        """Queue a pose result for writing without blocking.
+
+        Returns:
+            False if the buffer was full and the result was dropped.
+        """
+        try:
+            self.queue.put_nowait((capture_time, result))
+            return True
+        except Full:
+            self.records_dropped += 1
+            return False
+
+    def _write_loop(self) -> None:
+        """Drain the queue in batches and append them to the file, closing it when done."""
+        try:
+            self._drain()
+        finally:
+            self.file.close()
+
+    def _drain(self) -> None:
+        last_flush = time.time()
+        while self.running or not self.queue.empty():
+            try:
+                batch = [self.queue.get(timeout=0.1)]
+            except Empty:
+                continue
+            while len(batch) < WRITER_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+
+            records = np.zeros((2 * len(batch), record_length(self.num_poses)), dtype=np.float32)
+            i = 0
+            for capture_time, result in batch:
+                if self.time_base is None or capture_time - self.time_base > TIME_BASE_INTERVAL:
+                    self.time_base = capture_time
+                    records[i, 1] = TIME_BASE_MARKER
+                    records[i, RECORD_PREFIX:RECORD_PREFIX + 2] = np.array([capture_time]).view(np.float32)
+                    i += 1
+                poses = result_to_array(result, self.num_poses)
+                records[i, 0] = capture_time - self.time_base
+                records[i, 1] = np.count_nonzero(~np.isnan(poses[:, 0, 0]))
+                records[i, RECORD_PREFIX:] = poses.ravel()
+                i += 1
+            records = records[:i]
+            try:
+                self.file.write(records.tobytes())
+                self.records_written += len(batch)
+                if time.time() - last_flush >= WRITER_FLUSH_INTERVAL:
+                    self.file.flush()
+                    last_flush = time.time()
+            except Exception as e:
+                print(f"Error writing pose recording: {e}")
+
+    def stop(self) -> None:
+        """Write remaining buffered results and close the file.
+
+        The writer thread owns the file once started and closes it after its last write,
+        so a join timeout leaves it finishing in the background instead of racing a close.
+        """
+        self.running = False
+        if self.thread is None:
+            self.file.close()
+        else:
+            self.thread.join(timeout=5.0)
+            if self.thread.is_alive():
+                print(f"Pose recording {self.path} is still writing {self.queue.qsize()} buffered results")
+                return
+        print(f"Pose recording saved: {self.path} "
+              f"({self.records_written} records, {self.records_dropped} dropped)")
+
+
+class PoseRecording:
+    """Memory-mapped read access to a pose recording.
+
+    A file can hold several appended sessions. Gaps longer than SESSION_GAP mark a
+    session boundary; playback_times closes them up to one typical record period
+    so replays do not wait out the time between sessions.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.header = RecordingHeader.unpack(f.read(HEADER_SIZE))
+        length = record_length(self.header.num_poses)
+        count = (os.path.getsize(path) - HEADER_SIZE) // (length * 4)  # ignore a partially written record
+        if count > 0:
+            self.records = np.memmap(path, dtype=np.float32, mode='r', offset=HEADER_SIZE, shape=(count, length))
+        else:
+            self.records = np.empty((0, length), dtype=np.float32)
+        self.indices, self.timestamps = self._read_times(self.records, self.header.start_time)
+        self.playback_times, self.session_starts = self._rebase_sessions(self.timestamps)
+
+    @staticmethod
+    def _read_times(records: np.ndarray, start_time: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(file row of each pose record, absolute capture times) with time base markers applied."""
+        is_marker = records[:, 1] == TIME_BASE_MARKER
+        indices = np.flatnonzero(~is_marker)
+        markers = np.flatnonzero(is_marker)
+        bases = np.full(len(indices), start_time)
+        if len(markers):
+            marker_times = np.ascontiguousarray(records[markers, RECORD_PREFIX:RECORD_PREFIX + 2]).view(np.float64)
+            latest = np.searchsorted(markers, indices) - 1  # last marker before each record
+            bases = np.where(latest >= 0, marker_times[np.maximum(latest, 0), 0], start_time)
+        return indices, bases + records[indices, 0].astype(np.float64)
+
+    @staticmethod
+    def _rebase_sessions(timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps with session gaps closed, indices of the first record of each session)."""
+        if len(timestamps) < 2:
+            return timestamps.copy(), np.zeros(min(1, len(timestamps)), dtype=np.int64)
+        gaps = np.diff(timestamps)
+        boundary = gaps > SESSION_GAP
+        period = float(np.median(gaps[~boundary])) if (~boundary).any() else 0.0
+        removed = np.concatenate([[0.0], np.cumsum(np.where(boundary, gaps - period, 0.0))])
+        return timestamps - removed, np.concatenate([[0], np.flatnonzero(boundary) + 1])
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @property
+    def duration(self) -> float:
+        return float(self.playback_times[-1] - self.playback_times[0]) if len(self) > 1 else 0.0
+
+    def poses(self, index: int) -> np.ndarray:
+        """(num_poses, NUM_LANDMARKS, fields) landmark array of one record."""
+        return self.records[self.indices[index], RECORD_PREFIX:].reshape(self.header.num_poses, NUM_LANDMARKS,
+                                                           len(LANDMARK_FIELDS))
+
+    def result(self, index: int) -> Any:
+        """PoseLandmarkerResult-like object of one record."""
+        return array_to_result(self.poses(index))
+
+
+class PoseReplayCamera:
+    """Replays a pose recording through the Camera API.
+
+    speed=1.0 replays in real time, N replays N times faster, and None advances one
+    record per query (maximum speed).
+    """
+    def __init__(self, path: str, speed: Optional[float] = 1.0, loop: bool = False,
+                 clock: Optional[Callable[[], float]] = None, config: Optional[CameraConfig] = None):
+        """Open a recording for replay.
+
+        Args:
+            path: Recording file path.
+            speed: Playback speed multiplier, None for maximum speed.
+            loop: Restart from the beginning when the recording ends.
+            clock: Time source in seconds, defaults to time.time.
+            config: Camera configuration (landmarks_to_track is used).
+        """
+        self.recording = PoseRecording(path)
+        self.speed = speed
+        self.loop = loop
+        self.clock = clock or time.time
+        self.config = config or CameraConfig(search_margin_x=self.recording.header.margin_x,
+                                             search_margin_y=self.recording.header.margin_y)
+        self.camera_width = self.recording.header.camera_width
+        self.camera_height = self.recording.header.camera_height
+        self.latency = LatencyTracker()
+        self.running = False
+        self.index = -1
+        self.start_clock = None
+        self.finished = False
+        self.latest_timing = None
+        # Same layout as Camera.pose_history, stamped with the clock time each record is due
+        num_poses = self.recording.header.num_poses
+        self.pose_history = PoseHistory(max(2, int(self.config.pose_history_seconds * self.config.fps)),
+                                        (num_poses, NUM_LANDMARKS, len(LANDMARK_FIELDS)))
+        self.pose_slots = PoseSlotTracker(num_poses)
+
+    def start_processing(self) -> None:
+        """Start playback from the beginning of the recording."""
+        self.running = True
+        self.index = -1
+        self.start_clock = self.clock()
+        self.finished = False
+        self.pose_slots.reset()
+
+    def _advance(self) -> Optional[int]:
+        """Move to the record due at the current clock time and return its index."""
+        count = len(self.recording)
+        if count == 0:
+            return None
+        if self.start_clock is None:
+            self.start_processing()
+
+        if self.speed is None:
+            index = self.index + 1
+        else:
+            elapsed = (self.clock() - self.start_clock) * self.speed
+            target = self.recording.playback_times[0] + elapsed
+            index = int(np.searchsorted(self.recording.playback_times, target, side='right')) - 1
+
+        if index >= count:
+            if self.loop:
+                self.start_processing()
+                index = 0
+            else:
+                self.finished = True
+                index = count - 1
+        index = max(0, index)
+        if index != self.index:
+            self.index = index
+            self.latest_timing = {
+                'seq': index + 1, 'capture': self.clock(),
+                'inference_start': self.clock(), 'inference_end': self.clock(),
+                'recorded_capture': float(self.recording.timestamps[index])
+            }
+            if self.speed is None:
+                due_time = self.latest_timing['capture']
+            else:
+                playback_times = self.recording.playback_times
+                due_time = self.start_clock + (playback_times[index] - playback_times[0]) / self.speed
+            self.pose_history.append(due_time, self.pose_slots.assign(self.recording.poses(index)))
+        return self.index
+
+    def _current_result(self) -> Any:
+        index = self._advance()
+        return self.recording.result(index) if index is not None else None
+
+    def get_player_positions(self) -> List[List[float]]:
+        """Get normalized [x, y] coordinates of tracked landmarks.
+
+        Returns:
+            List of [x, y] coordinates for tracked landmarks.
+        """
+        return tracked_positions(self._current_result(), self.config.landmarks_to_track)
+
+    def get_full_pose_data(self) -> List[Dict[str, Any]]:
+        """Get full pose data for all recorded persons.
+
+        Returns:
+            List of dictionaries containing pose data (head, hands, feet, body).
+        """
+        result = self._current_result()
+        if not result or not result.pose_landmarks:
+            return []
+
+        header = self.recording.header
+        margin_x = header.margin_x * header.camera_width
+        margin_y = header.margin_y * header.camera_height
+        width = header.camera_width - 2 * margin_x
+        height = header.camera_height - 2 * margin_y
+        return [uncrop_player_data(structure_pose_landmarks(pose_landmarks), margin_x, margin_y, width, height,
+                                   header.camera_width, header.camera_height)
+                for pose_landmarks in result.pose_landmarks]
+
+    def get_latest_timing(self) -> Optional[Dict[str, float]]:
+        """Get timestamps of the current record; 'recorded_capture' is the original capture time."""
+        return dict(self.latest_timing) if self.latest_timing else None
+
+    def get_frame(self) -> Optional[np.ndarray]:
+        """Recordings contain no video."""
+        return None
+
+    def get_latest_frame(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Recordings contain no video."""
+        return 0, None
+
+    def release(self) -> None:
+        """Stop playback."""
+        self.running = False
@@ -0,0 +1,62 @@
+import itertools
+
+import numpy as np
+
+from .landmarks import NUM_POSES
+
+UNSEEN_SLOT_COST = 2.0  # Cost of giving a pose a slot nobody has used yet (above any normalized distance)
+
+
+class PoseSlotTracker:
+    """Keeps every person in the same pose slot from frame to frame.
+
+    The landmarker lists poses in no particular order, so the first pose of one
+    frame can be the second pose of the next. The tracker remembers the last
+    centroid seen in each slot and reorders new arrays to the assignment with the
+    smallest total centroid movement. Slots keep their centroid while empty, so a
+    person who drops out for a few frames gets the same slot back.
+    """
+    def __init__(self, num_poses: int = NUM_POSES):
+        """Start with no known slots.
+
+        Args:
+            num_poses: Number of pose slots (first axis of the arrays passed to assign()).
+        """
+        self.num_poses = num_poses
+        self.anchors = np.full((num_poses, 2), np.nan)
+        self.orders = list(itertools.permutations(range(num_poses)))
+
+    def reset(self) -> None:
+        """Forget every slot, e.g. when a replay restarts."""
+        self.anchors[:] = np.nan
+
+    def assign(self, data: np.ndarray) -> np.ndarray:
+        """Reorder a (num_poses, landmarks, fields) array so each pose stays in its slot.
+
+        Args:
+            data: Array from landmarks.result_to_array, x and y in fields 0 and 1.
+
+        Returns:
+            The reordered array (data itself if the order is unchanged).
+        """
+        centroids = np.full((self.num_poses, 2), np.nan)
+        for p, pose in enumerate(data[:self.num_poses, :, :2]):
+            visible = ~np.isnan(pose).any(axis=1)
+            if visible.any():
+                centroids[p] = pose[visible].mean(axis=0)
+        detected = ~np.isnan(centroids[:, 0])
+        if not detected.any():
+            return data
+
+        # cost[slot, pose]: centroid movement, fixed cost for slots never used
+        cost = np.linalg.norm(self.anchors[:, None] - centroids[None], axis=2)
+        cost[np.isnan(self.anchors[:, 0])] = UNSEEN_SLOT_COST
+        cost[:, ~detected] = 0.0
+        best = min(self.orders, key=lambda order: cost[range(self.num_poses), order].sum())
+
+        for slot, pose in enumerate(best):
+            if detected[pose]:
+                self.anchors[slot] = centroids[pose]
+        if list(best) == list(range(self.num_poses)):
+            return data
+        return data[list(best)]
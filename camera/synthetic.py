@@ -0,0 +1,295 @@
+import math
+import time
+import cv2
+import numpy as np
+from typing import List, Dict, Optional, Callable, Any, Tuple
+from .config_manager import CameraConfig
+from .landmarks import LANDMARK_FIELDS, NUM_LANDMARKS, NUM_POSES, Landmark, PoseResult, structure_pose_landmarks
+from .pose_history import PoseHistory
+from util.latency import LatencyTracker
+
+# Controlled points of each synthetic climber; all other landmarks follow the skeleton.
+CONTROL_POINTS = ('center', 'left_hand', 'right_hand', 'left_foot', 'right_foot')
+CONTROL_LANDMARKS = {'left_hand': 15, 'right_hand': 16, 'left_foot': 27, 'right_foot': 28}
+
+# Skeleton template in body units (1.0 ~ nose to ankles), relative to the hip center.
+SKELETON_TEMPLATE = np.zeros((NUM_LANDMARKS, 2), dtype=np.float64)
+SKELETON_TEMPLATE[0] = (0.0, -0.50)                      # nose
+SKELETON_TEMPLATE[1:4] = [(-0.01, -0.52), (-0.02, -0.52), (-0.03, -0.52)]  # left eye
+SKELETON_TEMPLATE[4:7] = [(0.01, -0.52), (0.02, -0.52), (0.03, -0.52)]     # right eye
+SKELETON_TEMPLATE[7:9] = [(-0.05, -0.50), (0.05, -0.50)]   # ears
+SKELETON_TEMPLATE[9:11] = [(-0.015, -0.47), (0.015, -0.47)]  # mouth
+SKELETON_TEMPLATE[11:13] = [(-0.12, -0.35), (0.12, -0.35)]  # shoulders
+SKELETON_TEMPLATE[15:17] = [(-0.22, -0.65), (0.22, -0.65)]  # wrists (arms up)
+SKELETON_TEMPLATE[23:25] = [(-0.07, 0.0), (0.07, 0.0)]     # hips
+SKELETON_TEMPLATE[27:29] = [(-0.10, 0.50), (0.10, 0.50)]   # ankles
+HAND_OFFSETS = np.array([(-0.02, -0.04), (0.0, -0.05), (0.02, -0.03)])  # pinky, index, thumb
+FOOT_OFFSETS = np.array([(0.0, 0.02), (0.04, 0.03)])                    # heel, foot index
+ARM_REACH = 0.45  # shoulder to wrist, body units
+LEG_REACH = 0.60  # hip to ankle, body units
+# Anchor landmark (shoulder/hip) and reach of each limb in CONTROL_POINTS[1:]
+LIMB_ANCHORS = SKELETON_TEMPLATE[[11, 12, 23, 24]]
+LIMB_REACH = np.array([ARM_REACH, ARM_REACH, LEG_REACH, LEG_REACH])
+CONTROL_INDEX = {idx: CONTROL_POINTS.index(name) for name, idx in CONTROL_LANDMARKS.items()}
+
+MAX_CATCH_UP_SAMPLES = 300  # Skip ahead instead of generating more samples than this per query
+
+
+class SyntheticCamera:
+    """Camera-compatible pose source driven by scripted or random-walk trajectories.
+
+    Produces the same get_player_positions / get_full_pose_data output as Camera
+    without a camera or landmarker, so Physics, Renderer and the WebSocket path can
+    be stressed deterministically. Samples are generated at a fixed rate of the
+    supplied clock; pass a virtual clock to run faster than real time.
+    """
+    def __init__(self, num_players: int = 2, mode: str = 'random_walk', jitter: float = 0.003,
+                 seed: Optional[int] = None, rate: float = 30.0, body_scale: float = 0.4,
+                 clock: Optional[Callable[[], float]] = None,
+                 script: Optional[Callable[[float, int], Dict[str, Tuple[float, float]]]] = None,
+                 ball_provider: Optional[Callable[[], Any]] = None,
+                 hand_speed: float = 1.5, config: Optional[CameraConfig] = None,
+                 hitboxes_only: bool = False):
+        """Initialize the synthetic pose source.
+
+        Args:
+            num_players: Number of virtual climbers.
+            mode: 'random_walk', 'script' or 'chase'.
+            jitter: Standard deviation of per-landmark noise (normalized units).
+            seed: Seed for the random generator; same seed gives the same stream.
+            rate: Pose sample rate in Hz of the clock.
+            body_scale: Body height as a fraction of the frame height.
+            clock: Time source in seconds, defaults to time.time.
+            script: For 'script' mode, callable (t, player_index) returning target
+                positions keyed by CONTROL_POINTS names.
+            ball_provider: For 'chase' mode, callable returning the ball [x, y].
+            hand_speed: Maximum speed of chasing hands (normalized units per second).
+            config: Camera configuration, search margins are ignored.
+            hitboxes_only: Only compute the tracked landmarks for every sample and skip
+                pose_history; full poses are built on demand. For headless simulation.
+        """
+        if mode not in ('random_walk', 'script', 'chase'):
+            raise ValueError(f"Unknown synthetic mode: {mode}")
+        self.config = config or CameraConfig(search_margin_x=0.0, search_margin_y=0.0)
+        self.num_players = num_players
+        self.mode = mode
+        self.jitter = jitter
+        self.rate = rate
+        self.period = 1.0 / rate
+        self.body_scale = body_scale
+        self.clock = clock or time.time
+        self.script = script
+        self.ball_provider = ball_provider
+        self.hand_speed = hand_speed
+        self.rng = np.random.default_rng(seed)
+        self.camera_width, self.camera_height = self.config.resolution
+        self.running = False
+        self.latency = LatencyTracker()
+        self.frame_seq = 0
+        self.latest_timing = None
+        self.latest_frame = (None, None)  # (seq, frame) rendered by get_latest_frame()
+
+        # Each player climbs in its own lane across the wall
+        lane_width = 1.0 / max(1, num_players)
+        self.lanes = np.array([(i * lane_width, (i + 1) * lane_width) for i in range(num_players)])
+        self.home = self._rest_pose(np.column_stack([self.lanes.mean(axis=1), np.full(num_players, 0.55)]))
+        self.center_min = np.column_stack([self.lanes[:, 0], np.full(num_players, 0.2)])
+        self.center_max = np.column_stack([self.lanes[:, 1], np.full(num_players, 0.8)])
+        self.limb_anchors = LIMB_ANCHORS * body_scale
+        self.limb_reach = (LIMB_REACH * body_scale)[:, None]
+        self.points = self.home.copy()  # (players, control points, 2)
+        self.velocity = np.zeros_like(self.points)
+        self.hitboxes_only = hitboxes_only
+        self.tracked = [idx for idx in range(NUM_LANDMARKS) if idx in self.config.landmarks_to_track]
+        # Tracked landmarks that are control points need no skeleton (the default hands and feet)
+        self.tracked_points = ([CONTROL_INDEX[idx] for idx in self.tracked]
+                               if all(idx in CONTROL_INDEX for idx in self.tracked) else None)
+        self._sample_noise()
+        self._landmarks = self._build_landmarks()
+        self.hitboxes = self._build_hitboxes()
+        self.sample_time = None
+        # Same layout as Camera.pose_history; each player always occupies its own slot
+        self.pose_history = PoseHistory(max(2, int(self.config.pose_history_seconds * rate)),
+                                        (max(NUM_POSES, num_players), NUM_LANDMARKS, len(LANDMARK_FIELDS)))
+        self.pose_array = np.full(self.pose_history.shape, np.nan, dtype=np.float32)
+        self.pose_array[:num_players, :, 2] = 0.0
+        self.pose_array[:num_players, :, 3:] = 0.99
+
+    def _rest_pose(self, centers: np.ndarray) -> np.ndarray:
+        """Control point positions for a climber standing at each center."""
+        points = np.repeat(centers[:, None, :], len(CONTROL_POINTS), axis=1)
+        for i, name in enumerate(CONTROL_POINTS[1:], start=1):
+            points[:, i] += SKELETON_TEMPLATE[CONTROL_LANDMARKS[name]] * self.body_scale
+        return points
+
+    def start_processing(self):
+        """Start generating samples (kept for Camera API compatibility)."""
+        self.running = True
+        self.sample_time = self.clock()
+
+    def _advance(self) -> None:
+        """Generate every sample due up to the current clock time."""
+        now = self.clock()
+        if self.sample_time is None:
+            self.sample_time = now
+        due = int((now - self.sample_time) / self.period)
+        if due > MAX_CATCH_UP_SAMPLES:
+            self.sample_time = now - MAX_CATCH_UP_SAMPLES * self.period
+            due = MAX_CATCH_UP_SAMPLES
+        for _ in range(due):
+            self.sample_time += self.period
+            self._step(self.period)
+            self._sample_noise()
+            if self.hitboxes_only:
+                self._landmarks = None
+            else:
+                self._landmarks = self._build_landmarks()
+                self.pose_array[:self.num_players, :, :2] = self._landmarks
+                self.pose_history.append(self.sample_time, self.pose_array)
+            self.hitboxes = self._build_hitboxes()
+            self.frame_seq += 1
+            self.latest_timing = {
+                'seq': self.frame_seq, 'capture': self.sample_time,
+                'inference_start': self.sample_time, 'inference_end': self.sample_time
+            }
+
+    def _step(self, dt: float) -> None:
+        """Move the control points by one sample period."""
+        if self.mode == 'random_walk':
+            self.velocity += self.rng.normal(0.0, 0.8, self.velocity.shape) * np.sqrt(dt)
+            self.velocity *= 0.9
+            # Weak spring back to the rest pose keeps climbers on the wall
+            self.velocity += (self.home - self.points) * 0.5 * dt
+            self.points += self.velocity * dt
+        elif self.mode == 'script' and self.script:
+            for p in range(self.num_players):
+                targets = self.script(self.sample_time, p)
+                for i, name in enumerate(CONTROL_POINTS):
+                    if name in targets:
+                        self.points[p, i] = targets[name]
+        elif self.mode == 'chase':
+            self._chase_ball(dt)
+        self._constrain()
+
+    def _chase_ball(self, dt: float) -> None:
+        """Move the nearest hand of the player in the ball's lane toward the ball."""
+        if self.ball_provider is None:
+            return
+        ball = self.ball_provider()
+        if ball is None:
+            return
+        ball = np.asarray(ball, dtype=np.float64)[:2]
+        max_step = self.hand_speed * dt
+        in_lane = (self.lanes[:, 0] <= ball[0]) & (ball[0] <= self.lanes[:, 1])
+        for p in np.flatnonzero(in_lane):
+            offset = self.points[p, 1:3] - ball
+            nearest = int(np.argmin(np.sqrt(np.add.reduce(offset * offset, axis=1))))
+            for idx, speed in ((1 + nearest, max_step), (0, max_step * 0.5)):
+                delta = ball - self.points[p, idx]
+                distance = math.sqrt(delta @ delta)
+                if distance > 0:
+                    self.points[p, idx] += delta * min(1.0, speed / distance)
+
+    def _constrain(self) -> None:
+        """Keep limbs within reach of the body and every point on the frame."""
+        centers = self.points[:, 0]
+        np.clip(centers, self.center_min, self.center_max, out=centers)  # own lane, mid wall height
+        anchors = self.points[:, :1] + self.limb_anchors
+        offset = self.points[:, 1:] - anchors
+        distance = np.sqrt(np.add.reduce(offset * offset, axis=2, keepdims=True))
+        scale = np.where(distance > self.limb_reach, self.limb_reach / np.maximum(distance, 1e-9), 1.0)
+        self.points[:, 1:] = anchors + offset * scale
+        np.clip(self.points, 0.0, 1.0, out=self.points)
+
+    def _sample_noise(self) -> None:
+        """Draw the per-landmark noise of the current sample."""
+        self.noise = (self.rng.normal(0.0, self.jitter, (self.num_players, NUM_LANDMARKS, 2))
+                      if self.jitter > 0 else None)
+
+    @property
+    def landmarks(self) -> np.ndarray:
+        """(players, 33, 2) landmarks of the current sample, built on demand in hitboxes_only mode."""
+        if self._landmarks is None:
+            self._landmarks = self._build_landmarks()
+        return self._landmarks
+
+    def _build_hitboxes(self) -> np.ndarray:
+        """Read-only (players * tracked, 2) positions of the tracked landmarks."""
+        if self.tracked_points is None:
+            hitboxes = self.landmarks[:, self.tracked]
+        else:
+            hitboxes = self.points[:, self.tracked_points]
+            if self.noise is not None:
+                hitboxes += self.noise[:, self.tracked]
+        hitboxes = hitboxes.reshape(-1, 2)
+        hitboxes.flags.writeable = False
+        return hitboxes
+
+    def _build_landmarks(self) -> np.ndarray:
+        """Build all 33 landmarks per player from the control points and the sample noise."""
+        centers = self.points[:, 0]
+        landmarks = centers[:, None, :] + SKELETON_TEMPLATE[None] * self.body_scale
+        for name, idx in CONTROL_LANDMARKS.items():
+            landmarks[:, idx] = self.points[:, CONTROL_POINTS.index(name)]
+        landmarks[:, 13:15] = (landmarks[:, 11:13] + landmarks[:, 15:17]) / 2  # elbows
+        landmarks[:, 25:27] = (landmarks[:, 23:25] + landmarks[:, 27:29]) / 2  # knees
+        mirror = np.array([-1.0, 1.0])
+        landmarks[:, [17, 19, 21]] = landmarks[:, 15:16] + HAND_OFFSETS * mirror * self.body_scale
+        landmarks[:, [18, 20, 22]] = landmarks[:, 16:17] + HAND_OFFSETS * self.body_scale
+        landmarks[:, [29, 31]] = landmarks[:, 27:28] + FOOT_OFFSETS * mirror * self.body_scale
+        landmarks[:, [30, 32]] = landmarks[:, 28:29] + FOOT_OFFSETS * self.body_scale
+        if self.noise is not None:
+            landmarks += self.noise
+        return landmarks
+
+    def get_pose_result(self) -> PoseResult:
+        """Get the latest sample as a PoseLandmarkerResult-like object."""
+        self._advance()
+        return PoseResult([[Landmark(float(x), float(y), 0.0, 0.99, 0.99) for x, y in pose]
+                           for pose in self.landmarks])
+
+    def get_player_positions(self) -> List[List[float]]:
+        """Get normalized [x, y] coordinates of tracked landmarks.
+
+        Returns:
+            List of [x, y] coordinates for tracked landmarks.
+        """
+        self._advance()
+        return self.hitboxes.tolist()
+
+    def get_hitbox_positions(self) -> np.ndarray:
+        """Tracked landmark positions as a read-only (N, 2) array, without list conversion."""
+        self._advance()
+        return self.hitboxes
+
+    def get_full_pose_data(self) -> List[Dict[str, Any]]:
+        """Get full pose data for all synthetic players.
+
+        Returns:
+            List of dictionaries containing pose data (head, hands, feet, body).
+        """
+        result = self.get_pose_result()
+        return [structure_pose_landmarks(pose_landmarks) for pose_landmarks in result.pose_landmarks]
+
+    def get_latest_timing(self) -> Optional[Dict[str, float]]:
+        """Get timestamps of the latest sample (capture equals generation time)."""
+        return dict(self.latest_timing) if self.latest_timing else None
+
+    def get_frame(self) -> Optional[np.ndarray]:
+        """Render the synthetic climbers as a stick-figure camera frame."""
+        frame = np.zeros((self.camera_height, self.camera_width, 3), dtype=np.uint8)
+        scale = np.array([self.camera_width, self.camera_height])
+        for pose in (self.landmarks * scale).astype(np.int32):
+            for idx in (0, 11, 12, 15, 16, 23, 24, 27, 28):
+                cv2.circle(frame, tuple(int(v) for v in pose[idx]), 8, (255, 255, 255), -1)
+        return frame
+
+    def get_latest_frame(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Get (seq, frame) for the current sample, rendering the frame only once per sample."""
+        if self.latest_frame[0] != self.frame_seq:
+            self.latest_frame = (self.frame_seq, self.get_frame())
+        return self.latest_frame
+
+    def release(self) -> None:
+        """Stop generating samples."""
+        self.running = False
@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+import cv2
+import numpy as np
+from queue import Queue, Empty, Full
+from typing import Dict, Optional
+
+DEFAULT_CODEC = 'MJPG'  # Software codec available in every OpenCV build, readable by cv2.VideoCapture
+DEFAULT_QUEUE_SIZE = 30  # About one second of frames at 30 FPS
+DEFAULT_SEGMENT_BYTES = 1024 * 1024 * 1024
+DEFAULT_SEGMENT_SECONDS = 600.0
+SIZE_CHECK_INTERVAL = 30  # Frames between file size checks
+
+
+class VideoRecorder:
+    """Writes camera frames to rotating video segments from a dedicated thread.
+
+    submit() never blocks the capture loop: frames go through a bounded queue and
+    are dropped (and counted) when the writer falls behind.
+    """
+    def __init__(self, directory: str, fps: float = 30.0, codec: str = DEFAULT_CODEC,
+                 max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 max_segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, prefix: str = 'session'):
+        """Configure the recorder.
+
+        Args:
+            directory: Output directory, created if missing.
+            fps: Frame rate written to the video files.
+            codec: FourCC of the software codec.
+            max_segment_bytes: Start a new segment once a file reaches this size.
+            max_segment_seconds: Start a new segment after this much video.
+            queue_size: Frames buffered before new frames are dropped.
+            prefix: File name prefix of the segments.
+        """
+        self.directory = directory
+        self.fps = fps
+        self.fourcc = cv2.VideoWriter_fourcc(*codec)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_frames = max(1, int(max_segment_seconds * fps))
+        self.queue = Queue(maxsize=queue_size)
+        self.prefix = prefix
+        self.writer = None
+        self.segment_path = None
+        self.segment_frames = 0
+        self.segments = []
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.bytes_written = 0
+        self.write_time = 0.0
+        self.running = False
+        self.start_time = None
+        self.thread = None
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self.running = True
+        self.start_time = time.time()
+        self.thread = threading.Thread(target=self._write_loop, daemon=True)
+        self.thread.start()
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """Queue a frame for writing without blocking.
+
+        Returns:
+            False if the queue was full and the frame was dropped.
+        """
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except Full:
+            self.frames_dropped += 1
+            return False
+
+    def _open_segment(self, frame: np.ndarray) -> None:
+        """Close the current segment and open a new one sized for the frame."""
+        self._close_segment()
+        name = f"{self.prefix}_{time.strftime('%Y%m%d_%H%M%S')}_{len(self.segments):03d}.avi"
+        self.segment_path = os.path.join(self.directory, name)
+        height, width = frame.shape[:2]
+        writer = cv2.VideoWriter(self.segment_path, self.fourcc, self.fps, (width, height))
+        if not writer.isOpened():
+            writer.release()
+            raise RuntimeError(f"Cannot open video writer for {self.segment_path}")
+        self.writer = writer
+        self.segments.append(self.segment_path)
+        self.segment_frames = 0
+
+    def _close_segment(self) -> None:
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+            self.bytes_written += self._segment_size()
+
+    def _segment_size(self) -> int:
+        """Size of the current segment file in bytes, 0 if it does not exist."""
+        try:
+            return os.path.getsize(self.segment_path) if self.segment_path else 0
+        except OSError:
+            return 0
+
+    def _needs_rotation(self, frame: np.ndarray) -> bool:
+        if self.writer is None or self.segment_frames >= self.max_segment_frames:
+            return True
+        if self.segment_frames % SIZE_CHECK_INTERVAL == 0:
+            return self._segment_size() >= self.max_segment_bytes
+        return False
+
+    def _write_loop(self) -> None:
+        """Write queued frames until stopped, closing the last segment when done."""
+        try:
+            self._drain()
+        finally:
+            self._close_segment()
+
+    def _drain(self) -> None:
+        while self.running or not self.queue.empty():
+            try:
+                frame = self.queue.get(timeout=0.1)
+            except Empty:
+                continue
+            try:
+                start = time.perf_counter()
+                if self._needs_rotation(frame):
+                    self._open_segment(frame)
+                self.writer.write(frame)
+                self.write_time += time.perf_counter() - start
+                self.segment_frames += 1
+                self.frames_written += 1
+            except Exception as e:
+                print(f"Error writing video frame: {e}")
+                time.sleep(0.1)
+
+    def stats(self) -> Dict[str, float]:
+        """Recording statistics: frame counts, drop count and write throughput."""
+        elapsed = max(1e-9, time.time() - self.start_time) if self.start_time else 1e-9
+        current_bytes = self._segment_size() if self.writer is not None else 0
+        total_bytes = self.bytes_written + current_bytes
+        return {
+            'frames_written': self.frames_written,
+            'frames_dropped': self.frames_dropped,
+            'segments': len(self.segments),
+            'write_fps': self.frames_written / elapsed,
+            'encode_ms_per_frame': self.write_time / self.frames_written * 1000 if self.frames_written else 0.0,
+            'mb_per_sec': total_bytes / elapsed / 1e6,
+        }
+
+    def stop(self) -> Optional[Dict[str, float]]:
+        """Write buffered frames, close the current segment and report statistics.
+
+        The writer thread owns the cv2.VideoWriter and releases it after its last write,
+        so a join timeout leaves it finishing in the background instead of racing a release.
+        """
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=5.0)
+            if self.thread.is_alive():
+                print(f"Video recording {self.directory} is still writing {self.queue.qsize()} buffered frames")
+                return None
+        stats = self.stats() if self.start_time else None
+        if stats:
+            print(f"Video recording saved to {self.directory}: {stats['frames_written']} frames, "
+                  f"{stats['frames_dropped']} dropped, {stats['segments']} segments, "
+                  f"{stats['write_fps']:.1f} fps, {stats['mb_per_sec']:.2f} MB/s")
+        return stats
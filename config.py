@@ -1,6 +1,21 @@
 import math
 
-FPS = 60
+FPS = 60  # 렌더링 주사율
+PHYSICS_HZ = 120  # 물리 시뮬레이션 고정 주기 (Hz)
+MAX_PHYSICS_STEPS = 8  # 한 프레임에서 따라잡을 최대 물리 스텝 수
+POSE_INTERPOLATION = True  # 물리 스텝마다 포즈 위치를 보간/외삽
+POSE_MAX_EXTRAPOLATION = 0.05  # 마지막 포즈 이후 최대 외삽 시간 (초)
+POSE_INTERPOLATION_DELAY = None  # 두 포즈 샘플 사이를 보간하도록 늦추는 시간 (초, None이면 측정한 포즈 지연)
+VSYNC = False  # 화면 주사율 동기화 (지원되지 않으면 프레임 스케줄러로 대체)
+DIRTY_RECTS = True  # 바뀐 영역만 화면 갱신 (화면 흔들림/카메라 뷰 중에는 전체 갱신)
+RENDER_SCALE = 1.0  # 내부 렌더링 해상도 배율 (1.0 미만이면 작은 캔버스에 그려 화면 크기로 확대)
+RENDER_SCALE_AUTO = False  # 그리기 시간(화면 표시 대기 제외)에 맞춰 배율 자동 조정
+RENDER_SCALE_MIN = 0.5  # 자동 조정 최소 배율
+RENDER_BUDGET = 0.5  # 렌더링에 허용하는 프레임 시간 비율 (나머지는 물리/포즈 처리 몫)
+PROJECTOR_WARP = False  # 렌더링 화면을 PROJECTOR_KEYSTONE으로 키스톤 보정해 출력
+# 보정 후 화면 네 모서리가 놓일 출력 위치 (좌상, 우상, 우하, 좌하 순서, 디스플레이 크기 대비 0~1 비율)
+# 벽에 비친 화면이 직사각형이 되도록 프로젝터 출력에서 모서리를 안쪽으로 옮겨 맞춤
+PROJECTOR_KEYSTONE = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0))
 
 MAGNIFY_WALL_RATIO = 1.5
 MAGNIFY_FOCUS_RATIO = (MAGNIFY_WALL_RATIO - 1) * 0.5
@@ -3,12 +3,16 @@ import pygame
 import time
 import numpy as np
 from game.physics import Physics
+from game.multiball import MultiBallPhysics
 from game.renderer import Renderer
-from config import FPS, WIDTH_ADJUST_STEP, HEIGHT_ADJUST_STEP, FOCUS_ADJUST_STEP
+from game.scheduler import FrameScheduler
+from camera.pose_interpolator import PoseInterpolator
+from config import FPS, PHYSICS_HZ, MAX_PHYSICS_STEPS, POSE_INTERPOLATION, POSE_MAX_EXTRAPOLATION, \
+    POSE_INTERPOLATION_DELAY, WIDTH_ADJUST_STEP, HEIGHT_ADJUST_STEP, FOCUS_ADJUST_STEP
 
 # 상수 정의
 MIN_WALL_SIZE = 0.1  # 최소 벽 크기 (미터)
-FRAME_TIME = 1 / FPS  # 프레임당 시간 (초)
+PHYSICS_DT = 1 / PHYSICS_HZ  # 물리 스텝 시간 (초)
 DEBOUNCE_TIME = 0.1  # 키 입력 디바운스 시간 (초)
 
 # 키 바인딩 정의
@@ -90,14 +94,18 @@ class InputHandler:
 
 class Game:
     """게임의 주요 로직을 관리하는 클래스"""
-    def __init__(self, camera, homography: np.ndarray):
-        """게임 구성 요소 초기화"""
+    def __init__(self, camera, homography: np.ndarray, num_balls: int = 1):
+        """게임 구성 요소 초기화 (num_balls > 1이면 멀티볼 모드)"""
         try:
             self.camera = camera  # 카메라 객체
-            self.physics = Physics()  # 물리 엔진
+            self.physics = MultiBallPhysics(num_balls) if num_balls > 1 else Physics()  # 물리 엔진
             self.renderer = Renderer(homography, camera)  # 렌더러
-            self.clock = pygame.time.Clock()  # 프레임 제어용 클럭
+            self.scheduler = FrameScheduler(FPS, vsync=self.renderer.vsync)  # 프레임 페이싱
             self.input_handler = InputHandler(self)  # 입력 핸들러
+            self.accumulator = 0.0  # 아직 시뮬레이션하지 않은 실제 경과 시간
+            # 카메라의 포즈 기록을 물리 스텝 시각으로 보간하는 계층 (사람마다 고정 슬롯, 미검출은 NaN)
+            self.pose_interpolator = PoseInterpolator(camera, POSE_MAX_EXTRAPOLATION, POSE_INTERPOLATION_DELAY) \
+                if POSE_INTERPOLATION else None
             self.camera.start_processing()  # Start pose processing thread
         except Exception as e:
             print(f"게임 초기화 중 오류: {e}")
@@ -107,25 +115,58 @@ class Game:
         """Pygame 초기 설정"""
         pygame.init()
 
-    def update_loop(self):
-        """게임 상태 업데이트 및 렌더링"""
+    def update_loop(self, frame_dt: float):
+        """경과 시간만큼 고정 스텝 물리를 진행하고 보간된 상태로 렌더링"""
         try:
-            player_positions = self.camera.get_player_positions()  # 플레이어 위치 가져오기
-            self.physics.update(player_positions, FRAME_TIME)  # 물리 엔진 업데이트
+            now = time.time()
+            if self.pose_interpolator:
+                self.pose_interpolator.update()  # 새 포즈 결과 확인 및 포즈 지연 측정
+            else:
+                player_positions = self.camera.get_player_positions()  # 플레이어 위치 가져오기
+
+            # 고정 스텝 물리 업데이트 (부하 시에도 게임 속도 유지, 따라잡기 스텝 수 제한)
+            self.accumulator += frame_dt
+            tick_time = now - self.accumulator  # 아직 시뮬레이션하지 않은 구간의 시작 시각
+            steps = 0
+            goal_scored = False  # 이번 프레임의 물리 스텝 중 한 번이라도 골이 났는지
+            while self.accumulator >= PHYSICS_DT and steps < MAX_PHYSICS_STEPS:
+                tick_time += PHYSICS_DT
+                if self.pose_interpolator:
+                    player_positions = self.pose_interpolator.positions_at(tick_time)  # 스텝 시각(보간 지연 적용)의 히트박스 위치
+                self.physics.update(player_positions, PHYSICS_DT)
+                goal_scored = goal_scored or self.physics.goal_scored
+                self.accumulator -= PHYSICS_DT
+                steps += 1
+            if self.accumulator >= PHYSICS_DT:
+                self.accumulator %= PHYSICS_DT  # 따라잡지 못한 시간은 버림 (나선형 지연 방지)
+            self.physics.update_ball_trail()  # 궤적은 물리 스텝이 아닌 렌더링 프레임마다 기록
+
+            if self.pose_interpolator:
+                positions = self.pose_interpolator.positions_at(now)
+                player_positions = positions[~np.isnan(positions).any(axis=1)].tolist()
+
             self.renderer.render(
                 self.physics.ball_pos,  # 공 위치
                 player_positions,       # 플레이어 위치
                 self.physics.score,     # 점수
-                self.physics.goal_scored,  # 골 여부
-                self.physics.ball_trail  # 공 궤적
+                goal_scored,            # 골 여부
+                self.physics.ball_trail.view(),  # 공 궤적
+                self.physics.prev_ball_pos,  # 직전 공 위치 (보간용)
+                self.accumulator / PHYSICS_DT  # 보간 비율
             )
+            self._record_pose_age()
         except Exception as e:
             print(f"업데이트 루프 중 오류: {e}")
 
+    def _record_pose_age(self):
+        """렌더링 시점의 포즈 나이(캡처 → 화면 적용) 기록"""
+        timing = self.camera.get_latest_timing() if hasattr(self.camera, 'get_latest_timing') else None
+        if timing and 'capture' in timing:
+            self.camera.latency.record('capture_to_render', time.time() - timing['capture'])
+
     def main(self):
         """Pyodide 호환을 위한 메인 게임 루프"""
         self.setup()
-        last_update_time = time.time()
 
         while True:
             try:
@@ -135,16 +176,11 @@ class Game:
                         self.cleanup()
                         return
 
-                # 프레임 시간 제어
-                current_time = time.time()
-                dt = current_time - last_update_time
-                if dt < FRAME_TIME:
-                    continue
-                last_update_time = current_time
+                # 다음 프레임 마감까지 대기 (vsync 사용 시 flip이 대기)
+                dt = self.scheduler.wait()
 
                 # 게임 상태 업데이트 및 렌더링
-                self.update_loop()
-                self.clock.tick(FPS)
+                self.update_loop(dt)
 
             except Exception as e:
                 print(f"메인 루프 중 오류: {e}")
@@ -152,6 +188,9 @@ class Game:
     def cleanup(self):
         """리소스 정리"""
         try:
+            if hasattr(self.camera, 'latency'):
+                print(f"지연 시간 통계:\n{self.camera.latency.format_summary()}")
+            print(f"프레임 통계: {self.scheduler.format_summary()}")
             self.camera.release()  # 카메라 리소스 해제
             self.renderer.quit()   # 렌더러 종료
             pygame.quit()          # Pygame 종료
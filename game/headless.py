@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+헤드리스 시뮬레이션 실행기
+화면, 오디오, 카메라 없이 가상 플레이어(SyntheticCamera)와 물리 엔진을 가상 시계로 고정 스텝 실행합니다.
+시드가 같으면 결과가 항상 같으므로 게임플레이 변경의 벤치마크와 회귀 테스트에 사용할 수 있습니다.
+
+사용 예:
+    python -m game.headless --duration 600 --bots 2 --seed 1
+"""
+
+import argparse
+import contextlib
+import hashlib
+import os
+import random
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+from camera.synthetic import SyntheticCamera
+from config import PHYSICS_HZ
+from game.multiball import MultiBallPhysics
+from game.physics import Physics
+from util.clock import VirtualClock
+
+
+def run_headless(duration: float, bots: int = 2, bot_mode: str = 'chase', seed: int = 0,
+                 num_balls: int = 1, physics_hz: float = PHYSICS_HZ) -> Dict[str, Any]:
+    """가상 시간 duration초 동안 시뮬레이션하고 결과 요약 반환
+
+    Args:
+        duration: 시뮬레이션할 게임 시간 (초).
+        bots: 가상 플레이어 수.
+        bot_mode: 가상 플레이어 움직임 방식 ('chase', 'random_walk').
+        seed: 가상 플레이어와 물리 엔진의 난수 시드.
+        num_balls: 공 개수 (2 이상이면 멀티볼 물리).
+        physics_hz: 물리 스텝 주기 (Hz).
+    """
+    clock = VirtualClock()
+    if num_balls > 1:
+        physics = MultiBallPhysics(num_balls, seed=seed, audio=False)
+        ball_provider = physics.lead_ball
+    else:
+        physics = Physics(rng=random.Random(seed), audio=False)
+        ball_provider = lambda: physics.ball_pos
+    camera = None
+    if bots > 0:
+        # 물리에는 히트박스 점만 필요하므로 전체 랜드마크와 포즈 기록은 만들지 않음
+        camera = SyntheticCamera(num_players=bots, mode=bot_mode, seed=seed, clock=clock,
+                                 ball_provider=ball_provider, hitboxes_only=True)
+        camera.start_processing()
+
+    dt = 1 / physics_hz
+    steps = int(round(duration * physics_hz))
+    no_players = np.empty((0, 2))
+    start = time.perf_counter()
+    for _ in range(steps):
+        clock.advance(dt)
+        physics.update(camera.get_hitbox_positions() if camera else no_players, dt)
+    wall_time = time.perf_counter() - start
+    if camera:
+        camera.release()
+
+    # 최종 상태 요약값 (회귀 비교용)
+    state = np.concatenate([np.ravel(physics.ball_pos), np.ravel(physics.ball_vel), physics.score])
+    return {
+        'sim_time': steps * dt,
+        'steps': steps,
+        'wall_time': wall_time,
+        'speedup': steps * dt / wall_time if wall_time > 0 else float('inf'),
+        'score': list(physics.score),
+        'hits': physics.hits,
+        'digest': hashlib.sha1(np.round(state, 9).tobytes()).hexdigest()[:12],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 결정적 게임 시뮬레이션")
+    parser.add_argument('--duration', type=float, default=600.0, help="시뮬레이션할 게임 시간 (초)")
+    parser.add_argument('--bots', type=int, default=2, help="가상 플레이어 수")
+    parser.add_argument('--bot-mode', choices=['chase', 'random_walk'], default='chase',
+                        help="가상 플레이어 움직임 방식")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    parser.add_argument('--balls', type=int, default=1, help="공 개수")
+    parser.add_argument('--physics-hz', type=float, default=PHYSICS_HZ, help="물리 스텝 주기 (Hz)")
+    parser.add_argument('--verbose', action='store_true', help="물리 엔진 로그 출력")
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        if not args.verbose:
+            stack.enter_context(contextlib.redirect_stdout(open(os.devnull, 'w')))
+        result = run_headless(args.duration, args.bots, args.bot_mode, args.seed, args.balls, args.physics_hz)
+
+    print(f"게임 시간 {result['sim_time']:.1f}초 ({result['steps']} 스텝), 실제 {result['wall_time']:.2f}초 "
+          f"(x{result['speedup']:.0f})")
+    print(f"점수 {result['score'][0]} : {result['score'][1]}, 타격 {result['hits']}회, 상태 요약 {result['digest']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import numpy as np
+import config
+from typing import Optional
+from config import INITIAL_BALL_SPEED_SCALE, BALL_SPEED_SCALE, ROUND_END_DELAY
+from game.physics import MAX_SCREEN, SpatialHash, load_sounds, swept_circle_hits
+from util.ring_buffer import RingBuffer
+
+# 상수 정의
+HIT_COOLDOWN = 0.3  # 플레이어에 맞은 공이 다시 충돌 판정을 받기까지의 시간 (초)
+SPEED_UP_PER_HIT = 1.1  # 충돌마다 공 속도 배율 증가
+BROADPHASE_MIN_PAIRS = 1024  # (공 x 점) 쌍이 이보다 많으면 공간 해시로 후보를 줄임
+MIN_CELL_SIZE = 0.05  # 공간 해시 최소 셀 크기 (정규화 좌표)
+
+
+class MultiBallPhysics:
+    """여러 개의 공을 구조체 배열(SoA) 형태의 NumPy 배열로 관리하는 물리 엔진
+
+    공마다 위치/속도/속도 배율/충돌 쿨다운/마지막으로 친 플레이어를 배열로 보관하고,
+    이동, 벽 반사, 골 판정, 플레이어 충돌을 모두 배열 연산으로 처리합니다.
+    골이 들어간 공은 위치가 NaN이 되어 ROUND_END_DELAY 뒤 중앙에서 다시 나옵니다.
+    Physics와 같은 update/score/goal_scored/ball_pos/prev_ball_pos 인터페이스를 제공합니다.
+    """
+    def __init__(self, num_balls: int, seed: Optional[int] = None, broadphase: Optional[bool] = None,
+                 audio: bool = True):
+        """물리 엔진 초기화
+
+        Args:
+            num_balls: 공 개수.
+            seed: 난수 시드 (고정하면 결정적으로 재현 가능).
+            broadphase: 공간 해시 사용 여부, None이면 쌍 개수로 자동 선택.
+            audio: False면 믹서를 초기화하지 않음 (헤드리스 실행용).
+        """
+        self.num_balls = num_balls
+        self.broadphase = broadphase
+        self.spatial_hash = SpatialHash(MIN_CELL_SIZE)
+        self.rng = np.random.default_rng(seed)
+        self.ball_pos = np.zeros((num_balls, 2))  # 공 위치 (비활성 공은 NaN)
+        self.ball_vel = np.zeros((num_balls, 2))  # 공 속도
+        self.speed_multiplier = np.ones(num_balls)  # 공별 속도 배율
+        self.cooldown = np.zeros(num_balls)  # 남은 충돌 무시 시간 (초)
+        self.owner = np.full(num_balls, -1)  # 마지막으로 친 플레이어 (-1: 없음)
+        self.respawn_time = np.full(num_balls, np.nan)  # 재등장 시각 (활성 공은 NaN)
+        self.prev_ball_pos = self.ball_pos.copy()
+        self.prev_player_positions = None
+        self.ball_trail = RingBuffer(1, (2,))  # 궤적은 단일 공 모드에서만 표시
+        self.score = [0, 0]
+        self.goal_scored = False
+        self.sim_time = 0.0
+        self.hits = 0
+        self.collision_sound, self.score_sound = load_sounds() if audio else (None, None)
+        self.reset_game()
+
+    @property
+    def active(self) -> np.ndarray:
+        """경기 중인 공 마스크"""
+        return np.isnan(self.respawn_time)
+
+    def _launch(self, mask: np.ndarray) -> None:
+        """mask에 해당하는 공을 중앙에서 임의 방향으로 출발"""
+        count = int(mask.sum())
+        speed = INITIAL_BALL_SPEED_SCALE * self.speed_multiplier[mask]
+        self.ball_pos[mask] = MAX_SCREEN / 2
+        self.ball_vel[mask, 0] = self.rng.choice([-1.0, 1.0], count) * speed
+        self.ball_vel[mask, 1] = self.rng.uniform(-0.5, 0.5, count) * speed
+        self.prev_ball_pos[mask] = self.ball_pos[mask]
+        self.cooldown[mask] = 0.0
+        self.owner[mask] = -1
+        self.respawn_time[mask] = np.nan
+
+    def update(self, player_positions, dt: float, radii=None, owners=None) -> None:
+        """모든 공의 물리 상태를 dt만큼 진행 (인자는 Physics.update와 동일)"""
+        try:
+            self.sim_time += dt
+            self.prev_ball_pos = self.ball_pos.copy()
+            self.goal_scored = False  # 이번 스텝에 새 골이 났을 때만 True (재등장 대기는 respawn_time)
+
+            # 재등장 시각이 된 공 다시 출발
+            respawn = self.respawn_time <= self.sim_time
+            if respawn.any():
+                self._launch(respawn)
+
+            player_positions = np.asarray(player_positions, dtype=float).reshape(-1, 2)
+            prev_positions = self.prev_player_positions
+            if prev_positions is None or prev_positions.shape != player_positions.shape:
+                prev_positions = player_positions
+            self.prev_player_positions = player_positions
+
+            self.cooldown = np.maximum(self.cooldown - dt, 0.0)
+            hit_t = self._find_player_hits(prev_positions, player_positions, dt, radii, owners)
+
+            # 충돌한 공은 충돌 시각까지 이동 후 반사, 나머지 시간은 새 속도로 이동
+            hit = np.isfinite(hit_t)
+            first = np.where(hit, hit_t, 1.0)[:, None]
+            self.ball_pos += self.ball_vel * dt * first
+            if hit.any():
+                self._bounce_off_players(hit)
+                self.ball_pos[hit] += self.ball_vel[hit] * dt * (1.0 - first[hit])
+
+            self._handle_walls_and_goals()
+        except Exception as e:
+            print(f"멀티볼 물리 업데이트 중 오류: {e}")
+
+    def _find_player_hits(self, prev_positions: np.ndarray, player_positions: np.ndarray, dt: float,
+                          radii=None, owners=None) -> np.ndarray:
+        """공별 첫 충돌 비율 (N,) 계산 (충돌 없음/쿨다운/비활성은 inf), 충돌한 공의 owner 갱신"""
+        hit_t = np.full(self.num_balls, np.inf)
+        candidates = np.flatnonzero(self.active & (self.cooldown <= 0))
+        num_points = len(player_positions)
+        if num_points == 0 or len(candidates) == 0:
+            return hit_t
+
+        point_radii = np.broadcast_to(config.BALL_RADIUS_RATIO if radii is None else
+                                      np.asarray(radii, dtype=float), (num_points,))
+        point_delta = player_positions - prev_positions
+        ball_delta = self.ball_vel[candidates] * dt
+
+        use_hash = self.broadphase
+        if use_hash is None:
+            use_hash = len(candidates) * num_points >= BROADPHASE_MIN_PAIRS
+        if use_hash:
+            # 빈 히트박스 슬롯(NaN)은 충돌할 수 없으므로 해시와 반경 계산에서 제외
+            tracked = np.isfinite(prev_positions).all(axis=1) & np.isfinite(point_delta).all(axis=1)
+            if not tracked.any():
+                return hit_t
+            # 한 스텝 안에 닿을 수 있는 최대 거리보다 셀을 크게 잡아 3x3 셀 후보만 검사
+            reach = (point_radii[tracked].max() + np.sqrt((ball_delta ** 2).sum(axis=1)).max()
+                     + np.sqrt((point_delta[tracked] ** 2).sum(axis=1)).max())
+            self.spatial_hash.build(np.where(tracked[:, None], prev_positions, np.nan), max(MIN_CELL_SIZE, reach))
+            ball_index, point_index = self.spatial_hash.query_pairs(self.ball_pos[candidates])
+        else:
+            # (공 x 점) 전체 쌍
+            ball_index = np.repeat(np.arange(len(candidates)), num_points)
+            point_index = np.tile(np.arange(num_points), len(candidates))
+        if len(ball_index) == 0:
+            return hit_t
+
+        pair_t = swept_circle_hits(self.ball_pos[candidates][ball_index] - prev_positions[point_index],
+                                   ball_delta[ball_index] - point_delta[point_index],
+                                   point_radii[point_index])
+
+        # 공별로 가장 이른 충돌 쌍 선택
+        order = np.lexsort((pair_t, ball_index))
+        ball_index, point_index, pair_t = ball_index[order], point_index[order], pair_t[order]
+        first = np.flatnonzero(np.r_[True, ball_index[1:] != ball_index[:-1]])
+        hit_balls = candidates[ball_index[first]]
+        hit_t[hit_balls] = pair_t[first]
+        if owners is not None:
+            found = np.isfinite(pair_t[first])
+            self.owner[hit_balls[found]] = np.asarray(owners)[point_index[first][found]]
+        return hit_t
+
+    def _bounce_off_players(self, hit: np.ndarray) -> None:
+        """플레이어에 맞은 공을 반대편으로 보내고 속도 배율 증가"""
+        count = int(hit.sum())
+        self.speed_multiplier[hit] *= SPEED_UP_PER_HIT
+        speed = BALL_SPEED_SCALE * self.speed_multiplier[hit]
+        direction = np.where(self.ball_pos[hit, 0] > MAX_SCREEN / 2, -1.0, 1.0)
+        self.ball_vel[hit, 0] = direction * speed
+        self.ball_vel[hit, 1] = self.rng.uniform(-0.5, 0.5, count) * speed
+        self.cooldown[hit] = HIT_COOLDOWN
+        self.hits += count
+        if self.collision_sound:
+            self.collision_sound.play()
+
+    def _handle_walls_and_goals(self) -> None:
+        """상하 벽 반사(경계 기준 거울 반사)와 좌우 골 판정"""
+        bottom = config.BALL_RADIUS_RATIO
+        top = MAX_SCREEN - config.BALL_RADIUS_RATIO
+        y = self.ball_pos[:, 1]
+        below = (y < bottom) & (self.ball_vel[:, 1] < 0)
+        above = (y > top) & (self.ball_vel[:, 1] > 0)
+        self.ball_pos[below, 1] = 2 * bottom - y[below]
+        self.ball_pos[above, 1] = 2 * top - y[above]
+        self.ball_vel[below | above, 1] *= -1
+
+        x = self.ball_pos[:, 0]
+        left_goal = x < 0
+        right_goal = x > MAX_SCREEN
+        goals = left_goal | right_goal
+        if goals.any():
+            self.score[1] += int(left_goal.sum())  # 왼쪽 골 -> 오른쪽 플레이어 득점
+            self.score[0] += int(right_goal.sum())
+            self.ball_pos[goals] = np.nan
+            self.ball_vel[goals] = 0.0
+            self.respawn_time[goals] = self.sim_time + ROUND_END_DELAY
+            self.goal_scored = True
+            if self.score_sound:
+                self.score_sound.play()
+
+    def update_ball_trail(self) -> None:
+        """궤적은 단일 공 모드에서만 표시하므로 기록하지 않음 (Physics와 인터페이스를 맞추기 위한 메서드)"""
+
+    def lead_ball(self) -> Optional[np.ndarray]:
+        """골 라인에 가장 가까운 활성 공 위치 (가상 플레이어 추적용)"""
+        active = np.flatnonzero(self.active)
+        if len(active) == 0:
+            return None
+        edge_distance = np.minimum(self.ball_pos[active, 0], MAX_SCREEN - self.ball_pos[active, 0])
+        return self.ball_pos[active[np.argmin(edge_distance)]]
+
+    def reset_game(self) -> None:
+        """게임 전체를 재시작"""
+        self.score = [0, 0]
+        self.speed_multiplier[:] = 1.0
+        self.goal_scored = False
+        self._launch(np.ones(self.num_balls, dtype=bool))
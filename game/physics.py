@@ -1,8 +1,10 @@
+import math
 import numpy as np
 import random
 import config
+from typing import Any, Dict, Optional
+from util.ring_buffer import RingBuffer
 from config import INITIAL_BALL_SPEED_SCALE, BALL_SPEED_SCALE, ROUND_END_DELAY
-import time
 import pygame
 
 # 상수 정의
@@ -10,57 +12,262 @@ MAX_SCREEN = 1  # 화면 크기 기준 (정규화된 좌표)
 BALL_TRAIL_LENGTH = 60  # 공 궤적 최대 길이
 COLLISION_SOUND_PATH = 'assets/369515__lefty_studios__jumping-sfx.wav'  # 충돌 사운드 파일 경로
 SCORE_SOUND_PATH = 'assets/33308__erlingx__time.wav'
+MAX_WALL_BOUNCES = 4  # 한 스텝에서 처리할 최대 벽 반사 횟수
+
+
+def swept_circle_hit(start: np.ndarray, delta: np.ndarray, radius: float) -> Optional[float]:
+    """상대 위치 start에서 delta만큼 이동하는 점이 원점 중심 반지름 radius 원에 처음 닿는 비율 t (0~1)
+
+    공과 히트박스가 한 스텝 동안 각각 직선으로 움직인다고 보고, 두 원의 상대 운동으로 계산합니다.
+    처음부터 겹쳐 있으면 0, 스텝 안에 닿지 않으면 None을 반환합니다.
+    """
+    t = swept_circle_hits(np.reshape(start, (1, 2)), np.reshape(delta, (1, 2)), radius)[0]
+    return float(t) if np.isfinite(t) else None
+
+
+def swept_circle_hits(starts: np.ndarray, deltas: np.ndarray, radii) -> np.ndarray:
+    """swept_circle_hit의 벡터화 버전: (N,2) 상대 위치/이동량에 대한 (N,) 충돌 비율 (닿지 않으면 inf)
+
+    radii는 스칼라 또는 점별 반지름 (N,) 배열입니다.
+    """
+    c = np.einsum('ij,ij->i', starts, starts) - np.square(radii)
+    a = np.einsum('ij,ij->i', deltas, deltas)
+    b = np.einsum('ij,ij->i', starts, deltas)
+    disc = b * b - a * c
+    approaching = (a > 0) & (b < 0) & (disc >= 0)  # 다가오면서 궤적이 원을 지나는 점만
+    # 마스크 인덱싱과 errstate 없이 전체를 계산하고 해당하지 않는 점만 inf로 (작은 N에서 호출 비용이 지배적)
+    t = (-b - np.sqrt(np.maximum(disc, 0.0))) / np.where(approaching, a, 1.0)
+    t[~approaching | (t > 1)] = np.inf
+    t[c <= 0] = 0.0  # 처음부터 겹침
+    return t
+
+
+class SpatialHash:
+    """균일 격자 공간 해시 (브로드 페이즈)
+
+    매 스텝 점들의 격자 셀 키를 정렬해 두고, 질의 위치 주변 3x3 셀의 구간을 searchsorted로 찾아
+    가까운 (질의, 점) 후보 쌍만 반환합니다. 셀 크기가 질의 반경 이상이어야 누락이 없습니다.
+    NaN 등 유한하지 않은 점(빈 히트박스 슬롯)과 질의 위치는 해시에 넣지 않고 후보도 만들지 않습니다.
+    """
+    KEY_OFFSET = 1 << 20  # 음수 셀 좌표를 양수 키로 만들기 위한 오프셋
+    NEIGHBORS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.sorted_keys = np.empty(0, dtype=np.int64)
+        self.order = np.empty(0, dtype=np.int64)
+
+    def _keys(self, cells: np.ndarray) -> np.ndarray:
+        return (cells[..., 0] + self.KEY_OFFSET) * (2 * self.KEY_OFFSET) + (cells[..., 1] + self.KEY_OFFSET)
+
+    def build(self, points: np.ndarray, cell_size: Optional[float] = None) -> None:
+        """(M,2) 점으로 해시 재구성 (유한하지 않은 점 제외, 인덱스는 입력 기준 유지)"""
+        if cell_size is not None:
+            self.cell_size = cell_size
+        finite = np.flatnonzero(np.isfinite(points).all(axis=1))
+        keys = self._keys(np.floor(points[finite] / self.cell_size).astype(np.int64))
+        order = np.argsort(keys, kind='stable')
+        self.order = finite[order]
+        self.sorted_keys = keys[order]
+
+    def query_pairs(self, positions: np.ndarray):
+        """(N,2) 질의 위치마다 주변 셀의 점 후보를 찾아 (질의 인덱스, 점 인덱스) 배열 쌍 반환"""
+        valid = np.isfinite(positions).all(axis=1)
+        cells = np.floor(np.where(valid[:, None], positions, 0.0) / self.cell_size).astype(np.int64)
+        keys = self._keys(cells[:, None, :] + self.NEIGHBORS[None, :, :]).ravel()
+        starts = np.searchsorted(self.sorted_keys, keys, side='left')
+        counts = np.searchsorted(self.sorted_keys, keys, side='right') - starts
+        counts[np.repeat(~valid, len(self.NEIGHBORS))] = 0
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        query_index = np.repeat(np.arange(len(keys)) // len(self.NEIGHBORS), counts)
+        # 각 셀 구간 [start, start + count)를 펼친 정렬 위치
+        run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        point_index = self.order[np.repeat(starts, counts) + run_offsets]
+        return query_index, point_index
+
+
+class BallTrajectory:
+    """벽 반사를 접어서(reflection folding) 계산하는 공의 해석적 궤적
+
+    상하 벽 사이에서 반사되는 y 운동을 벽이 없는 직선 운동으로 펼쳐 두고, 질의할 때만 띠 폭의
+    두 배 주기로 다시 접습니다. 그래서 임의 시각의 위치, x/y 통과 시각, 골 시각을 반사 횟수와
+    무관하게 바로 계산하고, 반사 경로 전체는 O(반사 횟수)로 구합니다. 시각은 모두 시뮬레이션 시각(초)입니다.
+    """
+    def __init__(self, pos: np.ndarray, vel: np.ndarray, start_time: float, bottom: float, top: float):
+        self.origin = np.array(pos, dtype=float)
+        self.vel = np.array(vel, dtype=float)
+        self.start_time = start_time
+        self.bottom = bottom
+        self.height = top - bottom  # 반사 띠 폭
+
+    def _fold(self, unfolded_y):
+        """펼친 y 좌표를 벽 사이로 접기"""
+        u = np.mod(np.asarray(unfolded_y, dtype=float) - self.bottom, 2 * self.height)
+        return self.bottom + np.where(u <= self.height, u, 2 * self.height - u)
+
+    def position_at(self, t: float) -> np.ndarray:
+        """시각 t의 공 위치"""
+        elapsed = t - self.start_time
+        return np.array([self.origin[0] + self.vel[0] * elapsed,
+                         float(self._fold(self.origin[1] + self.vel[1] * elapsed))])
+
+    def time_at_x(self, x: float) -> Optional[float]:
+        """공이 x를 지나는 시각 (시작 이후에 지나지 않으면 None)"""
+        if self.vel[0] == 0:
+            return None
+        elapsed = (x - self.origin[0]) / self.vel[0]
+        return self.start_time + elapsed if elapsed >= 0 else None
+
+    def crossing_x(self, x: float):
+        """x를 지나는 (시각, 위치), 지나지 않으면 None"""
+        t = self.time_at_x(x)
+        return None if t is None else (t, self.position_at(t))
+
+    def time_at_y(self, y: float, after: Optional[float] = None) -> Optional[float]:
+        """after 이후 공이 처음 y를 지나는 시각 (골 이전에 지나지 않으면 None)"""
+        after = self.start_time if after is None else after
+        if self.vel[1] == 0:
+            return None
+        goal = self.goal()
+        end = goal[0] if goal else np.inf
+        # y로 접히는 펼친 좌표: y + 2kL 또는 (2*bottom - y) + 2kL
+        unfolded_now = self.origin[1] + self.vel[1] * (after - self.start_time)
+        period = 2 * self.height
+        best = None
+        for base in (y, 2 * self.bottom - y):
+            if self.vel[1] > 0:
+                k = np.ceil((unfolded_now - base) / period)
+            else:
+                k = np.floor((unfolded_now - base) / period)
+            t = self.start_time + (base + k * period - self.origin[1]) / self.vel[1]
+            if t <= end and (best is None or t < best):
+                best = t
+        return best
+
+    def goal(self):
+        """골 라인(x=0 또는 x=MAX_SCREEN) 통과 (시각, 위치, 득점 측 'left'/'right'), 없으면 None"""
+        if self.vel[0] == 0:
+            return None
+        line = 0.0 if self.vel[0] < 0 else float(MAX_SCREEN)
+        t = self.time_at_x(line)
+        if t is None:
+            return None
+        return t, self.position_at(t), 'right' if line == 0.0 else 'left'
+
+    def bounce_path(self, from_time: Optional[float] = None) -> np.ndarray:
+        """from_time 위치부터 벽 반사 지점들을 거쳐 골 지점까지의 (K,2) 경로"""
+        from_time = self.start_time if from_time is None else from_time
+        goal = self.goal()
+        points = [self.position_at(from_time)]
+        if goal is None:
+            return np.array(points)
+        if self.vel[1] != 0:
+            # 펼친 좌표에서 벽은 bottom + kL 위치에 있음
+            start_u = self.origin[1] + self.vel[1] * (from_time - self.start_time)
+            end_u = self.origin[1] + self.vel[1] * (goal[0] - self.start_time)
+            lo, hi = sorted(((start_u - self.bottom) / self.height, (end_u - self.bottom) / self.height))
+            walls = np.arange(np.floor(lo) + 1, np.ceil(hi))
+            if self.vel[1] < 0:
+                walls = walls[::-1]
+            for k in walls:
+                t = self.start_time + (self.bottom + k * self.height - self.origin[1]) / self.vel[1]
+                points.append(self.position_at(t))
+        points.append(goal[1])
+        return np.array(points)
+
+
+def load_sounds():
+    """Pygame 믹서 초기화 후 (충돌 사운드, 득점 사운드) 로드 (실패 시 None)"""
+    collision_sound = score_sound = None
+    try:
+        pygame.mixer.init()
+        collision_sound = pygame.mixer.Sound(COLLISION_SOUND_PATH)
+        score_sound = pygame.mixer.Sound(SCORE_SOUND_PATH)
+    except FileNotFoundError:
+        print(f"충돌 사운드 파일을 '{COLLISION_SOUND_PATH}'에서 찾을 수 없습니다. 나중에 추가해 주세요.")
+    except Exception as e:
+        print(f"오디오 초기화 중 오류: {e}")
+    return collision_sound, score_sound
+
 
 class Physics:
     """게임의 물리 엔진을 관리하는 클래스"""
-    def __init__(self):
-        """물리 엔진 초기화"""
+    def __init__(self, rng: Optional[random.Random] = None, audio: bool = True):
+        """물리 엔진 초기화
+
+        Args:
+            rng: 서브/반사 방향용 난수 생성기 (시드를 고정하면 결정적으로 재현 가능, 기본: 새 random.Random).
+            audio: False면 믹서를 초기화하지 않음 (헤드리스 실행용).
+        """
+        self.rng = rng or random.Random()
+        self.audio = audio
         self.score = [0, 0]  # 플레이어 점수 [왼쪽, 오른쪽]
         self.ignore_collisions = False  # 충돌 무시 플래그
         self.target_side = None  # 공이 향하는 목표 방향
         self.round_ended = False  # 라운드 종료 여부
         self.round_end_time = None  # 라운드 종료 시간
-        self.ball_trail = []  # 공 궤적 저장
+        self.ball_trail = RingBuffer(BALL_TRAIL_LENGTH, (2,))  # 공 궤적 저장 (view()로 순서대로 조회)
         self.goal_scored = False  # 골 이벤트 플래그
         self.collision_sound = None  # 충돌 사운드 객체
+        self.score_sound = None  # 득점 사운드 객체
+        self.hits = 0  # 플레이어가 공을 친 횟수
+        self.velocity_version = 0  # 반사 외의 속도 변경마다 증가 (궤적 캐시 무효화)
+        self._trajectory = None  # (velocity_version, BallTrajectory)
         self.speed_multiplier = 1.0  # 공 속도 배율
+        self.sim_time = 0.0  # 누적 시뮬레이션 시간 (초)
+        self.prev_player_positions = None  # 직전 스텝의 플레이어 위치 (스윕 충돌용)
+        self.last_hit_owner = None  # 마지막으로 공을 친 플레이어 (owners가 주어진 경우)
         self._init_audio()  # 오디오 초기화
         self.reset_ball()  # 공 초기화
 
     def _init_audio(self):
         """Pygame 믹서 및 충돌 사운드 초기화"""
-        try:
-            pygame.mixer.init()
-            self.collision_sound = pygame.mixer.Sound(COLLISION_SOUND_PATH)
-            self.score_sound = pygame.mixer.Sound(SCORE_SOUND_PATH)
-        except FileNotFoundError:
-            print(f"충돌 사운드 파일을 '{COLLISION_SOUND_PATH}'에서 찾을 수 없습니다. 나중에 추가해 주세요.")
-        except Exception as e:
-            print(f"오디오 초기화 중 오류: {e}")
+        if self.audio:
+            self.collision_sound, self.score_sound = load_sounds()
 
     def check_collision(self, ball_pos: np.ndarray, hit_pos: np.ndarray, hit_radius: float) -> bool:
         """공과 히트박스 간 충돌 감지"""
         try:
-            distance = np.linalg.norm(ball_pos - np.array(hit_pos))
-            return distance < hit_radius
+            diff = ball_pos - np.asarray(hit_pos, dtype=float)
+            return float(diff @ diff) < hit_radius * hit_radius
         except Exception as e:
             print(f"충돌 감지 중 오류: {e}")
             return False
 
-    def update(self, player_positions: list, dt: float) -> None:
-        """물리 상태 업데이트"""
+    def update(self, player_positions, dt: float, radii=None, owners=None) -> None:
+        """물리 상태를 dt만큼 진행 (고정 스텝으로 호출)
+
+        Args:
+            player_positions: 플레이어 히트박스 위치 (N,2) 배열 또는 [x, y] 리스트.
+            dt: 스텝 시간 (초).
+            radii: 점별 히트박스 반지름 (N,) (기본: BALL_RADIUS_RATIO).
+            owners: 점별 플레이어 번호 (N,), 충돌 시 last_hit_owner에 기록.
+        """
         try:
+            self.sim_time += dt
+            self.prev_ball_pos = self.ball_pos.copy()  # 렌더링 보간용 이전 상태
+            player_positions = np.asarray(player_positions, dtype=float).reshape(-1, 2)
+            prev_positions = self.prev_player_positions
+            if prev_positions is None or prev_positions.shape != player_positions.shape:
+                prev_positions = player_positions  # 위치 대응이 바뀌면 이동 없이 처리
+            self.prev_player_positions = player_positions
+
             if self.round_ended:
-                if time.time() - self.round_end_time >= ROUND_END_DELAY:
+                if self.sim_time - self.round_end_time >= ROUND_END_DELAY:
                     self.reset_ball()
                     self.round_ended = False
                     self.round_end_time = None
                     self.goal_scored = False
                 return
 
-            # 플레이어와 공 충돌 처리
+            # 플레이어와 공 충돌 처리 (스텝 중 충돌 시각까지 이동 후 반사, 남은 시간 이동)
+            hit_t = None
             if not self.ignore_collisions:
-                self._handle_player_ball_collision(player_positions)
+                hit_t, hit_index = self._find_player_hit(prev_positions, player_positions, dt, radii)
+                if hit_t is not None and owners is not None:
+                    self.last_hit_owner = owners[hit_index]
             else:
                 # 공이 목표 측에 도달했는지 확인
                 ball_on_next_side = (
@@ -71,82 +278,150 @@ class Physics:
                     self.ignore_collisions = False
                     self.target_side = None
 
-            # 공 위치 업데이트
-            self.ball_pos += self.ball_vel * dt
-
-            # 공 궤적 업데이트
-            self._update_ball_trail()
-
-            # 공과 벽 충돌 처리
-            self._handle_wall_ball_collision()
+            # 공 위치 업데이트 (벽 반사/골 판정 포함)
+            if hit_t is None:
+                self._advance_ball(dt, dt)
+            else:
+                self._advance_ball(hit_t * dt, dt)
+                if not self.round_ended:
+                    self._bounce_off_player()
+                    self._advance_ball((1 - hit_t) * dt, (1 - hit_t) * dt)
 
         except Exception as e:
             print(f"물리 업데이트 중 오류: {e}")
 
-    def _update_ball_trail(self):
-        """공 궤적 업데이트"""
-        self.ball_trail.append(self.ball_pos.copy())
-        if len(self.ball_trail) > BALL_TRAIL_LENGTH:
-            self.ball_trail.pop(0)
+    def update_ball_trail(self):
+        """공 궤적 업데이트 (렌더링 프레임마다 한 번 호출해 궤적 길이가 BALL_TRAIL_LENGTH 프레임이 되도록 함)"""
+        self.ball_trail.append(self.ball_pos)
+
+    def _advance_ball(self, duration: float, time_left: float):
+        """공을 duration초 동안 이동하며 벽 반사와 골 라인 통과 시각을 정확히 계산
 
-    def _handle_wall_ball_collision(self):
-        """공과 벽 충돌 처리"""
+        time_left는 이동 시작 시점에서 현재 스텝 끝까지 남은 시간으로, 골 시각 계산에 사용합니다.
+        """
         try:
-            is_touch_left = self.ball_pos[0] < 0
-            is_touch_right = self.ball_pos[0] > MAX_SCREEN
-            is_touch_bottom = self.ball_pos[1] < config.BALL_RADIUS_RATIO
-            is_touch_top = self.ball_pos[1] > MAX_SCREEN - config.BALL_RADIUS_RATIO
-
-            if is_touch_left:
-                self.score[1] += 1  # 오른쪽 플레이어 점수 증가
-                self.round_ended = True
-                self.round_end_time = time.time()
-                self.goal_scored = True  # 화면 흔들림 효과 트리거
-                if self.score_sound:
-                    self.score_sound.play()
-            elif is_touch_right:
-                self.score[0] += 1  # 왼쪽 플레이어 점수 증가
-                self.round_ended = True
-                self.round_end_time = time.time()
-                self.goal_scored = True  # 화면 흔들림 효과 트리거
-                if self.score_sound:
-                    self.score_sound.play()
-            elif is_touch_bottom or is_touch_top:
+            bottom = config.BALL_RADIUS_RATIO
+            top = MAX_SCREEN - config.BALL_RADIUS_RATIO
+            remaining = duration
+            for _ in range(MAX_WALL_BOUNCES + 1):
+                step = self.ball_vel * remaining
+                end = self.ball_pos + step
+
+                # 골 라인(좌우) 통과 비율
+                t_goal = None
+                if end[0] < 0 and step[0] < 0:
+                    t_goal = max(0.0, -self.ball_pos[0] / step[0])
+                elif end[0] > MAX_SCREEN and step[0] > 0:
+                    t_goal = max(0.0, (MAX_SCREEN - self.ball_pos[0]) / step[0])
+
+                # 상하 벽 충돌 비율
+                t_wall = None
+                if end[1] < bottom and step[1] < 0:
+                    t_wall = max(0.0, (bottom - self.ball_pos[1]) / step[1])
+                elif end[1] > top and step[1] > 0:
+                    t_wall = max(0.0, (top - self.ball_pos[1]) / step[1])
+
+                if t_goal is None and t_wall is None:
+                    self.ball_pos += step
+                    return
+                if t_goal is not None and (t_wall is None or t_goal <= t_wall):
+                    self.ball_pos += step * t_goal
+                    elapsed = (duration - remaining) + remaining * t_goal
+                    self._score_goal('right' if end[0] < 0 else 'left',
+                                     self.sim_time - time_left + elapsed)
+                    return
+                self.ball_pos += step * t_wall
                 self.ball_vel[1] = -self.ball_vel[1]  # Y축 속도 반전
+                remaining *= 1 - t_wall
         except Exception as e:
             print(f"벽 충돌 처리 중 오류: {e}")
 
-    def _handle_player_ball_collision(self, player_positions: list):
-        """플레이어와 공 충돌 처리"""
+    def _score_goal(self, scorer: str, event_time: float):
+        """득점 처리 (scorer: 'left' 또는 'right', event_time: 골 라인 통과 시뮬레이션 시각)"""
+        self.score[0 if scorer == 'left' else 1] += 1
+        self.round_ended = True
+        self.round_end_time = event_time
+        self.goal_scored = True  # 화면 흔들림 효과 트리거
+        if self.score_sound:
+            self.score_sound.play()
+
+    def _find_player_hit(self, prev_positions: np.ndarray, player_positions: np.ndarray,
+                         dt: float, radii=None):
+        """스텝 동안 공과 플레이어 히트박스가 처음 닿는 비율 t (0~1)와 해당 점 인덱스 계산
+
+        각 랜드마크는 직전 포즈 위치에서 현재 위치로 직선 이동한다고 보며, 모든 점을 한 번에 계산합니다.
+        충돌이 없으면 (None, None)을 반환합니다.
+        """
         try:
-            for pos in player_positions:
-                if self.check_collision(self.ball_pos, pos, config.BALL_RADIUS_RATIO):
-                    self.ignore_collisions = True
-                    self.target_side = 'left' if self.ball_pos[0] > MAX_SCREEN / 2 else 'right'
-                    # 공 속도 10% 증가
-                    self.speed_multiplier *= 1.1
-                    self.ball_vel = np.array([
-                        -BALL_SPEED_SCALE * self.speed_multiplier if self.target_side == 'left' else BALL_SPEED_SCALE * self.speed_multiplier,
-                        random.uniform(-0.5 * BALL_SPEED_SCALE * self.speed_multiplier, 0.5 * BALL_SPEED_SCALE * self.speed_multiplier)
-                    ])
-                    print('충돌', self.ball_vel)
-                    if self.collision_sound:
-                        self.collision_sound.play()
-                    break
+            if len(player_positions) == 0:
+                return None, None
+            t = swept_circle_hits(self.ball_pos - prev_positions,
+                                  self.ball_vel * dt - (player_positions - prev_positions),
+                                  config.BALL_RADIUS_RATIO if radii is None else np.asarray(radii, dtype=float))
+            index = int(np.argmin(t))
+            if not np.isfinite(t[index]):
+                return None, None
+            return float(t[index]), index
         except Exception as e:
             print(f"플레이어 충돌 처리 중 오류: {e}")
+            return None, None
+
+    def _bounce_off_player(self):
+        """플레이어에 맞은 공을 반대편으로 보내기"""
+        self.ignore_collisions = True
+        self.target_side = 'left' if self.ball_pos[0] > MAX_SCREEN / 2 else 'right'
+        # 공 속도 10% 증가
+        self.speed_multiplier *= 1.1
+        self.hits += 1
+        self.velocity_version += 1
+        self.ball_vel = np.array([
+            -BALL_SPEED_SCALE * self.speed_multiplier if self.target_side == 'left' else BALL_SPEED_SCALE * self.speed_multiplier,
+            self.rng.uniform(-0.5 * BALL_SPEED_SCALE * self.speed_multiplier, 0.5 * BALL_SPEED_SCALE * self.speed_multiplier)
+        ])
+        print('충돌', self.ball_vel)
+        if self.collision_sound:
+            self.collision_sound.play()
+
+    def trajectory(self) -> Optional[BallTrajectory]:
+        """현재 공의 해석적 궤적 (속도가 반사 외의 이유로 바뀔 때까지 캐시, 라운드 종료 중에는 None)
+
+        벽 반사는 궤적에 포함되어 있으므로 반사만으로는 다시 계산하지 않습니다.
+        """
+        if self.round_ended:
+            return None
+        if self._trajectory is None or self._trajectory[0] != self.velocity_version:
+            self._trajectory = (self.velocity_version,
+                                BallTrajectory(self.ball_pos, self.ball_vel, self.sim_time,
+                                               config.BALL_RADIUS_RATIO, MAX_SCREEN - config.BALL_RADIUS_RATIO))
+        return self._trajectory[1]
+
+    def predict_goal(self) -> Optional[Dict[str, Any]]:
+        """공이 골 라인에 닿을 때까지 남은 시간(초), 위치, 득점 측, 반사 경로"""
+        trajectory = self.trajectory()
+        goal = trajectory.goal() if trajectory else None
+        if goal is None:
+            return None
+        goal_time, position, side = goal
+        return {
+            'time': goal_time - self.sim_time,
+            'position': position,
+            'side': side,
+            'path': trajectory.bounce_path(self.sim_time),
+        }
 
     def reset_ball(self):
         """공을 중앙으로 리셋"""
         try:
             self.ball_pos = np.array([MAX_SCREEN / 2, MAX_SCREEN / 2], dtype=float)
+            self.prev_ball_pos = self.ball_pos.copy()  # 리셋 위치로 보간되지 않도록 함께 초기화
             self.ball_vel = np.array([
-                random.choice([-1, 1]) * INITIAL_BALL_SPEED_SCALE * self.speed_multiplier,
-                random.uniform(-0.5 * INITIAL_BALL_SPEED_SCALE * self.speed_multiplier, 0.5 * INITIAL_BALL_SPEED_SCALE * self.speed_multiplier)
+                self.rng.choice([-1, 1]) * INITIAL_BALL_SPEED_SCALE * self.speed_multiplier,
+                self.rng.uniform(-0.5 * INITIAL_BALL_SPEED_SCALE * self.speed_multiplier, 0.5 * INITIAL_BALL_SPEED_SCALE * self.speed_multiplier)
             ], dtype=float)
+            self.velocity_version += 1
             self.ignore_collisions = False
             self.target_side = None
-            self.ball_trail = []
+            self.ball_trail.clear()
             self.goal_scored = False
         except Exception as e:
             print(f"공 리셋 중 오류: {e}")
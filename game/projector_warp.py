@@ -0,0 +1,86 @@
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+def keystone_homography(corners: Sequence[Tuple[float, float]], size: Tuple[int, int]) -> np.ndarray:
+    """화면 네 모서리를 프로젝터 출력의 corners로 옮기는 키스톤 호모그래피
+
+    Args:
+        corners: 좌상, 우상, 우하, 좌하 모서리의 출력 위치 (출력 크기 대비 0~1 비율).
+        size: 출력 (너비, 높이).
+
+    Returns:
+        ProjectorWarp에 넘길 3x3 호모그래피 (출력 해상도의 화면 픽셀 -> 프로젝터 출력 픽셀).
+    """
+    width, height = size
+    source = np.float32([(0, 0), (width, 0), (width, height), (0, height)])
+    target = np.float32(corners) * np.float32([width, height])
+    return cv2.getPerspectiveTransform(source, target)
+
+
+class ProjectorWarp:
+    """호모그래피로 렌더링 프레임을 미리 왜곡하는 프로젝터 키스톤 보정
+
+    호모그래피는 렌더링 화면 좌표(출력 해상도 기준 픽셀)를 프로젝터 출력 픽셀로 옮기며,
+    keystone_homography로 만듭니다. 카메라 -> 화면 캘리브레이션 호모그래피와는 다릅니다.
+    출력 픽셀마다 원본 좌표(역 호모그래피)를 캘리브레이션당 한 번만 계산해 cv2.convertMaps로
+    고정소수점 조회표로 바꿔 두고, 매 프레임에는 cv2.remap 한 번으로 cv2.warpPerspective와 같은
+    결과를 미리 할당한 버퍼(또는 호출자가 준 배열)에 씁니다.
+    """
+    def __init__(self, homography: np.ndarray, output_size: Tuple[int, int],
+                 source_size: Optional[Tuple[int, int]] = None, interpolation: int = cv2.INTER_LINEAR):
+        """조회표 생성
+
+        Args:
+            homography: 출력 해상도의 화면 픽셀 -> 프로젝터 출력 픽셀 3x3 호모그래피 (warpPerspective와 같은 방향).
+            output_size: 출력 (너비, 높이).
+            source_size: 원본 (너비, 높이), 출력과 다르면 확대/축소도 조회표에 포함 (기본: 출력과 같음).
+            interpolation: cv2.INTER_NEAREST 또는 cv2.INTER_LINEAR.
+        """
+        self.homography = np.asarray(homography, dtype=np.float64)
+        self.output_size = tuple(output_size)
+        self.interpolation = interpolation
+        self.source_size = None
+        self.map1 = self.map2 = None
+        self.buffer = None
+        self.set_source_size(source_size or self.output_size)
+
+    def set_source_size(self, source_size: Tuple[int, int]) -> None:
+        """원본 크기가 바뀌었을 때만 조회표 다시 생성 (내부 렌더링 배율 변경 등)"""
+        source_size = tuple(source_size)
+        if source_size == self.source_size:
+            return
+        self.source_size = source_size
+        self.map1, self.map2 = self._build_maps()
+
+    def _build_maps(self) -> Tuple[np.ndarray, np.ndarray]:
+        """출력 픽셀 -> 원본 픽셀 좌표 조회표 (원본 밖이나 지평선 뒤쪽은 -1)"""
+        width, height = self.output_size
+        scale = np.diag([self.source_size[0] / width, self.source_size[1] / height, 1.0])
+        inverse = scale @ np.linalg.inv(self.homography)
+
+        xs, ys = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+        w = inverse[2, 0] * xs + inverse[2, 1] * ys + inverse[2, 2]
+        behind = w <= 1e-12
+        w[behind] = 1.0
+        map_x = ((inverse[0, 0] * xs + inverse[0, 1] * ys + inverse[0, 2]) / w).astype(np.float32)
+        map_y = ((inverse[1, 0] * xs + inverse[1, 1] * ys + inverse[1, 2]) / w).astype(np.float32)
+        map_x[behind] = -1
+        map_y[behind] = -1
+        return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+    def apply(self, source: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """원본 (높이, 너비, 채널) 이미지를 보정해 out (기본: 재사용 버퍼)에 쓰고 반환
+
+        out은 (출력 높이, 출력 너비, 채널) 형태와 원본 dtype이어야 제자리에 쓰이며,
+        행 간격(pitch)이 있는 뷰도 허용합니다.
+        """
+        if out is None:
+            shape = (self.output_size[1], self.output_size[0]) + source.shape[2:]
+            if self.buffer is None or self.buffer.shape != shape or self.buffer.dtype != source.dtype:
+                self.buffer = np.empty(shape, dtype=source.dtype)
+            out = self.buffer
+        return cv2.remap(source, self.map1, self.map2, self.interpolation, dst=out,
+                         borderMode=cv2.BORDER_CONSTANT, borderValue=0)
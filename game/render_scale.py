@@ -0,0 +1,64 @@
+from typing import Optional
+
+SCALE_STEP = 0.1  # 한 번에 바꾸는 배율
+SMOOTHING = 0.1  # 렌더링 시간 지수 이동 평균 가중치
+COOLDOWN_FRAMES = 30  # 배율을 바꾼 뒤 다시 바꾸기까지 기다리는 프레임 수
+HEADROOM = 0.8  # 배율을 올렸을 때 예상 시간이 예산의 이 비율 이하일 때만 올림
+
+
+class RenderScaler:
+    """측정한 렌더링 시간에 맞춰 내부 렌더링 해상도 배율을 조절하는 컨트롤러
+
+    렌더링 시간의 지수 이동 평균이 예산을 넘으면 배율을 한 단계 낮추고, 한 단계 올려도
+    (픽셀 수에 비례한다고 보고 추정한) 시간이 예산의 HEADROOM 이하일 때만 올립니다.
+    배율을 바꾼 뒤 COOLDOWN_FRAMES 동안은 다시 바꾸지 않아 두 배율 사이를 오가지 않습니다.
+    """
+    def __init__(self, budget: float, scale: float = 1.0, min_scale: float = 0.5, max_scale: float = 1.0,
+                 step: float = SCALE_STEP, smoothing: float = SMOOTHING, cooldown: int = COOLDOWN_FRAMES):
+        """컨트롤러 초기화
+
+        Args:
+            budget: 프레임당 렌더링에 허용하는 시간 (초).
+            scale: 시작 배율.
+            min_scale: 최소 배율.
+            max_scale: 최대 배율.
+            step: 한 번에 바꾸는 배율.
+            smoothing: 렌더링 시간 이동 평균 가중치 (0~1).
+            cooldown: 배율 변경 후 대기 프레임 수.
+        """
+        self.budget = budget
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.scale = min(max(scale, min_scale), max_scale)
+        self.step = step
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.average: Optional[float] = None
+        self.frames_since_change = 0
+        self.changes = 0
+
+    def update(self, render_time: float) -> bool:
+        """이번 프레임의 렌더링 시간(초)을 반영하고 배율이 바뀌었으면 True 반환"""
+        if self.average is None:
+            self.average = render_time
+        else:
+            self.average += (render_time - self.average) * self.smoothing
+        self.frames_since_change += 1
+        if self.frames_since_change < self.cooldown:
+            return False
+
+        if self.average > self.budget:
+            new_scale = max(self.min_scale, self.scale - self.step)
+        elif self.average * ((self.scale + self.step) / self.scale) ** 2 < self.budget * HEADROOM:
+            new_scale = min(self.max_scale, self.scale + self.step)
+        else:
+            return False
+        new_scale = round(new_scale, 3)
+        if new_scale == self.scale:
+            return False
+
+        self.average *= (new_scale / self.scale) ** 2  # 새 배율에서의 예상 시간으로 평균 보정
+        self.scale = new_scale
+        self.frames_since_change = 0
+        self.changes += 1
+        return True
@@ -1,13 +1,17 @@
 import pygame
 import numpy as np
 import cv2
-from typing import Tuple, List, Union
+from typing import Tuple, List, Optional, Union
 import config
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BALL_RADIUS, SCALE_FACTOR, \
-    COLORS, HAND_RADIUS
+    COLORS, HAND_RADIUS, VSYNC, DIRTY_RECTS, FPS, \
+    RENDER_SCALE, RENDER_SCALE_AUTO, RENDER_SCALE_MIN, RENDER_BUDGET, PROJECTOR_WARP, PROJECTOR_KEYSTONE
 import time
 import math
 import random
+from game.projector_warp import ProjectorWarp, keystone_homography
+from game.render_scale import RenderScaler
+from util.text_cache import TextCache
 
 # 상수 정의
 BORDER_THICKNESS = int(10 * SCALE_FACTOR)  # 테두리 두께 (픽셀)
@@ -30,8 +34,9 @@ class Renderer:
         """렌더러 초기화: 화면, 폰트, 호모그래피, 카메라 설정"""
         try:
             pygame.init()
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-            self.font = pygame.font.Font(None, FONT_SIZE)
+            self.vsync = VSYNC
+            self.display = self._create_display()
+            self.text_cache = TextCache()  # 점수/키 상태 텍스트 서피스
             self.homography = homography
             self.use_homography = homography is not None
             self.camera = camera
@@ -42,10 +47,102 @@ class Renderer:
             }
             self.shake_start_time = None
             self.shake_offset = (0, 0)
+            self.sprite_cache = {}  # (반지름, 색, 테두리 색, 테두리 두께) -> 스프라이트
+            self.trail_surface = None  # 재사용하는 궤적 알파 서피스
+            self.trail_color_cache = {}  # 선분 수 -> 선분별 RGBA 색상
+            self.background = None  # 테두리/중앙선 캐시 레이어
+            self.camera_buffer = None  # 크기 변환된 카메라 프레임 (BGR)
+            self.camera_surface = None  # camera_buffer를 공유하는 서피스
+            self.camera_frame_seq = None  # camera_surface에 반영된 프레임 번호
+            self.background_key = None
+            self.dirty_rects = DIRTY_RECTS  # 바뀐 영역만 갱신하는 모드
+            self.frame_rects = []  # 이번 프레임에 그린 영역
+            self.previous_rects = []  # 직전 프레임에 그린 영역 (이번 프레임에 지울 영역)
+            self.full_redraw = True  # 다음 프레임은 전체를 다시 그리고 flip
+            self.warp = self._create_warp() if PROJECTOR_WARP else None
+            self.scaler = RenderScaler(RENDER_BUDGET / FPS, RENDER_SCALE, RENDER_SCALE_MIN) if RENDER_SCALE_AUTO else None
+            self.set_render_scale(self.scaler.scale if self.scaler else RENDER_SCALE)
         except Exception as e:
             print(f"렌더러 초기화 중 오류: {e}")
             raise
 
+    def _create_display(self) -> pygame.Surface:
+        """디스플레이 생성 (vsync는 SCALED 모드에서만 지원되며, 실패하면 vsync 없이 생성)"""
+        if self.vsync:
+            try:
+                return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                               pygame.FULLSCREEN | pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"vsync를 사용할 수 없어 프레임 스케줄러로 대체합니다: {e}")
+                self.vsync = False
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+
+    def _create_warp(self) -> Optional[ProjectorWarp]:
+        """PROJECTOR_KEYSTONE 모서리로 키스톤 보정 조회표 생성 (32비트 디스플레이에서만 지원)
+
+        카메라 -> 화면 캘리브레이션 호모그래피(self.homography)는 출력 보정에 쓰지 않습니다.
+        """
+        if self.display.get_bytesize() != 4:
+            print("32비트 디스플레이가 아니어서 프로젝터 보정을 사용하지 않습니다.")
+            return None
+        size = self.display.get_size()
+        return ProjectorWarp(keystone_homography(PROJECTOR_KEYSTONE, size), size)
+
+    def set_render_scale(self, scale: float) -> None:
+        """내부 렌더링 해상도 배율 설정 (1.0이면 디스플레이에 직접 그림, 미만이면 작은 캔버스에 그린 뒤 확대)
+
+        크기에 의존하는 캐시(배경, 스프라이트, 텍스트, 궤적, 카메라 버퍼)는 모두 새 배율로 다시 만듭니다.
+        """
+        self.render_scale = min(1.0, scale)
+        self.width = max(1, int(SCREEN_WIDTH * self.render_scale))
+        self.height = max(1, int(SCREEN_HEIGHT * self.render_scale))
+        if self.render_scale >= 1.0 and self.warp is None:
+            self.screen = self.display
+        else:
+            self.screen = pygame.Surface((self.width, self.height)).convert(self.display)
+        if self.warp is not None:
+            self.warp.set_source_size((self.width, self.height))  # 확대도 보정 조회표에 포함
+        self.font = pygame.font.Font(None, max(1, self.px(FONT_SIZE)))
+        self.text_cache.clear()
+        self.sprite_cache.clear()
+        self.background = None
+        self.trail_surface = None
+        self.camera_buffer = None
+        self.camera_frame_seq = None
+        self.previous_rects = []
+        self.full_redraw = True
+
+    def px(self, value: float) -> int:
+        """화면 해상도 기준 픽셀 값을 내부 렌더링 해상도 픽셀로 변환"""
+        return int(value * self.render_scale)
+
+    def get_sprite(self, radius: int, color: Tuple[int, int, int], border_color: Tuple[int, int, int] = None,
+                   border_thickness: int = 0) -> pygame.Surface:
+        """원형 스프라이트를 한 번만 그려 디스플레이 형식으로 변환해 캐시"""
+        key = (radius, tuple(color), tuple(border_color) if border_color else None, border_thickness)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            if border_color and border_thickness > 0:
+                pygame.draw.circle(sprite, border_color, (radius, radius), radius, border_thickness)
+            sprite = sprite.convert_alpha()
+            self.sprite_cache[key] = sprite
+        return sprite
+
+    def _sprite_positions(self, screen_points: np.ndarray, radius: int, offset_x: int,
+                          offset_y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """화면 좌표 (N,2)를 스프라이트 좌상단 좌표로 변환 (중심이 화면 밖이거나 NaN인 점 제외)
+
+        Returns:
+            (표시할 점의 좌상단 좌표, 입력 점 기준 표시 여부 마스크)
+        """
+        points = screen_points + np.array([offset_x, offset_y])
+        with np.errstate(invalid='ignore'):
+            visible = ((points[:, 0] >= 0) & (points[:, 0] < self.width) &
+                       (points[:, 1] >= 0) & (points[:, 1] < self.height))
+        return points[visible].astype(int) - radius, visible
+
     def update_key_state(self, key: int, state: bool) -> None:
         """키 입력 상태 업데이트"""
         try:
@@ -91,8 +188,8 @@ class Renderer:
             points = np.array(points, dtype=np.float32)
             if points.ndim == 1:
                 points = points.reshape(1, -1)
-            scale_x = SCREEN_WIDTH
-            scale_y = SCREEN_HEIGHT
+            scale_x = SCREEN_WIDTH * self.render_scale
+            scale_y = SCREEN_HEIGHT * self.render_scale
             return points * np.array([scale_x, scale_y])
         except Exception as e:
             print(f"공 좌표 변환 중 오류: {e}")
@@ -104,58 +201,98 @@ class Renderer:
             points = np.array(points, dtype=np.float32)
             if points.ndim == 1:
                 points = points.reshape(1, -1)
-            scale_x = config.WALL_WIDTH
-            scale_y = config.WALL_HEIGHT
-            return points * np.array([scale_x, scale_y]) + np.array([config.FOCUS_X, config.FOCUS_Y])
+            scale_x = config.WALL_WIDTH * self.render_scale
+            scale_y = config.WALL_HEIGHT * self.render_scale
+            return (points * np.array([scale_x, scale_y])
+                    + np.array([config.FOCUS_X, config.FOCUS_Y]) * self.render_scale)
         except Exception as e:
             print(f"플레이어 좌표 변환 중 오류: {e}")
             return np.array([])
 
+    def interpolate(self, prev_pos: Union[np.ndarray, List[float]], current_pos: Union[np.ndarray, List[float]],
+                    alpha: float) -> np.ndarray:
+        """두 물리 상태 사이 선형 보간"""
+        prev_pos = np.asarray(prev_pos, dtype=float)
+        return prev_pos + (np.asarray(current_pos, dtype=float) - prev_pos) * alpha
+
+    def _build_background(self, size: Tuple[int, int]) -> pygame.Surface:
+        """테두리와 점선 중앙선을 미리 그린 배경 레이어 (검은색은 colorkey로 투명 처리)"""
+        width, height = size
+        border, line, dash, gap = (max(1, self.px(value)) for value in
+                                   (BORDER_THICKNESS, CENTER_LINE_THICKNESS, DASH_LENGTH, GAP_LENGTH))
+        background = pygame.Surface(size).convert(self.display)
+        background.fill((0, 0, 0))
+        background.set_colorkey((0, 0, 0))
+
+        # 상단 및 하단 테두리
+        pygame.draw.rect(background, COLORS['top_bottom_border'], (0, 0, width, border))
+        pygame.draw.rect(background, COLORS['top_bottom_border'], (0, height - border, width, border))
+        # 좌측 및 우측 테두리
+        pygame.draw.rect(background, COLORS['left_border'], (0, 0, border, height))
+        pygame.draw.rect(background, COLORS['right_border'], (width - border, 0, border, height))
+        # 중앙 점선
+        center_x = width // 2
+        y = 0
+        while y < height:
+            pygame.draw.line(background, COLORS['center_line'],
+                             (center_x, y), (center_x, min(y + dash, height)), line)
+            y += dash + gap
+        return background
+
+    def _background_key(self) -> tuple:
+        """배경 레이어 캐시 키 (해상도, 색상 설정)"""
+        colors = tuple(COLORS[name] for name in ('top_bottom_border', 'left_border', 'right_border', 'center_line'))
+        return ((self.width, self.height), colors)
+
     def draw_borders_and_center_line(self, shake_offset: Tuple[int, int]) -> None:
-        """테두리와 점선 중앙선 그리기"""
+        """테두리와 점선 중앙선 그리기 (캐시된 배경 레이어를 흔들림 오프셋만큼 옮겨 출력)"""
         try:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            offset_x, offset_y = shake_offset
-
-            # 상단 및 하단 테두리
-            pygame.draw.rect(overlay, COLORS['top_bottom_border'],
-                            (offset_x, offset_y, SCREEN_WIDTH, BORDER_THICKNESS))
-            pygame.draw.rect(overlay, COLORS['top_bottom_border'],
-                            (offset_x, SCREEN_HEIGHT - BORDER_THICKNESS + offset_y,
-                             SCREEN_WIDTH, BORDER_THICKNESS))
-            # 좌측 및 우측 테두리
-            pygame.draw.rect(overlay, COLORS['left_border'],
-                            (offset_x, offset_y, BORDER_THICKNESS, SCREEN_HEIGHT))
-            pygame.draw.rect(overlay, COLORS['right_border'],
-                            (SCREEN_WIDTH - BORDER_THICKNESS + offset_x, offset_y,
-                             BORDER_THICKNESS, SCREEN_HEIGHT))
-            # 중앙 점선
-            center_x = SCREEN_WIDTH // 2 + offset_x
-            y = offset_y
-            while y < SCREEN_HEIGHT + offset_y:
-                pygame.draw.line(overlay, COLORS['center_line'],
-                               (center_x, y),
-                               (center_x, min(y + DASH_LENGTH, SCREEN_HEIGHT + offset_y)),
-                               CENTER_LINE_THICKNESS)
-                y += DASH_LENGTH + GAP_LENGTH
-
-            self.screen.blit(overlay, (0, 0))
+            # 해상도나 색상 설정이 바뀌었을 때만 다시 그림
+            key = self._background_key()
+            if self.background is None or self.background_key != key:
+                self.background = self._build_background(key[0])
+                self.background_key = key
+            self.screen.blit(self.background, shake_offset)
         except Exception as e:
             print(f"테두리 및 중앙선 그리기 중 오류: {e}")
 
+    def erase_rects(self, rects: List[pygame.Rect]) -> None:
+        """직전 프레임에 그린 영역만 배경으로 되돌리기"""
+        for rect in rects:
+            self.screen.fill((0, 0, 0), rect)
+            self.screen.blit(self.background, rect, rect)
+
     def render(self, ball_pos: List[float], player_positions: List[List[float]], score: Tuple[int, int],
-               goal_scored: bool = False, ball_trail: List[np.ndarray] = None) -> None:
-        """게임 화면 렌더링: 배경, 테두리, 공, 플레이어, 점수, 키 상태"""
+               goal_scored: bool = False, ball_trail: np.ndarray = None,
+               prev_ball_pos: List[float] = None, alpha: float = 1.0) -> None:
+        """게임 화면 렌더링: 배경, 테두리, 공, 플레이어, 점수, 키 상태
+
+        prev_ball_pos가 주어지면 직전 물리 상태와 현재 상태 사이를 alpha(0~1) 비율로 보간해 공을 그립니다.
+        dirty_rects 모드에서는 직전 프레임과 이번 프레임에 그린 영역만 지우고 갱신하며,
+        화면 흔들림이나 카메라 뷰처럼 화면 전체가 바뀌는 동안과 그 다음 프레임에는 전체를 다시 그립니다.
+        """
         try:
-            # 화면 흔들림 계산
-            self.shake_offset = self.get_screen_shake(goal_scored)
-            offset_x, offset_y = self.shake_offset
+            start = time.perf_counter()
+            if prev_ball_pos is not None:
+                ball_pos = self.interpolate(prev_ball_pos, ball_pos, alpha)
 
-            # 카메라 뷰 렌더링
-            self.render_camera_view(offset_x, offset_y)
+            # 화면 흔들림 계산 (내부 렌더링 해상도 기준)
+            self.shake_offset = tuple(self.px(value) for value in self.get_screen_shake(goal_scored))
+            offset_x, offset_y = self.shake_offset
 
-            # 테두리와 중앙선 그리기
-            self.draw_borders_and_center_line(self.shake_offset)
+            # 화면 전체가 바뀌는 프레임 (흔들림, 카메라 뷰)
+            fallback = self.show_camera or self.shake_offset != (0, 0) or self.shake_start_time is not None
+            full = (not self.dirty_rects or self.full_redraw or fallback
+                    or self.background_key != self._background_key())
+            self.frame_rects = []
+            if full:
+                # 카메라 뷰 렌더링
+                self.render_camera_view(offset_x, offset_y)
+
+                # 테두리와 중앙선 그리기
+                self.draw_borders_and_center_line(self.shake_offset)
+            else:
+                self.erase_rects(self.previous_rects)
 
             # 공과 궤적 렌더링
             self.render_trail(ball_trail, offset_x, offset_y)
@@ -169,42 +306,82 @@ class Renderer:
 
             # 키 입력 상태 렌더링
             self.render_key_input(offset_x, offset_y)
+            # 그리기 시간만 측정 (present의 flip은 vsync에서 다음 주사까지 대기하므로 제외)
+            draw_time = time.perf_counter() - start
 
-            pygame.display.flip()
+            self.present(full)
+            self.previous_rects = self.frame_rects
+            self.full_redraw = fallback  # 흔들림/카메라 뷰가 끝난 직후 프레임도 화면 전체를 되돌려야 함
+
+            # 그리기 시간에 맞춰 다음 프레임의 해상도 배율 조정
+            if self.scaler and self.scaler.update(draw_time):
+                self.set_render_scale(self.scaler.scale)
         except Exception as e:
+            self.full_redraw = True
             print(f"화면 렌더링 중 오류: {e}")
 
+    @staticmethod
+    def _pixels(surface: pygame.Surface) -> np.ndarray:
+        """32비트 서피스 픽셀의 (높이, 너비, 4) 바이트 뷰 (복사 없음, 뷰가 남아 있는 동안 서피스가 잠김)"""
+        width, height = surface.get_size()
+        return pygame.surfarray.pixels2d(surface).T.view(np.uint8).reshape(height, width, 4)
+
+    def present(self, full: bool) -> None:
+        """그린 화면을 디스플레이에 표시
+
+        프로젝터 보정을 사용하면 캔버스를 조회표로 한 번에 보정/확대해 디스플레이 픽셀에 바로 쓰고,
+        축소 캔버스는 한 번의 확대 블릿 후 전체 flip합니다.
+        """
+        if self.warp is not None:
+            source, target = self._pixels(self.screen), self._pixels(self.display)
+            result = self.warp.apply(source, target)
+            if result is not target:
+                target[...] = result
+            del source, target, result  # 서피스 잠금 해제
+            pygame.display.flip()
+        elif self.screen is not self.display:
+            pygame.transform.scale(self.screen, self.display.get_size(), self.display)
+            pygame.display.flip()
+        elif full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous_rects + self.frame_rects)
+
     def render_key_input(self, offset_x: int, offset_y: int) -> None:
         """키 입력 상태 렌더링"""
         try:
             key_status_text = " ".join(key.upper() for key, state in self.key_states.items() if state)
             if key_status_text:
-                key_text = self.font.render(f"키: {key_status_text}", True, (255, 255, 255))
-                key_rect = key_text.get_rect(topleft=(10 + offset_x, SCREEN_HEIGHT - KEY_STATUS_Y_OFFSET + offset_y))
-                self.screen.blit(key_text, key_rect)
+                key_text = self.text_cache.render(self.font, f"키: {key_status_text}", (255, 255, 255))
+                key_rect = key_text.get_rect(topleft=(self.px(10) + offset_x,
+                                                     self.height - self.px(KEY_STATUS_Y_OFFSET) + offset_y))
+                self.frame_rects.append(self.screen.blit(key_text, key_rect))
         except Exception as e:
             print(f"키 상태 렌더링 중 오류: {e}")
 
     def render_score(self, offset_x: int, offset_y: int, score: Tuple[int, int]) -> None:
         """점수 렌더링"""
         try:
-            score_text = self.font.render(f"{score[0]} : {score[1]}", True, COLORS['score'])
-            text_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2 + offset_x, SCORE_Y_OFFSET + offset_y))
-            self.screen.blit(score_text, text_rect)
+            score_text = self.text_cache.render(self.font, f"{score[0]} : {score[1]}", COLORS['score'])
+            text_rect = score_text.get_rect(center=(self.width // 2 + offset_x, self.px(SCORE_Y_OFFSET) + offset_y))
+            self.frame_rects.append(self.screen.blit(score_text, text_rect))
         except Exception as e:
             print(f"점수 렌더링 중 오류: {e}")
 
     def render_player(self, offset_x: int, offset_y: int, player_positions: List[List[float]]) -> None:
-        """플레이어(손/발) 렌더링"""
+        """플레이어(손/발) 렌더링 (처음 두 점은 손, 나머지는 발 색상)"""
         try:
-            for i, pos in enumerate(player_positions):
-                screen_pos = self.transform_player(pos)
-                if screen_pos.shape[0] > 0:
-                    color = COLORS['hand'] if i < 2 else COLORS['foot']
-                    radius = int(HAND_RADIUS)
-                    x, y = int(screen_pos[0, 0] + offset_x), int(screen_pos[0, 1] + offset_y)
-                    if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
-                        pygame.draw.circle(self.screen, color, (x, y), radius)
+            if len(player_positions) == 0:
+                return
+            radius = self.px(HAND_RADIUS)
+            screen_points = self.transform_player(player_positions)
+            top_left, visible = self._sprite_positions(screen_points, radius, offset_x, offset_y)
+            hand_flags = (np.arange(len(screen_points)) < 2)[visible]
+            hand_sprite = self.get_sprite(radius, COLORS['hand'])
+            foot_sprite = self.get_sprite(radius, COLORS['foot'])
+            self.frame_rects.extend(self.screen.blits([(hand_sprite if hand else foot_sprite, tuple(point))
+                                                       for hand, point in zip(hand_flags.tolist(),
+                                                                              top_left.tolist())]))
         except Exception as e:
             print(f"플레이어 렌더링 중 오류: {e}")
 
@@ -233,16 +410,20 @@ class Renderer:
             return (0, 0)
 
     def render_camera_view(self, offset_x: int, offset_y: int) -> None:
-        """카메라 뷰 렌더링"""
+        """카메라 뷰 렌더링 (새 프레임일 때만 크기 변환, 같은 프레임이면 캐시된 서피스를 그대로 사용)"""
         try:
             self.screen.fill((0, 0, 0))  # 화면 초기화
             if self.show_camera:
-                frame = self.camera.get_frame()
+                if hasattr(self.camera, 'get_latest_frame'):
+                    seq, frame = self.camera.get_latest_frame()
+                else:
+                    seq, frame = None, self.camera.get_frame()
                 if frame is not None:
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame_resized = cv2.resize(frame_rgb, (config.WALL_WIDTH, config.WALL_HEIGHT))
-                    frame_surface = pygame.surfarray.make_surface(frame_resized.swapaxes(0, 1))
-                    self.screen.blit(frame_surface, (config.FOCUS_X + offset_x, config.FOCUS_Y + offset_y))
+                    if seq is None or seq != self.camera_frame_seq:
+                        self._update_camera_surface(frame)
+                        self.camera_frame_seq = seq
+                    self.screen.blit(self.camera_surface,
+                                     (self.px(config.FOCUS_X) + offset_x, self.px(config.FOCUS_Y) + offset_y))
                 else:
                     print("카메라 프레임이 없습니다.")
             else:
@@ -250,56 +431,76 @@ class Renderer:
         except Exception as e:
             print(f"카메라 뷰 렌더링 중 오류: {e}")
 
-    def render_ball(self, ball_pos: List[float], offset_x: int, offset_y: int) -> None:
-        """공 렌더링"""
+    def _update_camera_surface(self, frame: np.ndarray) -> None:
+        """BGR 프레임을 미리 할당한 버퍼에 바로 크기 변환 (버퍼를 공유하는 서피스가 함께 갱신됨)"""
+        size = (max(1, self.px(config.WALL_WIDTH)), max(1, self.px(config.WALL_HEIGHT)))
+        if self.camera_buffer is None or self.camera_buffer.shape[1::-1] != size:
+            self.camera_buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self.camera_surface = pygame.image.frombuffer(self.camera_buffer, size, 'BGR')
+        cv2.resize(frame, size, dst=self.camera_buffer)
+
+    def render_ball(self, ball_pos: Union[np.ndarray, List[float]], offset_x: int, offset_y: int) -> None:
+        """공 렌더링 (ball_pos: [x, y] 또는 여러 공의 (N,2) 배열, NaN은 비활성 공)"""
         try:
             ball_screen = self.transform_ball(ball_pos)
-            if ball_screen.shape[0] > 0:
-                ball_radius_pixel = int(BALL_RADIUS)
-                border_thickness = max(1, int(ball_radius_pixel * BALL_BORDER_RATIO))
-                x, y = int(ball_screen[0, 0] + offset_x), int(ball_screen[0, 1] + offset_y)
-                if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
-                    pygame.draw.circle(self.screen, COLORS['ball'], (x, y), ball_radius_pixel)
-                    pygame.draw.circle(self.screen, COLORS['ball_border'], (x, y), ball_radius_pixel, border_thickness)
+            if ball_screen.shape[0] == 0:
+                return
+            ball_radius_pixel = self.px(BALL_RADIUS)
+            border_thickness = max(1, int(ball_radius_pixel * BALL_BORDER_RATIO))
+            sprite = self.get_sprite(ball_radius_pixel, COLORS['ball'], COLORS['ball_border'], border_thickness)
+            top_left, _ = self._sprite_positions(ball_screen, ball_radius_pixel, offset_x, offset_y)
+            self.frame_rects.extend(self.screen.blits([(sprite, tuple(point)) for point in top_left.tolist()]))
         except Exception as e:
             print(f"공 렌더링 중 오류: {e}")
 
-    def render_trail(self, ball_trail: List[np.ndarray], offset_x: int, offset_y: int) -> None:
-        """공 궤적 렌더링"""
+    def _trail_colors(self, segments: int) -> List[Tuple[int, int, int, int]]:
+        """궤적 선분별 RGBA 색상 (오래된 쪽일수록 투명, 선분 수별로 캐시)"""
+        colors = self.trail_color_cache.get(segments)
+        if colors is None:
+            ratios = np.arange(segments) / max(1, segments)
+            alphas = np.clip((255 * np.sqrt(ratios)).astype(int), 10, 255)
+            r, g, b = (int(c) for c in COLORS['ball'])
+            colors = [(r, g, b, int(alpha)) for alpha in alphas]
+            self.trail_color_cache[segments] = colors
+        return colors
+
+    def render_trail(self, ball_trail: np.ndarray, offset_x: int, offset_y: int) -> None:
+        """공 궤적 렌더링 (ball_trail: 오래된 순서의 (N,2) 정규화 좌표)
+
+        재사용하는 알파 서피스에서 궤적의 경계 사각형만 지우고 그린 뒤 그 영역만 화면에 합성하므로
+        비용이 화면 크기가 아닌 궤적 길이에 비례합니다.
+        """
         try:
-            if len(ball_trail) <= 1:
+            if ball_trail is None or len(ball_trail) <= 1:
                 return
 
-            # 서피스 생성
-            trail_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            # 좌표 계산 (전체 궤적을 한 번에 변환)
+            screen_points = (self.transform_ball(ball_trail) + np.array([offset_x, offset_y])).astype(int)
+            inside = ((screen_points[:, 0] >= 0) & (screen_points[:, 0] < self.width) &
+                      (screen_points[:, 1] >= 0) & (screen_points[:, 1] < self.height))
+            screen_points = screen_points[inside]
+            if len(screen_points) <= 1:
+                return
 
-            # 좌표 계산
-            points = []
-            for trail_pos in ball_trail:
-                trail_screen = self.transform_ball(trail_pos)
-                if trail_screen.shape[0] > 0:
-                    x, y = int(trail_screen[0, 0] + offset_x), int(trail_screen[0, 1] + offset_y)
-                    if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
-                        points.append((x, y))
+            # 선 두께를 포함한 경계 사각형
+            line_thickness = max(1, self.px(BALL_RADIUS * 1.7))
+            pad = line_thickness // 2 + 2
+            left, top = screen_points.min(axis=0) - pad
+            right, bottom = screen_points.max(axis=0) + pad
+            rect = pygame.Rect(int(left), int(top), int(right - left), int(bottom - top)).clip(self.screen.get_rect())
 
-            if len(points) <= 1:
-                return
+            if self.trail_surface is None or self.trail_surface.get_size() != self.screen.get_size():
+                self.trail_surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self.trail_surface.fill((0, 0, 0, 0), rect)
 
-            # 모든 선을 단일 서피스에 그리기
+            # 모든 선을 재사용 서피스에 그리기
+            points = [tuple(point) for point in screen_points.tolist()]
+            colors = self._trail_colors(len(points) - 1)
             for i in range(len(points) - 1):
-                alpha = int(255 * (i / (len(points) - 1)) ** 0.5)
-                alpha = max(10, min(255, alpha))
-                line_color = (
-                    int(COLORS['ball'][0]),
-                    int(COLORS['ball'][1]),
-                    int(COLORS['ball'][2]),
-                    alpha
-                )
-                line_thickness = int(BALL_RADIUS * 1.7)
-                pygame.draw.line(trail_surface, line_color, points[i], points[i + 1], line_thickness)
-
-            # 서피스 화면에 붙이기
-            self.screen.blit(trail_surface, (0, 0))
+                pygame.draw.line(self.trail_surface, colors[i], points[i], points[i + 1], line_thickness)
+
+            # 경계 사각형 영역만 화면에 붙이기
+            self.frame_rects.append(self.screen.blit(self.trail_surface, rect.topleft, rect))
 
         except Exception as e:
             print(f"공 궤적 렌더링 중 오류: {e}")
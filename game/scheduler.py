@@ -0,0 +1,84 @@
+import time
+from typing import Callable, Dict, Optional
+
+from util.latency import LatencyTracker
+
+SPIN_THRESHOLD = 0.001  # 마감 직전 바쁜 대기로 전환하는 남은 시간 (초)
+
+
+class FrameScheduler:
+    """다음 프레임 마감 시각까지 정밀하게 잠드는 프레임 페이서
+
+    남은 시간 대부분은 sleep으로 보내고 마지막 SPIN_THRESHOLD 구간만 바쁜 대기를 하므로
+    포즈 추론 스레드와 CPU 코어를 다투지 않습니다. vsync를 사용하면 display.flip()이
+    화면 주사율에 맞춰 대기하므로 스케줄러는 잠들지 않고 통계만 기록합니다.
+    """
+    def __init__(self, fps: float, vsync: bool = False, spin_threshold: float = SPIN_THRESHOLD,
+                 clock: Optional[Callable[[], float]] = None,
+                 sleep: Optional[Callable[[float], None]] = None):
+        """스케줄러 초기화
+
+        Args:
+            fps: 목표 프레임 속도.
+            vsync: 화면 동기화 사용 여부 (True면 flip이 대기를 담당).
+            spin_threshold: 바쁜 대기로 전환하는 남은 시간 (초).
+            clock: 시간 함수 (기본: time.perf_counter).
+            sleep: 대기 함수 (기본: time.sleep).
+        """
+        self.frame_time = 1 / fps
+        self.vsync = vsync
+        self.spin_threshold = spin_threshold
+        self.clock = clock or time.perf_counter
+        self.sleep = sleep or time.sleep
+        self.stats = LatencyTracker()
+        self.frames = 0
+        self.missed_deadlines = 0
+        self.last_frame_start = None
+        self.next_deadline = None
+
+    def wait(self) -> float:
+        """다음 프레임 시작 시각까지 대기하고 직전 프레임부터의 경과 시간(초) 반환"""
+        now = self.clock()
+        if self.last_frame_start is None:
+            self.last_frame_start = now
+            self.next_deadline = now + self.frame_time
+            return 0.0
+
+        if not self.vsync:
+            remaining = self.next_deadline - now
+            if remaining > self.spin_threshold:
+                self.sleep(remaining - self.spin_threshold)
+            while self.clock() < self.next_deadline:
+                pass
+            now = self.clock()
+            self.stats.record('lateness', now - self.next_deadline)  # 마감 대비 지연
+
+        # 한 프레임 이상 늦으면 마감 실패로 집계하고, 밀린 프레임을 몰아서 그리지 않도록 기준 시각 재설정
+        if now - self.next_deadline > self.frame_time:
+            self.missed_deadlines += 1
+            self.next_deadline = now
+        self.next_deadline += self.frame_time
+
+        dt = now - self.last_frame_start
+        self.last_frame_start = now
+        self.frames += 1
+        self.stats.record('frame', dt)
+        return dt
+
+    def summary(self) -> Dict[str, float]:
+        """프레임 시간 통계와 마감 실패 비율"""
+        frame_stats = self.stats.percentiles('frame')
+        return {
+            'frames': self.frames,
+            'missed_deadlines': self.missed_deadlines,
+            'missed_ratio': self.missed_deadlines / self.frames if self.frames else 0.0,
+            'frame_p50_ms': frame_stats.get('p50', 0.0),
+            'frame_p99_ms': frame_stats.get('p99', 0.0),
+            'frame_max_ms': frame_stats.get('max', 0.0),
+        }
+
+    def format_summary(self) -> str:
+        """사람이 읽기 쉬운 형태의 통계 문자열"""
+        summary = self.summary()
+        return (f"프레임 {summary['frames']}개, 마감 실패 {summary['missed_deadlines']}회 "
+                f"({summary['missed_ratio'] * 100:.1f}%)\n{self.stats.format_summary()}")
@@ -47,9 +47,12 @@ public partial class PoseDataReceiver : Node
             while (webSocket.GetAvailablePacketCount() > 0)
             {
                 var packet = webSocket.GetPacket();
+                var receiveTime = Time.GetUnixTimeFromSystem();
                 var message = packet.GetStringFromUtf8();
                 GD.Print($"[PoseDataReceiver] WebSocket 메시지 수신: {message.Length} 문자");
-                ProcessWebSocketMessage(message);
+                // 파싱에 성공한 패킷만 그 패킷의 send_id로 에코
+                if (ProcessWebSocketMessage(message))
+                    SendLatencyEcho(currentPoseData, receiveTime);
             }
         }
         else if (state == WebSocketPeer.State.Closed)
@@ -86,7 +89,7 @@ public partial class PoseDataReceiver : Node
         }
     }
     
-    private void ProcessWebSocketMessage(string message)
+    private bool ProcessWebSocketMessage(string message)
     {
         try
         {
@@ -100,7 +103,7 @@ public partial class PoseDataReceiver : Node
             {
                 GD.Print("[PoseDataReceiver] JSON 파싱 실패: ", parseResult);
                 GD.Print("[PoseDataReceiver] 실패한 메시지: ", message);
-                return;
+                return false;
             }
             
             var poseData = json.Data;
@@ -178,6 +181,7 @@ public partial class PoseDataReceiver : Node
                 {
                     GD.Print($"[PoseDataReceiver] Signals.onPoseDataReceived 호출 중 오류: {e}");
                 }
+                return true;
             }
             else
             {
@@ -190,6 +194,24 @@ public partial class PoseDataReceiver : Node
             GD.Print("[PoseDataReceiver] WebSocket 메시지 처리 오류: ", e);
             GD.Print("[PoseDataReceiver] 오류 발생한 메시지: ", message);
         }
+        return false;
+    }
+
+    private void SendLatencyEcho(Dictionary packet, double receiveTime)
+    {
+        // 서버의 단계별 지연 시간 통계를 위해 수신/적용 시각 보고 (send_id로 해당 전송과 매칭)
+        if (!packet.ContainsKey("send_id") || packet["send_id"].VariantType == Variant.Type.Nil)
+            return;
+
+        var echo = new Dictionary
+        {
+            { "type", "latency_echo" },
+            { "seq", packet.ContainsKey("seq") ? packet["seq"] : new Variant() },
+            { "send_id", packet["send_id"] },
+            { "receive", receiveTime },
+            { "apply", Time.GetUnixTimeFromSystem() }
+        };
+        webSocket.SendText(Json.Stringify(echo));
     }
 
     public Dictionary GetCurrentPoseData()
@@ -14,10 +14,15 @@ import cv2
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, FULLSCREEN
 
 from util.debug import timer_decorator
+from util.latency import LatencyTracker
+from util.text_cache import TextCache
+
+SENT_TIMING_HISTORY = 256  # 에코 메시지와 매칭하기 위해 보관할 최근 전송 타이밍 수
 
 class WebSocketServer:
-    def __init__(self, camera, host='localhost', port=8080):
+    def __init__(self, camera, host='localhost', port=8080, pose_interval=0.03):
         self.camera = camera
+        self.pose_interval = pose_interval  # 포즈 브로드캐스트 주기 (초)
         self.host = host
         self.port = port
         self.server_socket = None
@@ -25,8 +30,14 @@ class WebSocketServer:
         self.running = False
         self.connected = False
         self.latest_pose = []
+        self.latest_timing = None
         self.last_request_time = 0
         self.last_response_time_ms = 0
+        self.clients_lock = threading.Lock()
+        self.latency = LatencyTracker()  # 단계별 지연 시간 통계
+        self.sent_timings = {}  # send_id -> 전송 시 타이밍 (에코 매칭용)
+        self.send_id = 0  # 브로드캐스트마다 증가 (같은 seq를 다시 보내도 에코를 구분)
+        self.last_traced_seq = None
         self.pose_loop_thread = threading.Thread(target=self.pose_loop, daemon=True)
         self.pose_loop_thread.start()
 
@@ -36,12 +47,13 @@ class WebSocketServer:
             if self.camera:
                 try:
                     self.latest_pose = self.camera.get_full_pose_data()
+                    self.latest_timing = self.camera.get_latest_timing() if hasattr(self.camera, 'get_latest_timing') else None
                     # 연결된 클라이언트들에게 데이터 전송
                     if self.clients:
                         self.broadcast_pose_data()
                 except Exception as e:
                     print("[Pose Loop Error]", e)
-            time.sleep(0.03)  # ~30 FPS
+            time.sleep(self.pose_interval)  # 기본 ~30 FPS
 
     @timer_decorator
     def broadcast_pose_data(self):
@@ -85,25 +97,35 @@ class WebSocketServer:
                 
                 processed_players.append(processed_player)
             
-            data = {
-                'timestamp': time.time(),
-                'players': processed_players
-            }
-            message = json.dumps(data)
+            # 캡처/추론 타이밍에 인코딩/전송 시각 추가
+            timing = dict(self.latest_timing) if self.latest_timing else {}
+            timing['encode'] = time.time()
+            players_json = json.dumps(processed_players)
+            timing['send'] = time.time()
+            seq = timing.pop('seq', None)
+            self.send_id += 1
+
+            # 무거운 players 인코딩 후 send 시각을 포함해 메시지 조립
+            message = (
+                f'{{"timestamp": {timing["send"]}, "seq": {json.dumps(seq)}, "send_id": {self.send_id}, '
+                f'"timing": {json.dumps(timing)}, "players": {players_json}}}'
+            )
             frame = self.create_websocket_frame(message)
-            
+            self.trace_sent_timing(seq, self.send_id, timing)
+
             # 연결이 끊어진 클라이언트 제거
             disconnected_clients = []
-            for client in self.clients:
+            with self.clients_lock:
+                clients = list(self.clients)
+            for client in clients:
                 try:
-                    client.send(frame)
+                    client.sendall(frame)
                 except:
                     disconnected_clients.append(client)
             
             # 끊어진 클라이언트 제거
             for client in disconnected_clients:
-                self.clients.remove(client)
-                client.close()
+                self.remove_client(client)
             
             self.connected = len(self.clients) > 0
             if self.connected:
@@ -112,6 +134,119 @@ class WebSocketServer:
         except Exception as e:
             print(f"브로드캐스트 오류: {e}")
 
+    def trace_sent_timing(self, seq, send_id, timing):
+        """전송 타이밍 기록 (서버 측 단계 통계 + 에코 매칭용 보관)
+
+        같은 seq의 포즈도 pose_interval마다 다시 전송되므로 에코는 브로드캐스트마다 다른 send_id로 매칭한다.
+        """
+        self.latency.record_span('encode', timing, 'encode', 'send')
+        if seq is None:
+            return
+        # 같은 포즈가 여러 번 브로드캐스트되어도 캡처 기준 단계는 한 번만 기록
+        if seq != self.last_traced_seq:
+            self.last_traced_seq = seq
+            self.latency.record_span('result_pickup', timing, 'inference_end', 'encode')
+            self.latency.record_span('capture_to_send', timing, 'capture', 'send')
+        self.sent_timings[send_id] = timing
+        if len(self.sent_timings) > SENT_TIMING_HISTORY:
+            self.sent_timings.pop(next(iter(self.sent_timings)))
+
+    def handle_latency_echo(self, message):
+        """클라이언트 에코 메시지 처리
+
+        클라이언트는 {"type": "latency_echo", "seq": ..., "send_id": ..., "receive": ..., "apply": ...}
+        형식으로 받은 메시지의 send_id와 수신/적용 시각(초, Unix epoch)을 보고한다. 서버와 같은 시계를
+        사용한다고 가정하므로 다른 기기라면 시간 동기화(NTP)가 필요하다.
+        send_id가 없거나 보관 기간이 지난 에코는 전송 시각을 알 수 없으므로 기록하지 않는다.
+        """
+        sent = self.sent_timings.get(message.get('send_id'))
+        if sent is None:
+            return
+        timing = dict(sent)
+        for key in ('receive', 'apply'):
+            if isinstance(message.get(key), (int, float)):
+                timing[key] = float(message[key])
+        self.latency.record_span('network', timing, 'send', 'receive')
+        self.latency.record_span('client_apply', timing, 'receive', 'apply')
+        self.latency.record_span('total', timing, 'capture', 'apply')
+        if 'capture' in timing and 'apply' in timing:
+            self.last_response_time_ms = int((timing['apply'] - timing['capture']) * 1000)
+
+    def read_websocket_frame(self, client_socket):
+        """클라이언트 WebSocket 프레임 하나를 읽어 (opcode, payload) 반환
+
+        프레임 첫 바이트를 받기 전의 타임아웃만 socket.timeout으로 전달합니다. 프레임 일부를 받은 뒤에는
+        나머지가 올 때까지 계속 기다려, 다음 읽기가 페이로드 중간을 헤더로 해석하지 않도록 합니다.
+        """
+        received = 0  # 이 프레임에서 지금까지 받은 바이트 수
+
+        def recv_exact(size):
+            nonlocal received
+            data = b''
+            while len(data) < size:
+                try:
+                    chunk = client_socket.recv(size - len(data))
+                except socket.timeout:
+                    if received == 0:
+                        raise  # 프레임 경계: 호출자가 재시도
+                    if not self.running:
+                        raise ConnectionError("서버 종료")
+                    continue
+                if not chunk:
+                    raise ConnectionError("클라이언트 연결 종료")
+                data += chunk
+                received += len(chunk)
+            return data
+
+        first, second = recv_exact(2)
+        opcode = first & 0x0F
+        masked = second & 0x80
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack('>H', recv_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack('>Q', recv_exact(8))[0]
+        mask = recv_exact(4) if masked else None
+        payload = recv_exact(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return opcode, payload
+
+    def client_reader_loop(self, client_socket):
+        """클라이언트 메시지 수신 루프 (에코/종료 처리)"""
+        while self.running and client_socket in self.clients:
+            try:
+                opcode, payload = self.read_websocket_frame(client_socket)
+            except socket.timeout:
+                continue
+            except Exception:
+                break
+
+            if opcode == 0x8:  # close
+                break
+            if opcode != 0x1:  # 텍스트 프레임만 처리
+                continue
+            try:
+                message = json.loads(payload.decode('utf-8'))
+                if isinstance(message, dict) and message.get('type') == 'latency_echo':
+                    self.handle_latency_echo(message)
+            except Exception as e:
+                print(f"클라이언트 메시지 처리 오류: {e}")
+
+        self.remove_client(client_socket)
+
+    def remove_client(self, client_socket):
+        """클라이언트 제거 및 소켓 종료"""
+        with self.clients_lock:
+            if client_socket not in self.clients:
+                return
+            self.clients.remove(client_socket)
+            self.connected = len(self.clients) > 0
+        try:
+            client_socket.close()
+        except:
+            pass
+
     @timer_decorator
     def create_websocket_frame(self, message):
         """WebSocket 프레임 생성"""
@@ -217,8 +352,11 @@ class WebSocketServer:
                         print(f"클라이언트로부터 {len(request)} 바이트 수신")
                         
                         if self.handle_websocket_handshake(client_socket, request):
-                            self.clients.append(client_socket)
+                            with self.clients_lock:
+                                self.clients.append(client_socket)
                             self.connected = True
+                            threading.Thread(target=self.client_reader_loop, args=(client_socket,),
+                                             daemon=True).start()
                             print(f"WebSocket 연결 성공: {address}")
                         else:
                             print(f"WebSocket 핸드셰이크 실패: {address}")
@@ -248,12 +386,14 @@ class WebSocketServer:
         self.running = False
         
         # 모든 클라이언트 연결 종료
-        for client in self.clients:
+        with self.clients_lock:
+            clients = list(self.clients)
+            self.clients.clear()
+        for client in clients:
             try:
                 client.close()
             except:
                 pass
-        self.clients.clear()
         
         # 서버 소켓 종료
         if self.server_socket:
@@ -711,6 +851,9 @@ class GodotServerGUI:
         if self.pose_server:
             self.pose_server.stop_server()
             self.server_running = False
+            latency_summary = self.pose_server.latency.format_summary()
+            if latency_summary:
+                self.log_message(f"지연 시간 통계:\n{latency_summary}")
             self.status_var.set("중지됨")
             self.connection_var.set("연결 없음")
             self.url_var.set("")
@@ -801,6 +944,7 @@ class GodotServerGUI:
                         # 폰트를 찾을 수 없으면 기본 폰트 사용
                         font = pygame.font.Font(None, 24)
                         print("한글 폰트를 찾을 수 없어 기본 폰트를 사용합니다.")
+            text_cache = TextCache()  # 설정 값이 바뀔 때만 안내 문구를 다시 렌더링
             
             while running:
                 for event in pygame.event.get():
@@ -877,7 +1021,7 @@ class GodotServerGUI:
                     ]
                     
                     for i, text in enumerate(info_text):
-                        text_surface = font.render(text, True, (255, 255, 255), (0, 0, 0))
+                        text_surface = text_cache.render(font, text, (255, 255, 255), (0, 0, 0))
                         screen.blit(text_surface, (10, 10 + i * 25))
                     
                     pygame.display.flip()
@@ -1,6 +1,9 @@
+import argparse
 import pygame
 import tkinter as tk
 from camera.camera import Camera
+from camera.synthetic import SyntheticCamera
+from camera.pose_recording import PoseReplayCamera
 from game.game import Game
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, FULLSCREEN
 from godot_server_gui import GodotServerGUI
@@ -85,14 +88,38 @@ def show_mode_selection():
     return selected_mode
 
 
-def run_pygame_mode():
-    """Pygame 모드 실행"""
+def run_pygame_mode(bots: int = 0, bot_mode: str = 'chase', record_path: str = None,
+                    replay_path: str = None, replay_speed: float = 1.0,
+                    video_path: str = None, record_video_dir: str = None, num_balls: int = 1):
+    """Pygame 모드 실행
+
+    bots > 0 이면 카메라 대신 가상 플레이어, replay_path가 있으면 녹화된 포즈를 사용.
+    video_path가 있으면 카메라 대신 녹화된 영상 파일을 입력으로 사용.
+    record_path / record_video_dir가 있으면 포즈 결과 / 원본 영상을 녹화.
+    num_balls > 1 이면 여러 개의 공으로 진행하는 멀티볼 모드.
+    """
     print("Pygame 모드를 시작합니다.")
-    print("시작하기 전에 카메라를 선택하세요.\n")
 
     try:
-        # 카메라 초기화 (자동으로 선택 메뉴 표시)
-        camera = Camera()
+        if replay_path:
+            print(f"포즈 녹화 재생: {replay_path} (x{replay_speed if replay_speed else '최대'})\n")
+            camera = PoseReplayCamera(replay_path, speed=replay_speed, loop=True)
+        elif bots > 0:
+            print(f"가상 플레이어 {bots}명으로 실행합니다 ({bot_mode}).\n")
+            camera = SyntheticCamera(num_players=bots, mode=bot_mode)
+        else:
+            if video_path:
+                print(f"영상 파일을 입력으로 사용합니다: {video_path}\n")
+            else:
+                print("시작하기 전에 카메라를 선택하세요.\n")
+            # 카메라 초기화 (영상 파일이 없으면 자동으로 선택 메뉴 표시)
+            camera = Camera(camera_index=video_path)
+            if record_path:
+                camera.start_recording(record_path)
+                print(f"포즈 녹화 시작: {record_path}")
+            if record_video_dir:
+                camera.start_video_recording(record_video_dir)
+                print(f"영상 녹화 시작: {record_video_dir}")
 
         # Pygame 초기화
         pygame.init()
@@ -117,7 +144,10 @@ def run_pygame_mode():
         print("================")
 
         # 수정된 부분: camera와 homography 모두 전달
-        game = Game(camera, homography)
+        game = Game(camera, homography, num_balls)
+        if isinstance(camera, SyntheticCamera):
+            # 'chase' 모드용 공 위치 (멀티볼은 골 라인에 가장 가까운 공)
+            camera.ball_provider = game.physics.lead_ball if num_balls > 1 else lambda: game.physics.ball_pos
         game.main()
 
     except RuntimeError as e:
@@ -156,5 +186,19 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Boulder Ping Pong")
+    parser.add_argument('--bots', type=int, default=0, help="카메라 대신 사용할 가상 플레이어 수")
+    parser.add_argument('--bot-mode', choices=['chase', 'random_walk'], default='chase',
+                        help="가상 플레이어 움직임 방식")
+    parser.add_argument('--record', help="포즈 결과를 녹화할 파일 경로")
+    parser.add_argument('--replay', help="재생할 포즈 녹화 파일 경로")
+    parser.add_argument('--replay-speed', type=float, default=1.0, help="재생 배속 (0 = 최대 속도)")
+    parser.add_argument('--video', help="카메라 대신 입력으로 사용할 영상 파일 경로")
+    parser.add_argument('--record-video', help="원본 카메라 영상을 녹화할 디렉토리")
+    parser.add_argument('--balls', type=int, default=1, help="동시에 사용할 공 개수 (2 이상이면 멀티볼 모드)")
+    args = parser.parse_args()
+    if (args.record or args.record_video) and (args.bots > 0 or args.replay):
+        parser.error("--record/--record-video는 실제 카메라 입력에서만 사용할 수 있습니다 (--bots/--replay와 함께 사용 불가)")
     # main()
-    run_pygame_mode()
\ No newline at end of file
+    run_pygame_mode(args.bots, args.bot_mode, args.record, args.replay, args.replay_speed or None,
+                    args.video, args.record_video, args.balls)
\ No newline at end of file
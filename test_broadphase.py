@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+공간 해시 브로드 페이즈 테스트
+빈 히트박스 슬롯(NaN)이 섞여 있어도 공간 해시 결과가 전체 쌍 검사와 같은지 확인합니다.
+
+실행:
+    python -m pytest test_broadphase.py
+"""
+
+import numpy as np
+
+from game.multiball import MultiBallPhysics
+from game.physics import SpatialHash
+
+PHYSICS_DT = 1 / 120
+
+
+def random_hitboxes(rng, count, nan_ratio):
+    """직전/현재 히트박스 위치 (nan_ratio 비율의 슬롯은 NaN)"""
+    prev = rng.random((count, 2))
+    current = prev + rng.normal(0.0, 0.02, prev.shape)
+    empty = rng.random(count) < nan_ratio
+    prev[empty] = np.nan
+    current[empty] = np.nan
+    return prev, current
+
+
+def find_hits(physics, prev, current, broadphase):
+    physics.broadphase = broadphase
+    return physics._find_player_hits(prev, current, PHYSICS_DT)
+
+
+def test_broadphase_matches_brute_force_with_nan_slots():
+    """절반이 NaN인 히트박스에서 공간 해시와 전체 쌍 결과가 같아야 함"""
+    for seed in range(50):
+        rng = np.random.default_rng(seed)
+        prev, current = random_hitboxes(rng, 24, 0.5)
+        physics = MultiBallPhysics(300, seed=seed, audio=False)
+        physics.ball_pos[:] = rng.random((300, 2))
+        physics.ball_vel[:] = rng.normal(0.0, 0.5, (300, 2))
+        brute = find_hits(physics, prev, current, broadphase=False)
+        hashed = find_hits(physics, prev, current, broadphase=True)
+        assert np.array_equal(brute, hashed), f"seed {seed}"
+        assert np.isfinite(brute).any(), f"seed {seed}: 충돌이 하나도 없어 비교 의미 없음"
+
+
+def test_broadphase_all_slots_empty():
+    """모든 슬롯이 NaN이면 충돌 없음"""
+    physics = MultiBallPhysics(50, seed=0, audio=False)
+    empty = np.full((8, 2), np.nan)
+    assert np.isinf(find_hits(physics, empty, empty, broadphase=True)).all()
+
+
+def test_spatial_hash_skips_non_finite_points_and_queries():
+    """NaN 점은 후보가 되지 않고, NaN 질의는 후보를 만들지 않음"""
+    spatial_hash = SpatialHash(0.1)
+    spatial_hash.build(np.array([[0.5, 0.5], [np.nan, np.nan], [0.52, 0.5]]))
+    query_index, point_index = spatial_hash.query_pairs(np.array([[0.5, 0.5], [np.nan, 0.5]]))
+    assert set(zip(query_index.tolist(), point_index.tolist())) == {(0, 0), (0, 2)}
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+헤드리스 시뮬레이션 결정성 테스트
+같은 시드로 두 번 실행한 결과 요약값(digest)이 같고, 히트박스 전용 가상 카메라가
+전체 랜드마크 모드와 같은 위치를 내는지 확인합니다.
+
+실행:
+    python -m pytest test_headless.py
+"""
+
+import numpy as np
+import pytest
+
+from camera.synthetic import SyntheticCamera
+from game.headless import run_headless
+from util.clock import VirtualClock
+
+
+@pytest.mark.parametrize('bot_mode, num_balls', [('chase', 1), ('random_walk', 1), ('chase', 3)])
+def test_same_seed_gives_same_digest(bot_mode, num_balls):
+    """같은 시드의 짧은 시뮬레이션은 항상 같은 결과"""
+    first = run_headless(5, bots=2, bot_mode=bot_mode, seed=1, num_balls=num_balls)
+    second = run_headless(5, bots=2, bot_mode=bot_mode, seed=1, num_balls=num_balls)
+    assert first['digest'] == second['digest']
+    assert first['score'] == second['score'] and first['hits'] == second['hits']
+
+
+def test_hitboxes_only_matches_full_landmarks():
+    """hitboxes_only 모드의 히트박스가 전체 랜드마크 모드와 같음"""
+    ball = lambda: np.array([0.3, 0.6])
+    cameras = []
+    for hitboxes_only in (False, True):
+        clock = VirtualClock()
+        camera = SyntheticCamera(num_players=2, mode='chase', seed=3, clock=clock,
+                                 ball_provider=ball, hitboxes_only=hitboxes_only)
+        camera.start_processing()
+        cameras.append((clock, camera))
+    for _ in range(90):
+        positions = []
+        for clock, camera in cameras:
+            clock.advance(1 / 30)
+            positions.append(camera.get_hitbox_positions())
+        assert np.array_equal(positions[0], positions[1])
+    assert np.array_equal(cameras[0][1].landmarks, cameras[1][1].landmarks)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+멀티볼 골 이벤트 테스트
+goal_scored가 새 골이 난 스텝에서만 True이고, 공이 재등장을 기다리는 동안에는 꺼져 있는지 확인합니다.
+
+실행:
+    python -m pytest test_multiball.py
+"""
+
+import numpy as np
+
+from game.multiball import MultiBallPhysics
+
+PHYSICS_DT = 1 / 120
+
+
+def test_goal_scored_only_on_goal_steps():
+    """골 이벤트 스텝 수가 골이 난 스텝 수와 같고, 재등장 대기 중에는 False"""
+    physics = MultiBallPhysics(3, seed=1, audio=False)
+    no_players = np.empty((0, 2))
+    goal_steps = waiting_steps = 0
+    for _ in range(20 * 120):
+        score = sum(physics.score)
+        physics.update(no_players, PHYSICS_DT)
+        new_goal = sum(physics.score) > score
+        assert physics.goal_scored == new_goal
+        goal_steps += new_goal
+        waiting_steps += bool(np.isfinite(physics.respawn_time).any()) and not new_goal
+    assert goal_steps > 0 and waiting_steps > 0
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+포즈 기록 보간 테스트
+최신 샘플 시각 이후 조회에서 직전 샘플에 없던 값(NaN)이 최신 값 그대로 유지되는지 확인합니다.
+
+실행:
+    python -m pytest test_pose_history.py
+"""
+
+import numpy as np
+
+from camera.pose_history import PoseHistory
+
+
+def history_with_new_landmark():
+    """두 번째 값이 최신 샘플에서 처음 나타난 기록"""
+    history = PoseHistory(8, shape=(2,))
+    history.append(0.0, np.array([0.1, np.nan]))
+    history.append(0.1, np.array([0.2, 0.5]))
+    return history
+
+
+def test_value_at_newest_sample_keeps_new_values():
+    """최신 샘플 시각에서는 직전 샘플이 NaN이어도 최신 값을 반환"""
+    value = history_with_new_landmark().value_at(0.1, max_extrapolation=0.05)
+    assert np.allclose(value, [0.2, 0.5])
+
+
+def test_extrapolation_holds_values_without_rate():
+    """외삽 시 속도가 없는 값은 최신 값 유지, 나머지는 직선 외삽"""
+    history = history_with_new_landmark()
+    assert np.allclose(history.value_at(0.12, max_extrapolation=0.05), [0.22, 0.5])
+    assert np.allclose(history.value_at(0.2, max_extrapolation=0.0), [0.2, 0.5])
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+포즈 녹화 테스트
+이어 붙인 세션의 캡처 시각이 float32 오프셋으로 뭉개지지 않는지,
+다른 카메라 설정으로 이어 붙이기를 거부하는지 확인합니다.
+
+실행:
+    python -m pytest test_pose_recording.py
+"""
+
+import numpy as np
+import pytest
+
+from camera.landmarks import array_to_result
+from camera.pose_recording import PoseRecorder, PoseRecording
+
+WEEK = 7 * 24 * 3600.0
+
+
+def record_session(path, delay=0.0, frames=30, fps=30.0, width=640, height=480):
+    """녹화 시작 시각 + delay부터 fps 간격으로 frames개의 포즈를 녹화하고 캡처 시각 반환"""
+    recorder = PoseRecorder(path, width, height)
+    recorder.start()
+    times = recorder.header.start_time + delay + np.arange(frames) / fps
+    for i, capture_time in enumerate(times):
+        poses = np.full((2, 33, 5), np.nan, np.float32)
+        poses[0] = i / frames
+        recorder.submit(float(capture_time), array_to_result(poses))
+    recorder.stop()
+    return times
+
+
+def test_appended_session_keeps_frame_timestamps(tmp_path):
+    """일주일 뒤에 이어 붙인 세션도 프레임마다 정확한 캡처 시각을 가짐"""
+    path = str(tmp_path / 'session.bppr')
+    first = record_session(path)
+    second = record_session(path, WEEK)
+
+    recording = PoseRecording(path)
+    assert len(recording) == 60
+    assert np.allclose(recording.timestamps, np.concatenate([first, second]), rtol=0, atol=1e-4)
+    assert len(np.unique(recording.timestamps[30:])) == 30
+    assert np.allclose(recording.poses(31)[0, 0, 0], 1 / 30)
+    assert list(recording.session_starts) == [0, 30]
+
+
+def test_long_session_rebases_time(tmp_path):
+    """한 세션이 길어져도 오프셋이 커지지 않아 정밀도 유지"""
+    path = str(tmp_path / 'long.bppr')
+    recorder = PoseRecorder(path, 640, 480)
+    start = recorder.header.start_time
+    times = start + np.concatenate([np.arange(30) / 30, 3 * 24 * 3600.0 + np.arange(30) / 30])
+    recorder.start()
+    for capture_time in times:
+        recorder.submit(float(capture_time), None)
+    recorder.stop()
+    assert np.allclose(PoseRecording(path).timestamps, times, rtol=0, atol=1e-4)
+
+
+def test_append_with_other_camera_geometry_is_rejected(tmp_path):
+    """카메라 크기가 다른 세션은 이어 붙일 수 없음"""
+    path = str(tmp_path / 'session.bppr')
+    record_session(path)
+    with pytest.raises(ValueError):
+        PoseRecorder(path, 1280, 720)
+    with pytest.raises(ValueError):
+        PoseRecorder(path, 640, 480, margin_x=0.1)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+프로젝터 키스톤 보정 테스트
+키스톤 호모그래피가 화면 모서리를 지정한 위치로 옮기고, 조회표 보정이 알려진 사각형을
+cv2.warpPerspective와 같은 위치로 왜곡하는지 확인합니다.
+
+실행:
+    python -m pytest test_projector_warp.py
+"""
+
+import cv2
+import numpy as np
+
+from game.projector_warp import ProjectorWarp, keystone_homography
+
+SIZE = (320, 240)
+CORNERS = ((0.1, 0.05), (0.95, 0.02), (0.85, 0.95), (0.03, 0.9))  # 좌상, 우상, 우하, 좌하
+
+
+def quad_mask(corners, size):
+    """출력 크기 (높이, 너비)에서 corners 비율 사각형 내부를 채운 마스크"""
+    width, height = size
+    points = np.round(np.float32(corners) * [width, height]).astype(np.int32)
+    mask = np.zeros((height, width), np.uint8)
+    cv2.fillConvexPoly(mask, points, 255)
+    return mask
+
+
+def test_keystone_homography_maps_screen_corners():
+    """화면 네 모서리가 지정한 출력 위치로 옮겨짐"""
+    width, height = SIZE
+    homography = keystone_homography(CORNERS, SIZE)
+    screen_corners = np.float32([[(0, 0), (width, 0), (width, height), (0, height)]])
+    mapped = cv2.perspectiveTransform(screen_corners, homography)[0]
+    assert np.allclose(mapped, np.float32(CORNERS) * [width, height], atol=1e-3)
+
+
+def test_identity_keystone_keeps_frame():
+    """기본 모서리(보정 없음)는 프레임을 그대로 출력"""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (SIZE[1], SIZE[0], 4), dtype=np.uint8)
+    warp = ProjectorWarp(keystone_homography(((0, 0), (1, 0), (1, 1), (0, 1)), SIZE), SIZE)
+    assert np.array_equal(warp.apply(frame), frame)
+
+
+def test_warp_moves_white_frame_onto_known_quad():
+    """흰 화면 전체가 모서리 사각형으로 왜곡되고 바깥은 검정"""
+    frame = np.full((SIZE[1], SIZE[0], 4), 255, np.uint8)
+    warped = ProjectorWarp(keystone_homography(CORNERS, SIZE), SIZE).apply(frame)[..., 0]
+    inside = cv2.erode(quad_mask(CORNERS, SIZE), np.ones((5, 5), np.uint8)) > 0
+    outside = cv2.dilate(quad_mask(CORNERS, SIZE), np.ones((5, 5), np.uint8)) == 0
+    assert (warped[inside] == 255).all()
+    assert (warped[outside] == 0).all()
+
+
+def test_scaled_canvas_matches_warp_perspective():
+    """축소 캔버스를 확대와 보정을 한 번에 한 결과가 원본 크기 warpPerspective와 같은 사각형"""
+    width, height = SIZE
+    source = np.zeros((height, width, 4), np.uint8)
+    cv2.rectangle(source, (80, 60), (240, 180), (255, 255, 255, 255), -1)
+    homography = keystone_homography(CORNERS, SIZE)
+    expected = cv2.warpPerspective(source, homography, SIZE, flags=cv2.INTER_NEAREST)
+
+    canvas = cv2.resize(source, (width // 2, height // 2), interpolation=cv2.INTER_NEAREST)
+    warped = ProjectorWarp(homography, SIZE, source_size=(width // 2, height // 2),
+                           interpolation=cv2.INTER_NEAREST).apply(canvas)
+    assert np.mean(warped[..., 0] != expected[..., 0]) < 0.01
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+브로드 페이즈 벤치마크 스크립트
+MultiBallPhysics의 공-플레이어 충돌 검사를 전체 쌍 방식과 공간 해시 방식으로 각각 실행해
+공 개수와 플레이어 수에 따른 스텝당 비용을 비교합니다. 두 방식의 충돌 결과가 같은지도 확인합니다.
+
+사용 예:
+    python -m tools.broadphase_benchmark --balls 10 100 500 --players 2 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from camera.synthetic import SyntheticCamera
+from game.multiball import MultiBallPhysics
+
+PHYSICS_DT = 1 / 120
+
+
+def player_points(num_players, steps, seed):
+    """가상 플레이어의 추적 랜드마크 위치를 스텝별로 생성"""
+    now = [0.0]
+    camera = SyntheticCamera(num_players=num_players, mode='random_walk', seed=seed, clock=lambda: now[0])
+    camera.start_processing()
+    frames = []
+    for _ in range(steps + 1):
+        now[0] += PHYSICS_DT
+        frames.append(np.asarray(camera.get_player_positions(), dtype=float).reshape(-1, 2))
+    return frames
+
+
+def time_hits(physics, frames, broadphase):
+    """충돌 검사만 반복 실행해 스텝당 평균 시간(초)과 스텝별 결과 반환"""
+    physics.broadphase = broadphase
+    results = []
+    start = time.perf_counter()
+    for prev, current in zip(frames[:-1], frames[1:]):
+        results.append(physics._find_player_hits(prev, current, PHYSICS_DT))
+    return (time.perf_counter() - start) / (len(frames) - 1), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공간 해시 브로드 페이즈 벤치마크")
+    parser.add_argument('--balls', type=int, nargs='+', default=[10, 100, 500, 1000], help="공 개수 목록")
+    parser.add_argument('--players', type=int, nargs='+', default=[2, 4, 8], help="플레이어 수 목록")
+    parser.add_argument('--steps', type=int, default=200, help="측정 스텝 수")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    print(f"{'공':>6} {'플레이어':>8} {'점':>5} {'전체 쌍(ms)':>12} {'공간 해시(ms)':>14} {'배율':>6} {'일치':>4}")
+    for num_players in args.players:
+        frames = player_points(num_players, args.steps, args.seed)
+        for num_balls in args.balls:
+            physics = MultiBallPhysics(num_balls, seed=args.seed)
+            physics.ball_pos[:] = np.random.default_rng(args.seed).random((num_balls, 2))
+            brute_time, brute = time_hits(physics, frames, broadphase=False)
+            hash_time, hashed = time_hits(physics, frames, broadphase=True)
+            same = all(np.array_equal(a, b) for a, b in zip(brute, hashed))
+            print(f"{num_balls:>6} {num_players:>8} {len(frames[0]):>5} {brute_time * 1000:>12.3f} "
+                  f"{hash_time * 1000:>14.3f} {brute_time / hash_time:>6.2f} {'예' if same else '아니오':>4}")
+
+
+if __name__ == "__main__":
+    main()
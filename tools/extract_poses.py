@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+오프라인 포즈 추출 스크립트
+녹화된 영상 파일(또는 폴더)을 프로세스 풀로 나눠 PoseProcessor로 처리하고,
+영상별로 열(column) 단위 NumPy 배열(.npz)을 저장합니다.
+
+사용 예:
+    python -m tools.extract_poses recordings/ --out poses/ --workers 8
+
+출력 배열 (영상당 하나의 .npz):
+    frame_index (F,)            int32    프레임 번호
+    time        (F,)            float64  영상 내 시각 (초)
+    pose_count  (F,)            uint8    검출된 사람 수
+    landmarks   (F, 2, 33, 5)   float32  x, y, z, visibility, presence (미검출 포즈는 NaN)
+좌표는 카메라와 같이 검색 여백(search margin)을 잘라낸 영역 기준으로 정규화되어 있으며,
+사용한 여백은 search_margin 배열에 함께 저장됩니다.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+import numpy as np
+
+from camera.config_manager import CameraConfig
+from camera.landmarks import NUM_LANDMARKS, NUM_POSES, LANDMARK_FIELDS, result_to_array
+
+VIDEO_EXTENSIONS = ('.avi', '.mp4', '.mov', '.mkv')
+DEFAULT_CHUNK_FRAMES = 300  # 작업 하나가 처리할 프레임 수
+
+# 작업 프로세스별 상태
+_config = None
+
+
+def _init_worker(config: CameraConfig) -> None:
+    """작업 프로세스 초기화"""
+    global _config
+    cv2.setNumThreads(1)  # 프로세스 수만큼 병렬화되므로 OpenCV 내부 스레드는 사용하지 않음
+    _config = config
+
+
+def _crop_search_margin(frame: np.ndarray) -> np.ndarray:
+    """Camera._process_frames와 같은 검색 여백 적용"""
+    if _config.search_margin_x <= 0 and _config.search_margin_y <= 0:
+        return frame
+    height, width = frame.shape[:2]
+    margin_x = int(width * _config.search_margin_x)
+    margin_y = int(height * _config.search_margin_y)
+    return frame[margin_y:height - margin_y, margin_x:width - margin_x]
+
+
+def _process_chunk(path: str, start: int, end: int, fps: float):
+    """영상의 [start, end) 프레임 구간을 처리해 열 배열 반환
+
+    VIDEO 모드 랜드마커는 이전 프레임의 추적 상태(ROI)를 이어 쓰므로, 청크마다 새 랜드마커를 만들어
+    결과가 같은 프로세스에서 앞서 처리한 청크(다른 영상일 수도 있음)와 무관하게 합니다.
+    """
+    from camera.pose_processor import PoseProcessor
+    processor = PoseProcessor(_config)
+    cap = cv2.VideoCapture(path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+    frame_indices, landmarks = [], []
+    try:
+        for index in range(start, end):
+            ret, frame = cap.read()
+            if not ret or frame is None or frame.size == 0:
+                break
+            timestamp_ms = int(index * 1000 / fps)
+            result = processor.process_frame(_crop_search_margin(frame), timestamp_ms)
+            frame_indices.append(index)
+            landmarks.append(result_to_array(result, NUM_POSES))
+    finally:
+        cap.release()
+        processor.close()
+
+    if landmarks:
+        landmarks = np.stack(landmarks)
+    else:
+        landmarks = np.empty((0, NUM_POSES, NUM_LANDMARKS, len(LANDMARK_FIELDS)), dtype=np.float32)
+    return path, start, np.array(frame_indices, dtype=np.int32), landmarks
+
+
+def find_videos(inputs):
+    """입력 경로(파일/폴더)에서 영상 파일 목록 수집"""
+    videos = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                videos += [os.path.join(root, f) for f in sorted(files) if f.lower().endswith(VIDEO_EXTENSIONS)]
+        elif os.path.isfile(path):
+            videos.append(path)
+        else:
+            print(f"경로를 찾을 수 없습니다: {path}")
+    return videos
+
+
+def plan_chunks(videos, chunk_frames):
+    """영상별 프레임 수/FPS를 읽어 청크 작업 목록 생성"""
+    chunks, meta = [], {}
+    for path in videos:
+        cap = cv2.VideoCapture(path)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        cap.release()
+        if frame_count <= 0:
+            print(f"프레임 수를 알 수 없어 건너뜁니다: {path}")
+            continue
+        meta[path] = {'frames': frame_count, 'fps': fps}
+        chunks += [(path, start, min(start + chunk_frames, frame_count), fps)
+                   for start in range(0, frame_count, chunk_frames)]
+    return chunks, meta
+
+
+def save_video_result(path, parts, fps, config, out_dir):
+    """청크 결과를 프레임 순서로 합쳐 .npz로 저장"""
+    parts.sort(key=lambda part: part[0])
+    frame_index = np.concatenate([part[1] for part in parts])
+    landmarks = np.concatenate([part[2] for part in parts])
+    pose_count = (~np.isnan(landmarks[:, :, 0, 0])).sum(axis=1).astype(np.uint8)
+    out_path = os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + '.npz')
+    np.savez(out_path, frame_index=frame_index, time=frame_index / fps, pose_count=pose_count,
+             landmarks=landmarks, search_margin=np.array([config.search_margin_x, config.search_margin_y]))
+    return out_path, len(frame_index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 영상에서 포즈 데이터셋 추출")
+    parser.add_argument('inputs', nargs='+', help="영상 파일 또는 폴더")
+    parser.add_argument('--out', default='poses', help="출력 디렉토리")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="작업 프로세스 수")
+    parser.add_argument('--chunk-frames', type=int, default=DEFAULT_CHUNK_FRAMES, help="작업당 프레임 수")
+    parser.add_argument('--margin-x', type=float, default=None, help="좌우 검색 여백 (기본: CameraConfig)")
+    parser.add_argument('--margin-y', type=float, default=None, help="상하 검색 여백 (기본: CameraConfig)")
+    args = parser.parse_args()
+
+    config = CameraConfig()
+    if args.margin_x is not None:
+        config.search_margin_x = args.margin_x
+    if args.margin_y is not None:
+        config.search_margin_y = args.margin_y
+
+    videos = find_videos(args.inputs)
+    chunks, meta = plan_chunks(videos, args.chunk_frames)
+    if not chunks:
+        print("처리할 영상이 없습니다.")
+        return
+    os.makedirs(args.out, exist_ok=True)
+    total_frames = sum(m['frames'] for m in meta.values())
+    print(f"영상 {len(meta)}개, {total_frames} 프레임, 작업 {len(chunks)}개, 프로세스 {args.workers}개")
+
+    results = {path: [] for path in meta}
+    remaining = {path: sum(1 for c in chunks if c[0] == path) for path in meta}
+    processed = 0
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(config,)) as pool:
+        futures = [pool.submit(_process_chunk, *chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            path, start, frame_index, landmarks = future.result()
+            results[path].append((start, frame_index, landmarks))
+            processed += len(frame_index)
+            elapsed = time.perf_counter() - start_time
+            print(f"\r{processed}/{total_frames} 프레임 ({processed / elapsed:.1f} fps)", end='', flush=True)
+
+            remaining[path] -= 1
+            if remaining[path] == 0:
+                out_path, frames = save_video_result(path, results.pop(path), meta[path]['fps'], config, args.out)
+                print(f"\n저장: {out_path} ({frames} 프레임)")
+
+    elapsed = time.perf_counter() - start_time
+    print(f"\n완료: {processed} 프레임, {elapsed:.1f}초, {processed / elapsed:.1f} fps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+WebSocket 팬아웃 부하 테스트 스크립트
+카메라 없이 루프백에서 WebSocketServer에 합성 포즈를 흘려보내고,
+N개의 동시 클라이언트(느린 클라이언트 포함)로 처리량과 전달 지연을 측정합니다.
+
+사용 예:
+    python -m tools.ws_benchmark --clients 8 --slow-clients 2 --duration 10
+"""
+
+import argparse
+import base64
+import contextlib
+import json
+import os
+import socket
+import threading
+import time
+
+from camera.synthetic import SyntheticCamera
+from godot_server_gui import WebSocketServer
+from util.latency import LatencyTracker
+
+SLOW_CLIENT_RCVBUF = 4096  # 느린 클라이언트 수신 버퍼 (역압이 빨리 서버에 전달되도록 작게)
+
+
+class BenchmarkClient(threading.Thread):
+    """WebSocket 클라이언트: 메시지를 읽고 전달 지연(send → 수신)을 기록"""
+    def __init__(self, server, port, stage, read_delay, latency, stop_event):
+        super().__init__(daemon=True)
+        self.server = server
+        self.port = port
+        self.stage = stage
+        self.read_delay = read_delay
+        self.latency = latency
+        self.stop_event = stop_event
+        self.messages = 0
+        self.bytes = 0
+        self.error = None
+
+    def connect(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if self.read_delay > 0:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SLOW_CLIENT_RCVBUF)
+        sock.connect(('127.0.0.1', self.port))
+        key = base64.b64encode(os.urandom(16)).decode()
+        sock.send((
+            'GET / HTTP/1.1\r\n'
+            f'Host: 127.0.0.1:{self.port}\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            f'Sec-WebSocket-Key: {key}\r\n'
+            'Sec-WebSocket-Version: 13\r\n'
+            '\r\n'
+        ).encode())
+        response = b''
+        while b'\r\n\r\n' not in response:
+            chunk = sock.recv(1)
+            if not chunk:
+                raise ConnectionError("핸드셰이크 중 연결 종료")
+            response += chunk
+        sock.settimeout(1.0)
+        return sock
+
+    def run(self):
+        try:
+            sock = self.connect()
+        except Exception as e:
+            self.error = e
+            return
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    opcode, payload = self.server.read_websocket_frame(sock)
+                except socket.timeout:
+                    continue
+                received = time.time()
+                if opcode == 0x8:
+                    raise ConnectionError("서버가 연결을 종료함")
+                message = json.loads(payload.decode('utf-8'))
+                self.latency.record(self.stage, received - message['timing']['send'])
+                self.messages += 1
+                self.bytes += len(payload)
+                if self.read_delay > 0:
+                    time.sleep(self.read_delay)
+        except Exception as e:
+            if not self.stop_event.is_set():  # 측정 종료 후 서버 정지로 인한 끊김은 제외
+                self.error = e
+        finally:
+            sock.close()
+
+
+def run_benchmark(num_clients, num_slow, slow_delay, duration, rate, num_players, port, verbose=False):
+    """벤치마크 실행 후 결과 딕셔너리 반환"""
+    source = SyntheticCamera(num_players=num_players, seed=0)
+    source.start_processing()
+    latency = LatencyTracker(history=100000)
+    stop_event = threading.Event()
+
+    with contextlib.ExitStack() as stack:
+        if not verbose:
+            # 서버의 디버그 출력(timer_decorator 등)이 측정을 왜곡하지 않도록 숨김
+            stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+        server = WebSocketServer(source, '127.0.0.1', port, pose_interval=1.0 / rate)
+        server.start_server_thread()
+        time.sleep(0.3)
+
+        clients = [BenchmarkClient(server, port, 'delivery_fast', 0.0, latency, stop_event)
+                   for _ in range(num_clients - num_slow)]
+        clients += [BenchmarkClient(server, port, 'delivery_slow', slow_delay, latency, stop_event)
+                    for _ in range(num_slow)]
+        for client in clients:
+            client.start()
+            time.sleep(0.01)
+
+        time.sleep(0.5)  # 연결 안정화
+        server.latency.reset()
+        latency.reset()
+        for client in clients:
+            client.messages = client.bytes = 0
+
+        start = time.perf_counter()
+        time.sleep(duration)
+        elapsed = time.perf_counter() - start
+        stop_event.set()
+        server.stop_server()
+        for client in clients:
+            client.join(timeout=2.0)
+
+    fast = [c for c in clients if c.read_delay == 0]
+    slow = [c for c in clients if c.read_delay > 0]
+    return {
+        'elapsed': elapsed,
+        'broadcasts': server.latency.percentiles('encode').get('count', 0),
+        'encode': server.latency.percentiles('encode'),
+        'fast': summarize_group(fast, latency.percentiles('delivery_fast'), elapsed),
+        'slow': summarize_group(slow, latency.percentiles('delivery_slow'), elapsed),
+    }
+
+
+def summarize_group(clients, stats, elapsed):
+    """클라이언트 그룹별 처리량 요약"""
+    messages = sum(c.messages for c in clients)
+    return {
+        'clients': len(clients),
+        'disconnected': sum(1 for c in clients if c.error is not None),
+        'msgs_per_sec': messages / elapsed if elapsed > 0 else 0.0,
+        'mb_per_sec': sum(c.bytes for c in clients) / elapsed / 1e6 if elapsed > 0 else 0.0,
+        'latency': stats,
+    }
+
+
+def print_report(result, rate):
+    print(f"=== WebSocket 팬아웃 벤치마크 ({result['elapsed']:.1f}초) ===")
+    print(f"브로드캐스트: {result['broadcasts']}회 ({result['broadcasts'] / result['elapsed']:.1f}/s, 목표 {rate}/s)")
+    encode = result['encode']
+    if encode:
+        print(f"인코딩 시간: p50={encode['p50']:.3f}ms p99={encode['p99']:.3f}ms")
+    for name in ('fast', 'slow'):
+        group = result[name]
+        if group['clients'] == 0:
+            continue
+        stats = group['latency']
+        line = (f"[{name}] 클라이언트 {group['clients']}개 (끊김 {group['disconnected']}): "
+                f"{group['msgs_per_sec']:.1f} msg/s, {group['mb_per_sec']:.2f} MB/s")
+        if stats:
+            line += f", 전달 지연 p50={stats['p50']:.2f}ms p99={stats['p99']:.2f}ms"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket 팬아웃 부하 테스트")
+    parser.add_argument('--clients', type=int, default=4, help="전체 클라이언트 수")
+    parser.add_argument('--slow-clients', type=int, default=0, help="느린 클라이언트 수 (전체에 포함)")
+    parser.add_argument('--slow-delay', type=float, default=0.2, help="느린 클라이언트의 메시지당 읽기 지연 (초)")
+    parser.add_argument('--duration', type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument('--rate', type=float, default=30.0, help="포즈 브로드캐스트 주기 (Hz)")
+    parser.add_argument('--players', type=int, default=2, help="합성 플레이어 수")
+    parser.add_argument('--port', type=int, default=8765, help="루프백 포트")
+    parser.add_argument('--verbose', action='store_true', help="서버 로그 출력")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.clients, min(args.slow_clients, args.clients), args.slow_delay,
+                           args.duration, args.rate, args.players, args.port, args.verbose)
+    print_report(result, args.rate)
+
+
+if __name__ == "__main__":
+    main()
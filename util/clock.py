@@ -0,0 +1,20 @@
+class VirtualClock:
+    """수동으로 진행하는 가상 시계
+
+    time.time 대신 clock 인자로 주입하면 실제 시간과 무관하게 시뮬레이션을 원하는 속도로 돌릴 수 있습니다.
+    """
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        """현재 가상 시각 (초)"""
+        return self.now
+
+    def advance(self, seconds: float) -> float:
+        """시각을 seconds만큼 진행하고 새 시각 반환"""
+        self.now += seconds
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """time.sleep 대체: 기다리지 않고 시각만 진행"""
+        self.advance(max(0.0, seconds))
@@ -0,0 +1,64 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+DEFAULT_HISTORY = 1000  # 단계별로 보관할 최근 샘플 수
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+class LatencyTracker:
+    """파이프라인 단계별 지연 시간을 기록하고 백분위 통계를 계산하는 클래스"""
+    def __init__(self, history: int = DEFAULT_HISTORY):
+        self.history = history
+        self.samples: Dict[str, deque] = {}
+        self.lock = threading.Lock()
+
+    def record(self, stage: str, seconds: Optional[float]) -> None:
+        """단계 지연 시간(초) 기록. None이나 음수(시계 불일치)는 무시"""
+        if seconds is None or seconds < 0:
+            return
+        with self.lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.history)
+            self.samples[stage].append(seconds)
+
+    def record_span(self, stage: str, timing: Dict[str, float], start: str, end: str) -> None:
+        """timing 딕셔너리의 두 타임스탬프 차이를 단계 지연 시간으로 기록"""
+        if start in timing and end in timing:
+            self.record(stage, timing[end] - timing[start])
+
+    def percentiles(self, stage: str, qs: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """단계별 백분위 지연 시간 (밀리초)"""
+        with self.lock:
+            values = np.array(self.samples.get(stage, ()), dtype=np.float64)
+        if values.size == 0:
+            return {}
+        result = {f"p{int(q)}": float(v) * 1000 for q, v in zip(qs, np.percentile(values, list(qs)))}
+        result['count'] = int(values.size)
+        result['max'] = float(values.max()) * 1000
+        return result
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """모든 단계의 백분위 통계"""
+        with self.lock:
+            stages = list(self.samples.keys())
+        return {stage: self.percentiles(stage) for stage in stages}
+
+    def format_summary(self) -> str:
+        """사람이 읽기 쉬운 형태의 통계 문자열"""
+        lines = []
+        for stage, stats in self.summary().items():
+            if not stats:
+                continue
+            lines.append(
+                f"{stage:>16}: p50={stats['p50']:7.2f}ms p90={stats['p90']:7.2f}ms "
+                f"p99={stats['p99']:7.2f}ms max={stats['max']:7.2f}ms (n={stats['count']})"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """기록된 샘플 초기화"""
+        with self.lock:
+            self.samples.clear()
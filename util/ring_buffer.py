@@ -0,0 +1,44 @@
+from typing import Tuple
+
+import numpy as np
+
+
+class RingBuffer:
+    """고정 크기 NumPy 링 버퍼
+
+    저장 공간을 두 배로 잡고 각 항목을 두 위치에 함께 기록(미러링)하므로, 가장 오래된 항목부터
+    최신 항목까지의 순서가 항상 연속된 메모리 구간이 되어 view()가 복사 없이 슬라이스를 반환합니다.
+    """
+    def __init__(self, capacity: int, item_shape: Tuple[int, ...] = (), dtype=np.float64):
+        self.capacity = capacity
+        self.data = np.zeros((2 * capacity,) + tuple(item_shape), dtype=dtype)
+        self.head = 0  # 다음에 기록할 위치
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, item) -> None:
+        """항목 추가 (가득 차면 가장 오래된 항목을 덮어씀)"""
+        self.data[self.head] = item
+        self.data[self.head + self.capacity] = item
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def view(self) -> np.ndarray:
+        """오래된 순서로 정렬된 (count, *item_shape) 읽기 전용 뷰 (복사 없음, 다음 append 전까지 유효)"""
+        start = self.head + self.capacity - self.count
+        view = self.data[start:start + self.count]
+        view.flags.writeable = False
+        return view
+
+    def latest(self) -> np.ndarray:
+        """가장 최근 항목"""
+        if self.count == 0:
+            raise IndexError("RingBuffer is empty")
+        return self.data[self.head + self.capacity - 1]
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        self.head = 0
+        self.count = 0
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+DEFAULT_CAPACITY = 64  # 보관할 최대 텍스트 서피스 수
+
+
+class TextCache:
+    """렌더링된 텍스트 서피스의 LRU 캐시
+
+    (폰트, 문자열, 색, 배경색, 안티앨리어싱)이 같으면 font.render를 다시 호출하지 않고
+    이전에 만든 서피스를 돌려줍니다. 점수처럼 가끔만 바뀌는 텍스트를 매 프레임 그릴 때 사용합니다.
+    반환된 서피스는 공유되므로 수정하면 안 됩니다.
+    """
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.surfaces: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, ...],
+               background: Optional[Tuple[int, ...]] = None, antialias: bool = True) -> pygame.Surface:
+        """font.render와 같은 인자로 텍스트 서피스 반환 (캐시에 없을 때만 새로 렌더링)"""
+        key = (font, text, tuple(color), tuple(background) if background else None, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)  # 가장 오래 사용하지 않은 항목 제거
+        return surface
+
+    def clear(self) -> None:
+        """모든 서피스 제거 (폰트를 바꾸거나 디스플레이를 다시 만들 때)"""
+        self.surfaces.clear()